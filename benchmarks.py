@@ -0,0 +1,673 @@
+"""
+Performance Benchmarks for Resume Evaluation System
+Measures per-task latency of the scoring pipeline
+
+Usage: python benchmarks.py [benchmark ...]
+"""
+
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+SAMPLE_RESUME = {
+    'raw_text': (
+        "Jane Doe\nSoftware Engineer\njane.doe@example.com\n"
+        "Summary\nBackend engineer with 4 years of experience building Python web services.\n"
+        "Experience\nSenior Software Engineer\nAcme Technologies Inc\n2020 - Present\n"
+        "Built REST APIs with Flask and PostgreSQL, deployed on AWS with Docker and Kubernetes.\n"
+        "Skills\nPython, Flask, Django, PostgreSQL, Docker, Kubernetes, AWS, Git, REST API\n"
+        "Projects\nResume Screening Tool\nMachine learning pipeline ranking resumes with scikit-learn.\n"
+    ),
+    'structured_data': {
+        'personal_info': {'name': 'Jane Doe'},
+        'summary': 'Backend engineer with 4 years of experience building Python web services.',
+        'experience': [{'title': 'Senior Software Engineer', 'company': 'Acme Technologies Inc'}],
+        'education': [{'degree': 'Bachelor of Technology', 'institution': 'State University'}],
+        'skills': ['Python', 'Flask', 'Django', 'PostgreSQL', 'Docker', 'Kubernetes', 'AWS', 'Git', 'REST API'],
+        'certifications': ['AWS Certified Developer'],
+        'projects': [{'title': 'Resume Screening Tool',
+                      'description': 'Machine learning pipeline ranking resumes with scikit-learn.'}],
+        'achievements': []
+    }
+}
+
+SAMPLE_JOB = {
+    'title': 'Backend Developer',
+    'company': 'Example Solutions Ltd',
+    'location': 'Bangalore',
+    'description': 'We are hiring a backend developer to build scalable web APIs in Python.',
+    'experience_level': 'mid',
+    'must_have_skills': ['Python', 'Flask', 'PostgreSQL', 'REST API'],
+    'good_to_have_skills': ['Docker', 'Kubernetes', 'Redis'],
+    'technical_requirements': ['python', 'flask', 'postgresql', 'docker', 'rest api', 'machine learning'],
+    'certifications': ['AWS Certified Developer'],
+    'responsibilities': ['Design and build REST APIs for the hiring platform']
+}
+
+
+def _time_calls(func: Callable, iterations: int) -> List[float]:
+    """Run func repeatedly and return the latency of each call in seconds"""
+    timings = []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> None:
+    """Print mean and median latency"""
+    ordered = sorted(timings)
+    mean = sum(ordered) / len(ordered)
+    median = ordered[len(ordered) // 2]
+    print(f"  {label:<40} mean {mean * 1000:9.1f} ms   p50 {median * 1000:9.1f} ms   (n={len(ordered)})")
+
+
+def benchmark_engine_registry(iterations: int = 5) -> None:
+    """Per-task latency with a fresh engine per task vs the shared worker engine"""
+    from sentence_transformers import SentenceTransformer
+    from config import Config
+    from relevance_engine import RelevanceEngine
+    import model_registry
+
+    print("📊 Per-task evaluation latency (model loading included)")
+
+    def fresh_engine_task():
+        # Previous behaviour: every task loaded its own model
+        engine = RelevanceEngine(sentence_model=SentenceTransformer(Config.SENTENCE_TRANSFORMER_MODEL))
+        engine.evaluate_relevance(SAMPLE_RESUME, SAMPLE_JOB)
+
+    def shared_engine_task():
+        model_registry.get_relevance_engine().evaluate_relevance(SAMPLE_RESUME, SAMPLE_JOB)
+
+    _report('before: new RelevanceEngine per task', _time_calls(fresh_engine_task, iterations))
+
+    model_registry.reset()
+    status = model_registry.warm_up()
+    _report('after: shared engine (warmed up)', _time_calls(shared_engine_task, iterations))
+    print(f"  warm-up took {status['warm_up_time']}s, process RSS {status['process_rss_mb']} MB")
+
+
+def benchmark_batch_scoring(resume_count: int = 200) -> None:
+    """Scoring many resumes one by one vs through RelevanceEngine.evaluate_many"""
+    import model_registry
+
+    engine = model_registry.get_relevance_engine()
+    resumes = [
+        dict(SAMPLE_RESUME, raw_text=f"{SAMPLE_RESUME['raw_text']}\nCandidate {index}")
+        for index in range(resume_count)
+    ]
+
+    print(f"📊 Scoring {resume_count} resumes against one job")
+    _report('one evaluate_relevance call per resume',
+            _time_calls(lambda: [engine.evaluate_relevance(resume, SAMPLE_JOB) for resume in resumes], 1))
+    _report('single evaluate_many call',
+            _time_calls(lambda: engine.evaluate_many(resumes, SAMPLE_JOB), 1))
+
+
+def benchmark_skill_matrix(iterations: int = 50) -> None:
+    """Nested fuzz.ratio loops (four passes) vs one skill similarity matrix vs skill table lookups"""
+    from fuzzywuzzy import fuzz
+    from skill_similarity import SkillSimilarityMatrix, SkillSimilarityTable, taxonomy_groups
+
+    # Realistic sizes: ~25 required skills, ~60 resume skill entries
+    required = (SAMPLE_JOB['must_have_skills'] + SAMPLE_JOB['good_to_have_skills'] +
+                SAMPLE_JOB['technical_requirements']) * 2 + ['GraphQL', 'Terraform', 'Kafka', 'Spark']
+    must_have = required[:8]
+    resume_skills = [f"{skill} {index}" for index, skill in enumerate(
+        SAMPLE_RESUME['structured_data']['skills'] * 6 + ['Communication', 'Leadership', 'Agile', 'Scrum', 'Jira', 'Linux'])]
+    resume_lower = [skill.lower() for skill in resume_skills]
+
+    def nested_loops():
+        # Average match, must-have details, missing skills and strengths each rescanned all pairs
+        for skills in (required, must_have, must_have, must_have):
+            for skill in skills:
+                max(fuzz.ratio(skill.lower(), resume_skill) for resume_skill in resume_lower)
+
+    def similarity_matrix():
+        matrix = SkillSimilarityMatrix(required, resume_skills)
+        matrix.best_scores()
+        matrix.best_matches()
+        matrix.matched_mask()
+
+    table = SkillSimilarityTable.build(taxonomy_groups())
+    # Resume skills as parsers list them: mostly taxonomy names, some free-form entries
+    listed_skills = SAMPLE_RESUME['structured_data']['skills'] * 6 + ['Communication', 'Leadership', 'Agile',
+                                                                      'Scrum', 'Jira', 'Linux']
+
+    def table_lookups():
+        matrix = SkillSimilarityMatrix(required, listed_skills, table=table)
+        matrix.best_scores()
+        matrix.best_matches()
+        matrix.matched_mask()
+
+    def computed_matrix():
+        matrix = SkillSimilarityMatrix(required, listed_skills)
+        matrix.best_scores()
+        matrix.best_matches()
+        matrix.matched_mask()
+
+    print(f"📊 Skill similarity for {len(required)} required x {len(resume_skills)} resume skills")
+    _report('nested fuzz.ratio loops', _time_calls(nested_loops, iterations))
+    _report('SkillSimilarityMatrix', _time_calls(similarity_matrix, iterations))
+    _report('SkillSimilarityMatrix (taxonomy names)', _time_calls(computed_matrix, iterations))
+    _report('SkillSimilarityTable (taxonomy names)', _time_calls(table_lookups, iterations))
+    print(f"  {'':<40} table {len(table.vocabulary)} names, {table.table.nbytes / 1024:.1f} KB; "
+          f"OOV cache {table.stats()['oov_cache_entries']} pairs")
+
+
+def benchmark_embedding_backends(sentence_count: int = 256, batch_size: int = 32) -> None:
+    """Single-core embedding throughput of each available backend"""
+    from config import Config
+    from embedding_backends import BACKENDS, load_backend
+
+    lines = [line for line in SAMPLE_RESUME['raw_text'].splitlines() if line.strip()]
+    sentences = [f"{lines[index % len(lines)]} ({index})" for index in range(sentence_count)]
+
+    print(f"📊 Embedding {sentence_count} sentences on one core ({Config.SENTENCE_TRANSFORMER_MODEL})")
+    for backend_name in BACKENDS:
+        try:
+            backend = load_backend(backend_name, Config.SENTENCE_TRANSFORMER_MODEL, Config.ONNX_MODEL_DIR,
+                                   num_threads=1)
+        except Exception as e:
+            print(f"  {backend_name:<40} skipped: {e}")
+            continue
+
+        backend.encode(sentences[:batch_size], batch_size=batch_size)
+        timings = _time_calls(lambda: backend.encode(sentences, batch_size=batch_size), 3)
+        best = min(timings)
+        print(f"  {backend_name:<40} {sentence_count / best:9.1f} sentences/s/core   "
+              f"weights {backend.parameter_bytes() / (1024 * 1024):.1f} MB")
+
+
+def benchmark_jd_parser(iterations: int = 5) -> None:
+    """Job creation parse latency: full spaCy pipeline loaded per request vs the shared NER-only parser"""
+    import spacy
+    from config import Config
+    from jd_parser import JobDescriptionParser
+    import model_registry
+
+    description = (f"{SAMPLE_JOB['title']} at {SAMPLE_JOB['company']}, {SAMPLE_JOB['location']}. "
+                   f"{SAMPLE_JOB['description']} Must have: {', '.join(SAMPLE_JOB['must_have_skills'])}.")
+
+    def per_request_parser():
+        # Previous behaviour: every POST /api/jobs loaded the full pipeline
+        JobDescriptionParser(nlp=spacy.load(Config.SPACY_MODEL)).parse_job_description(description)
+
+    def shared_parser():
+        model_registry.get_jd_parser().parse_job_description(description)
+
+    print("📊 Job description parse latency")
+    try:
+        _report('before: spacy.load per request', _time_calls(per_request_parser, iterations))
+    except OSError as e:
+        print(f"  skipped: {e}")
+        return
+    model_registry.get_jd_parser()
+    _report('after: shared parser (NER only)', _time_calls(shared_parser, iterations * 10))
+
+
+def benchmark_bulk_parse(resume_count: int = 200) -> None:
+    """Parsing DOCX resumes one by one (NER on the whole text) vs parse_many (nlp.pipe over headers)"""
+    import tempfile
+    from docx import Document
+    from config import Config
+    import model_registry
+
+    parser = model_registry.get_resume_parser()
+    with tempfile.TemporaryDirectory() as directory:
+        file_paths = []
+        for index in range(resume_count):
+            document = Document()
+            for line in SAMPLE_RESUME['raw_text'].splitlines():
+                document.add_paragraph(line)
+            # Long body so the NER header limit matters
+            for _ in range(20):
+                document.add_paragraph(SAMPLE_RESUME['structured_data']['projects'][0]['description'])
+            file_paths.append(os.path.join(directory, f"resume_{index}.docx"))
+            document.save(file_paths[-1])
+
+        def one_by_one():
+            # Previous behaviour: one nlp() call per resume, over the full text
+            for file_path in file_paths:
+                text, _ = parser._extract_text(file_path)
+                doc = parser.nlp(parser._clean_text(text)) if parser.nlp else None
+                parser._structure_resume_data(text, doc)
+
+        print(f"📊 Parsing {resume_count} DOCX resumes (spaCy model loaded: {parser.nlp is not None})")
+        _report('parse_resume per file, NER on full text', _time_calls(one_by_one, 1))
+        _report(f"parse_many (batch {Config.NLP_BATCH_SIZE})",
+                _time_calls(lambda: list(parser.parse_many(file_paths)), 1))
+        _report('parse_many (n_process=2)',
+                _time_calls(lambda: list(parser.parse_many(file_paths, n_process=2)), 1))
+
+
+def benchmark_text_extraction(page_count: int = 120, resume_count: int = 40) -> None:
+    """Serial PDF text extraction vs the process-pool extractor (page ranges across workers)"""
+    import tempfile
+    from config import Config
+    from text_extraction import TextExtractor, fitz
+
+    with tempfile.TemporaryDirectory() as directory:
+        def make_pdf(name, pages):
+            doc = fitz.open()
+            for _ in range(pages):
+                doc.new_page().insert_text((72, 72), SAMPLE_RESUME['raw_text'] * 3, fontsize=8)
+            doc.save(os.path.join(directory, name))
+            doc.close()
+            return os.path.join(directory, name)
+
+        long_pdf = make_pdf('long.pdf', page_count)
+        resumes = [make_pdf(f"resume_{index}.pdf", 3) for index in range(resume_count)]
+
+        def serial(paths):
+            # Previous behaviour: one document at a time, text += page.get_text()
+            for path in paths:
+                doc = fitz.open(path)
+                text = ""
+                for page in doc:
+                    text += page.get_text()
+                doc.close()
+
+        pool = TextExtractor(max_workers=Config.EXTRACTION_WORKERS, pages_per_task=Config.EXTRACTION_PAGES_PER_TASK,
+                             max_pages=page_count)
+        try:
+            list(pool.extract_many(resumes[:pool.max_workers]))  # start the workers
+
+            print(f"📊 Extracting one {page_count}-page PDF and {resume_count} 3-page PDFs "
+                  f"({pool.max_workers} workers)")
+            _report('serial, one long PDF', _time_calls(lambda: serial([long_pdf]), 3))
+            _report('process pool, one long PDF', _time_calls(lambda: pool.extract(long_pdf), 3))
+            _report('serial, many resumes', _time_calls(lambda: serial(resumes), 3))
+            _report('process pool, many resumes', _time_calls(lambda: list(pool.extract_many(resumes)), 3))
+        finally:
+            pool.shutdown()
+
+
+def benchmark_docx_extraction(paragraph_count: int = 2000, iterations: int = 5) -> None:
+    """python-docx object model vs streaming word/document.xml out of the zip"""
+    import tempfile
+    import tracemalloc
+    from docx import Document
+    from text_extraction import extract_docx
+
+    document = Document()
+    lines = SAMPLE_RESUME['raw_text'].splitlines()
+    for index in range(paragraph_count):
+        document.add_paragraph(f"{lines[index % len(lines)]} ({index})")
+    table = document.add_table(rows=paragraph_count // 20, cols=3)
+    for row in table.rows:
+        for cell, skill in zip(row.cells, SAMPLE_JOB['must_have_skills']):
+            cell.text = skill
+
+    def python_docx(path):
+        # Previous behaviour: build the whole document tree, read body paragraphs only
+        text = ""
+        for paragraph in Document(path).paragraphs:
+            text += paragraph.text + "\n"
+        return text
+
+    def peak_memory(func, path):
+        tracemalloc.start()
+        func(path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / (1024 * 1024)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'resume.docx')
+        document.save(path)
+
+        print(f"📊 Extracting a DOCX with {paragraph_count} paragraphs and a {len(table.rows)}-row table")
+        for label, func in (('python-docx Document', python_docx), ('streaming iterparse', extract_docx)):
+            _report(label, _time_calls(lambda: func(path), iterations))
+            print(f"  {'':<40} peak memory {peak_memory(func, path):.1f} MB (Python heap)")
+
+
+def benchmark_resume_sections(iterations: int = 20, repeats: int = 50) -> None:
+    """Section extractors each scanning the lines vs one shared section map, on long multi-line resumes"""
+    from resume_segmenter import segment_resume
+    import model_registry
+
+    parser = model_registry.get_resume_parser()
+    extractors = [parser._extract_summary, parser._extract_experience, parser._extract_education,
+                  parser._extract_skills, parser._extract_certifications, parser._extract_projects,
+                  parser._extract_achievements]
+    text = '\n'.join([SAMPLE_RESUME['raw_text']] * repeats)
+
+    def per_extractor():
+        for extractor in extractors:
+            extractor(text)
+
+    def single_pass():
+        sections = segment_resume(text)
+        for extractor in extractors:
+            extractor(text, sections)
+
+    print(f"📊 Extracting sections from a {len(text.splitlines())}-line resume")
+    _report('segmented by every extractor', _time_calls(per_extractor, iterations))
+    _report('segmented once, shared', _time_calls(single_pass, iterations))
+
+
+def benchmark_parser_extractors(iterations: int = 20, repeats: int = 50) -> None:
+    """Per-line cost of each regex/keyword extractor of both parsers, on long multi-line texts"""
+    from jd_parser import JobDescriptionParser
+    from patterns import jd_lines
+    from resume_parser import ResumeParser
+    from resume_segmenter import segment_resume
+
+    resume_parser = ResumeParser(nlp=False)
+    jd_parser = JobDescriptionParser(nlp=False)
+    resume_text = '\n'.join([SAMPLE_RESUME['raw_text']] * repeats)
+    jd_text = '\n'.join([
+        f"{SAMPLE_JOB['title']}\n{SAMPLE_JOB['company']}\nLocation: {SAMPLE_JOB['location']}, India\n"
+        f"{SAMPLE_JOB['description']}\n3-5 years of experience. Salary 12 - 18 LPA.\n"
+        f"Must have:\n{', '.join(SAMPLE_JOB['must_have_skills'])}\n\n"
+        f"Nice to have:\n{', '.join(SAMPLE_JOB['good_to_have_skills'])}\n\n"
+        "Responsibilities:\n- Design and build REST APIs\n- Mentor junior developers\n\n"
+        "Bachelor's degree in Computer Science; AWS certification preferred.\n"
+        "Benefits:\n- Health insurance and flexible hours\n"
+    ] * repeats)
+
+    def report_per_line(label: str, func: Callable, text: str) -> None:
+        line_count = len(text.splitlines())
+        timings = _time_calls(func, iterations)
+        print(f"  {label:<40} {sorted(timings)[len(timings) // 2] / line_count * 1e6:8.2f} µs/line")
+
+    print(f"📊 Resume extractors on {len(resume_text.splitlines())} lines (p50 per line)")
+    sections = segment_resume(resume_text)
+    report_per_line('clean text', lambda: resume_parser._clean_text(resume_text), resume_text)
+    report_per_line('contact info', lambda: resume_parser._extract_contact_info(resume_text), resume_text)
+    report_per_line('segment sections', lambda: segment_resume(resume_text), resume_text)
+    for name in ('summary', 'experience', 'education', 'skills', 'certifications', 'projects', 'achievements'):
+        extractor = getattr(resume_parser, f"_extract_{name}")
+        report_per_line(name, lambda extractor=extractor: extractor(resume_text, sections), resume_text)
+
+    print(f"📊 Job description extractors on {len(jd_text.splitlines())} lines (p50 per line, line cache cleared)")
+    for name in ('job_title', 'company_name', 'experience_level', 'salary_range', 'must_have_skills',
+                 'good_to_have_skills', 'qualifications', 'responsibilities', 'benefits',
+                 'education_requirements', 'certification_requirements', 'soft_skills', 'technical_requirements'):
+        extractor = getattr(jd_parser, f"_extract_{name}")
+
+        def run(extractor=extractor):
+            jd_lines.cache_clear()
+            extractor(jd_text)
+
+        report_per_line(name, run, jd_text)
+
+
+def benchmark_skill_taxonomy(iterations: int = 20, repeats: int = 50, extra_skills: int = 1000) -> None:
+    """Substring scan per skill (the previous extractors) vs the compiled skill taxonomy, on a long resume"""
+    import skill_taxonomy
+    from skill_taxonomy import SKILLS, TECHNICAL, SkillTaxonomy
+
+    text = '\n'.join([SAMPLE_RESUME['raw_text']] * repeats)
+    # A production-sized taxonomy: the scan cost of the automaton does not grow with it
+    larger_skills = SKILLS + tuple((f"framework {index}", TECHNICAL, ()) for index in range(extra_skills))
+
+    automaton = skill_taxonomy.ahocorasick
+    for skills in (SKILLS, larger_skills):
+        taxonomy = SkillTaxonomy(skills)
+        names = taxonomy.skills()
+        skill_taxonomy.ahocorasick = None
+        try:
+            regex_taxonomy = SkillTaxonomy(skills)
+        finally:
+            skill_taxonomy.ahocorasick = automaton
+
+        def substring_scans():
+            text_lower = text.lower()
+            return [skill for skill in names if skill in text_lower]
+
+        print(f"📊 Finding {len(names)} skills in a {len(text)}-character resume")
+        _report(f"substring scans ({len(substring_scans())} found)", _time_calls(substring_scans, iterations))
+        if automaton is not None:
+            _report(f"taxonomy automaton ({len(taxonomy.find(text))} found)",
+                    _time_calls(lambda: taxonomy.find(text), iterations))
+        _report(f"taxonomy regex fallback ({len(regex_taxonomy.find(text))} found)",
+                _time_calls(lambda: regex_taxonomy.find(text), iterations))
+
+
+
+def benchmark_skill_coverage(resume_count: int = 2000, job_count: int = 100, iterations: int = 3) -> None:
+    """Skill coverage of every resume against every job: per-pair set lookups vs one sparse product"""
+    import random
+    import tempfile
+
+    from skill_index import SkillIndex, canonical_skills, job_skill_weights
+    from skill_taxonomy import SKILL_TAXONOMY
+
+    generator = random.Random(0)
+    names = SKILL_TAXONOMY.skills()
+    resumes = {f"resume-{index}": generator.sample(names, 12) for index in range(resume_count)}
+    jobs = {
+        f"job-{index}": {'must_have_skills': generator.sample(names, 4),
+                         'good_to_have_skills': generator.sample(names, 4)}
+        for index in range(job_count)
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = SkillIndex(os.path.join(directory, 'skill_index.npz'))
+        start_time = time.perf_counter()
+        index.update_resumes({resume_id: (0.0, skills) for resume_id, skills in resumes.items()})
+        index.update_jobs({job_id: (0.0, requirements) for job_id, requirements in jobs.items()})
+        build_time = time.perf_counter() - start_time
+
+        def per_pair():
+            resume_sets = {resume_id: set(canonical_skills(skills)) for resume_id, skills in resumes.items()}
+            coverage = {}
+            for job_id, requirements in jobs.items():
+                weights = job_skill_weights(requirements)
+                for resume_id, resume_skills in resume_sets.items():
+                    coverage[job_id, resume_id] = sum(weight for skill, weight in weights.items()
+                                                      if skill in resume_skills)
+            return coverage
+
+        def sparse_product():
+            # A fresh instance reads the stored matrices, as the nightly task does
+            return SkillIndex(index.path).top_resumes(top_k=50)
+
+        print(f"📊 Coverage of {resume_count} resumes x {job_count} jobs "
+              f"(index built in {build_time * 1000:.0f} ms)")
+        _report("per-pair set lookups", _time_calls(per_pair, iterations))
+        _report("sparse product + top 50 per job", _time_calls(sparse_product, iterations))
+
+
+
+def benchmark_candidate_search(resume_count: int = 10000, dimensions: int = 384, k: int = 10,
+                               iterations: int = 50) -> None:
+    """Top-K resumes for a job: exact scan over all resume embeddings vs the Chroma HNSW index"""
+    import tempfile
+
+    import numpy as np
+
+    from vector_index import VectorIndex
+
+    generator = np.random.default_rng(0)
+    # Clustered vectors, as embeddings of resumes for a few kinds of role are
+    centers = generator.normal(size=(50, dimensions))
+    vectors = centers[generator.integers(0, 50, resume_count)] + generator.normal(size=(resume_count, dimensions))
+    vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+    queries = vectors[generator.integers(0, resume_count, iterations)] + 0.1
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = VectorIndex(directory, 'resumes', 'benchmark')
+        start_time = time.perf_counter()
+        for offset in range(0, resume_count, 1000):
+            index.add({f"resume-{row}": vectors[row] for row in range(offset, min(offset + 1000, resume_count))})
+        build_time = time.perf_counter() - start_time
+        index.search(queries[0], k)
+
+        def exact(query):
+            return np.argsort(-(vectors @ query))[:k]
+
+        recall = np.mean([
+            len({f"resume-{row}" for row in exact(query)} & {record_id for record_id, _ in index.search(query, k)}) / k
+            for query in queries
+        ])
+        query_iterator = iter(np.concatenate([queries, queries]))
+        print(f"📊 Top {k} of {resume_count} resume embeddings (index built in {build_time:.1f}s, "
+              f"recall@{k} {recall:.2f})")
+        _report("exact scan (numpy)", _time_calls(lambda: exact(next(query_iterator)), iterations))
+        _report("HNSW index (Chroma)", _time_calls(lambda: index.search(next(query_iterator), k), iterations))
+
+
+
+def benchmark_matching_jobs(job_count: int = 5000, dimensions: int = 384, k: int = 10, iterations: int = 20) -> None:
+    """Jobs for one resume: per-job coverage and cosine in Python vs the prefilter and one vectorized pass"""
+    import random
+    import tempfile
+
+    import numpy as np
+
+    from config import Config
+    from job_matching import rank_jobs
+    from skill_index import SkillIndex, canonical_skills, job_skill_weights
+    from skill_taxonomy import SKILL_TAXONOMY
+    from vector_index import VectorIndex
+
+    generator = random.Random(0)
+    names = SKILL_TAXONOMY.skills()
+    jobs = {
+        f"job-{index}": {'must_have_skills': generator.sample(names, 4),
+                         'good_to_have_skills': generator.sample(names, 4)}
+        for index in range(job_count)
+    }
+    job_ids = list(jobs)
+    vectors = np.random.default_rng(0).normal(size=(job_count, dimensions)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    resume_skills, resume_vector = generator.sample(names, 12), vectors[0]
+
+    with tempfile.TemporaryDirectory() as directory:
+        skill_index = SkillIndex(os.path.join(directory, 'skill_index.npz'))
+        skill_index.update_jobs({job_id: (0.0, requirements) for job_id, requirements in jobs.items()})
+        job_index = VectorIndex(os.path.join(directory, 'vectors'), 'jobs', 'benchmark@1')
+        for start in range(0, job_count, 1000):
+            job_index.add(dict(zip(job_ids[start:start + 1000], vectors[start:start + 1000])))
+
+        def per_job():
+            skills = set(canonical_skills(resume_skills))
+            scores = []
+            for row, job_id in enumerate(job_ids):
+                coverage = sum(weight for skill, weight in job_skill_weights(jobs[job_id]).items() if skill in skills)
+                similarity = float(np.dot(vectors[row], resume_vector))
+                scores.append(((0.4 * coverage + 0.4 * max(similarity, 0.0)) / 0.8 * 100, job_id))
+            return sorted(scores, reverse=True)[:k]
+
+        def vectorized():
+            nearest_job_ids = [job_id for job_id, _ in job_index.search(resume_vector, k)]
+            return rank_jobs(job_ids, skill_index.job_coverage(resume_skills), job_index.vectors(), resume_vector, k,
+                             min_skill_coverage=Config.MATCHING_JOBS_MIN_SKILL_COVERAGE,
+                             nearest_job_ids=nearest_job_ids)
+
+        coverage = skill_index.job_coverage(resume_skills)
+        kept = sum(value >= Config.MATCHING_JOBS_MIN_SKILL_COVERAGE for value in coverage.values())
+        print(f"📊 Ranking {job_count} active jobs for one resume "
+              f"({len(coverage)} share a skill, {kept} reach the minimum coverage)")
+        _report("per-job Python loop", _time_calls(per_job, iterations))
+        _report("prefilter + one vectorized pass", _time_calls(vectorized, iterations))
+
+
+# Modules the API process must not import at startup (scoring runs in the workers)
+HEAVY_MODULES = ('torch', 'sentence_transformers', 'transformers', 'onnxruntime', 'spacy', 'sklearn',
+                 'openai', 'fitz', 'docx')
+
+# Import script run in a fresh interpreter: cold-start time and heavy modules it pulled in
+COLD_START_SCRIPT = f"""
+import json, sys, time
+start_time = time.perf_counter()
+import app
+print(json.dumps({{
+    'seconds': time.perf_counter() - start_time,
+    'heavy_modules': [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+}}))
+"""
+
+
+def benchmark_api_cold_start(budget_seconds: float = None) -> bool:
+    """Import time of the Flask API in a fresh process; fails over budget or when the ML stack is loaded"""
+    import json
+    import subprocess
+
+    if budget_seconds is None:
+        budget_seconds = float(os.getenv('API_COLD_START_BUDGET', 2.0))
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', COLD_START_SCRIPT],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        print(f"❌ Importing app failed:\n{result.stderr[-2000:]}")
+        return False
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    # -X importtime lines: "import time: self [us] | cumulative | imported package",
+    # nesting shown by indentation; keep the modules imported while importing app
+    app_imports = []
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if line.startswith('import time:') and len(fields) == 3 and fields[1].strip().isdigit():
+            name = fields[2].rstrip()
+            if name.startswith('    ') and not name.startswith('      '):
+                app_imports.append((int(fields[1]), name.strip()))
+
+    print(f"📊 API cold start (import app), budget {budget_seconds:.2f}s")
+    for cumulative, name in sorted(app_imports, reverse=True)[:10]:
+        print(f"  {name:<40} {cumulative / 1000:9.1f} ms")
+    print(f"  {'total':<40} {report['seconds'] * 1000:9.1f} ms")
+
+    passed = True
+    if report['heavy_modules']:
+        print(f"❌ API imported heavy modules: {', '.join(report['heavy_modules'])}")
+        passed = False
+    if report['seconds'] > budget_seconds:
+        print(f"❌ API cold start {report['seconds']:.2f}s is over the {budget_seconds:.2f}s budget")
+        passed = False
+    if passed:
+        print("✅ API cold start within budget, no ML stack imported")
+    return passed
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    'engine-registry': benchmark_engine_registry,
+    'batch-scoring': benchmark_batch_scoring,
+    'skill-matrix': benchmark_skill_matrix,
+    'embedding-backends': benchmark_embedding_backends,
+    'jd-parser': benchmark_jd_parser,
+    'bulk-parse': benchmark_bulk_parse,
+    'text-extraction': benchmark_text_extraction,
+    'docx-extraction': benchmark_docx_extraction,
+    'resume-sections': benchmark_resume_sections,
+    'parser-extractors': benchmark_parser_extractors,
+    'skill-taxonomy': benchmark_skill_taxonomy,
+    'skill-coverage': benchmark_skill_coverage,
+    'candidate-search': benchmark_candidate_search,
+    'matching-jobs': benchmark_matching_jobs,
+    'api-cold-start': benchmark_api_cold_start,
+}
+
+
+def main():
+    """Run the selected benchmarks (all by default)"""
+    names = sys.argv[1:] or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"❌ Unknown benchmark(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(BENCHMARKS)}")
+        return False
+
+    print("🚀 Resume Evaluation System - Benchmarks")
+    print("=" * 50)
+    success = True
+    for name in names:
+        # Benchmarks with a budget return False when it is exceeded
+        if BENCHMARKS[name]() is False:
+            success = False
+        print()
+    return success
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
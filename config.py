@@ -28,6 +28,13 @@ class Config:
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))  # 16MB
     
+    # Upload Storage: 'local' (content-addressed files under STORAGE_LOCAL_ROOT) or 's3'
+    STORAGE_BACKEND = os.getenv('STORAGE_BACKEND', 'local')
+    STORAGE_LOCAL_ROOT = os.getenv('STORAGE_LOCAL_ROOT', os.path.join(UPLOAD_FOLDER, 'resumes'))
+    S3_BUCKET = os.getenv('S3_BUCKET', 'resumes')
+    S3_PREFIX = os.getenv('S3_PREFIX', 'resumes/')
+    S3_ENDPOINT_URL = os.getenv('S3_ENDPOINT_URL')  # S3-compatible stores such as MinIO
+    
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     
@@ -36,8 +43,86 @@ class Config:
     CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', REDIS_URL)
     
     # AI Model Configuration
-    SENTENCE_TRANSFORMER_MODEL = 'all-MiniLM-L6-v2'
-    OPENAI_MODEL = 'gpt-3.5-turbo'
+    SENTENCE_TRANSFORMER_MODEL = os.getenv('SENTENCE_TRANSFORMER_MODEL', 'all-MiniLM-L6-v2')
+    OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+    SPACY_MODEL = os.getenv('SPACY_MODEL', 'en_core_web_sm')
+    
+    # Bulk Parsing: NER runs only on the first NER_HEADER_CHARS characters (names, locations)
+    NER_HEADER_CHARS = int(os.getenv('NER_HEADER_CHARS', 1000))
+    NLP_BATCH_SIZE = int(os.getenv('NLP_BATCH_SIZE', 64))
+    NLP_N_PROCESS = int(os.getenv('NLP_N_PROCESS', 1))  # >1 only outside Celery prefork workers
+    BULK_PARSE_CHUNK_SIZE = int(os.getenv('BULK_PARSE_CHUNK_SIZE', 200))
+    
+    # Text Extraction: PDFs longer than EXTRACTION_PAGES_PER_TASK pages are split across workers
+    EXTRACTION_WORKERS = int(os.getenv('EXTRACTION_WORKERS', 0))  # 0 = one per CPU, 1 = in-process
+    EXTRACTION_PAGES_PER_TASK = int(os.getenv('EXTRACTION_PAGES_PER_TASK', 10))
+    EXTRACTION_MAX_PAGES = int(os.getenv('EXTRACTION_MAX_PAGES', 50))  # later pages are ignored
+    EXTRACTION_TIMEOUT = float(os.getenv('EXTRACTION_TIMEOUT', 60))  # seconds per document
+    
+    # LLM Client
+    LLM_API_BASE = os.getenv('LLM_API_BASE', 'https://api.openai.com/v1')
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', 16))
+    LLM_REQUESTS_PER_MINUTE = float(os.getenv('LLM_REQUESTS_PER_MINUTE', 500))
+    LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', 5))
+    LLM_REQUEST_TIMEOUT = float(os.getenv('LLM_REQUEST_TIMEOUT', 60))
+    
+    # Cascade Scoring: only call the LLM when it could change the verdict
+    CASCADE_SCORING = os.getenv('CASCADE_SCORING', 'false').lower() == 'true'
+    
+    # LLM Response Cache
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_PATH = os.getenv('LLM_CACHE_PATH', os.path.join('data', 'llm_cache.sqlite3'))
+    LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', 30 * 24 * 3600))  # 30 days
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 100000))
+    
+    # Embedding Backend: 'torch' (full precision), 'onnx' or 'onnx-int8' (ONNX Runtime, quantized)
+    EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'torch')
+    ONNX_MODEL_DIR = os.getenv('ONNX_MODEL_DIR', os.path.join('data', 'onnx'))
+    EMBEDDING_NUM_THREADS = int(os.getenv('EMBEDDING_NUM_THREADS', 0))  # 0 = library default
+    
+    # Chunked Semantic Matching
+    SEMANTIC_CHUNKING = os.getenv('SEMANTIC_CHUNKING', 'true').lower() == 'true'
+    SEMANTIC_CHUNK_WORDS = int(os.getenv('SEMANTIC_CHUNK_WORDS', 150))  # fits the 256-token MiniLM window
+    SEMANTIC_MAX_RESUME_CHUNKS = int(os.getenv('SEMANTIC_MAX_RESUME_CHUNKS', 16))
+    SEMANTIC_MAX_JOB_CHUNKS = int(os.getenv('SEMANTIC_MAX_JOB_CHUNKS', 8))
+    
+    # Embedding Cache
+    EMBEDDING_CACHE_ENABLED = os.getenv('EMBEDDING_CACHE_ENABLED', 'true').lower() == 'true'
+    EMBEDDING_CACHE_DIR = os.getenv('EMBEDDING_CACHE_DIR', os.path.join('data', 'embeddings'))
+    EMBEDDING_MODEL_VERSION = os.getenv('EMBEDDING_MODEL_VERSION', '1')
+    
+    # Corpus-level TF-IDF for hard matching
+    TFIDF_INDEX_PATH = os.getenv('TFIDF_INDEX_PATH', os.path.join('data', 'tfidf_corpus.npz'))
+    TFIDF_N_FEATURES = int(os.getenv('TFIDF_N_FEATURES', 2 ** 18))
+    
+    # Precomputed skill similarity table over the skill taxonomy (vocabulary JSON saved next to it)
+    SKILL_SIMILARITY_TABLE_ENABLED = os.getenv('SKILL_SIMILARITY_TABLE_ENABLED', 'true').lower() == 'true'
+    SKILL_SIMILARITY_TABLE_PATH = os.getenv('SKILL_SIMILARITY_TABLE_PATH', os.path.join('data', 'skill_similarity.npy'))
+    SKILL_SIMILARITY_OOV_CACHE_SIZE = int(os.getenv('SKILL_SIMILARITY_OOV_CACHE_SIZE', 10000))  # names
+    
+    # Sparse resume/job x skill matrices for all-pairs skill coverage, and the nightly run over them
+    SKILL_INDEX_PATH = os.getenv('SKILL_INDEX_PATH', os.path.join('data', 'skill_index.npz'))
+    SKILL_INDEX_MUST_HAVE_WEIGHT = float(os.getenv('SKILL_INDEX_MUST_HAVE_WEIGHT', 2.0))
+    NIGHTLY_SCORING_HOUR = int(os.getenv('NIGHTLY_SCORING_HOUR', 2))  # UTC
+    NIGHTLY_SCORING_TOP_K = int(os.getenv('NIGHTLY_SCORING_TOP_K', 50))  # resumes kept per job
+    NIGHTLY_EVALUATE_TOP_K = int(os.getenv('NIGHTLY_EVALUATE_TOP_K', 0))  # of those, fully evaluated
+    
+    # Nearest-neighbour indexes of resume and job embeddings (Chroma; a server when CHROMA_HOST is set)
+    VECTOR_INDEX_DIR = os.getenv('VECTOR_INDEX_DIR', os.path.join('data', 'vectors'))
+    CHROMA_HOST = os.getenv('CHROMA_HOST')
+    CHROMA_PORT = int(os.getenv('CHROMA_PORT', 8000))
+    CANDIDATES_DEFAULT_K = int(os.getenv('CANDIDATES_DEFAULT_K', 10))
+    CANDIDATES_MAX_K = int(os.getenv('CANDIDATES_MAX_K', 200))
+    
+    # Matching jobs for a resume: jobs with less skill coverage than this are skipped before ranking,
+    # unless their vector is among the k nearest to the resume's (0: rank all)
+    MATCHING_JOBS_DEFAULT_K = int(os.getenv('MATCHING_JOBS_DEFAULT_K', 10))
+    MATCHING_JOBS_MAX_K = int(os.getenv('MATCHING_JOBS_MAX_K', 100))
+    MATCHING_JOBS_MIN_SKILL_COVERAGE = float(os.getenv('MATCHING_JOBS_MIN_SKILL_COVERAGE', 0.1))
+    
+    # Batch Scoring
+    EMBEDDING_BATCH_SIZE = int(os.getenv('EMBEDDING_BATCH_SIZE', 64))
+    BATCH_EVALUATION_CHUNK_SIZE = int(os.getenv('BATCH_EVALUATION_CHUNK_SIZE', 500))
     
     # Scoring Weights
     HARD_MATCH_WEIGHT = 0.4
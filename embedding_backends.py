@@ -0,0 +1,195 @@
+"""
+Embedding Backends Module
+Interchangeable inference backends for the sentence embedding model
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('torch', 'onnx', 'onnx-int8')
+
+
+def load_backend(backend: str, model_name: str, onnx_dir: str = None, num_threads: int = 0):
+    """Create the embedding backend named in Config.EMBEDDING_BACKEND"""
+    if backend == 'torch':
+        return TorchBackend(model_name, num_threads)
+    if backend in ('onnx', 'onnx-int8'):
+        return OnnxBackend(model_name, onnx_dir or os.path.join('data', 'onnx'),
+                           quantized=backend == 'onnx-int8', num_threads=num_threads)
+    raise ValueError(f"Unknown embedding backend: {backend} (expected one of {', '.join(BACKENDS)})")
+
+
+class TorchBackend:
+    """Full-precision PyTorch inference through sentence-transformers"""
+
+    name = 'torch'
+
+    def __init__(self, model_name: str, num_threads: int = 0):
+        from sentence_transformers import SentenceTransformer
+
+        if num_threads:
+            import torch
+            torch.set_num_threads(num_threads)
+
+        self.model_name = model_name
+        self.model = SentenceTransformer(model_name)
+
+    def encode(self, texts: Union[str, List[str]], batch_size: int = 32, **kwargs) -> np.ndarray:
+        """Embed texts as a float32 matrix (one row per text)"""
+        return np.asarray(self.model.encode(texts, batch_size=batch_size, **kwargs), dtype=np.float32)
+
+    def parameter_bytes(self) -> int:
+        """Size of the model weights in bytes"""
+        return int(sum(p.numel() * p.element_size() for p in self.model.parameters()))
+
+
+class OnnxBackend:
+    """ONNX Runtime inference of an exported sentence-transformers model, optionally int8-quantized.
+
+    The model is exported (and quantized) once into onnx_dir; afterwards only
+    onnxruntime and tokenizers are needed to load it.
+    """
+
+    def __init__(self, model_name: str, onnx_dir: str, quantized: bool = True, num_threads: int = 0):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        self.model_name = model_name
+        self.name = 'onnx-int8' if quantized else 'onnx'
+        self.model_dir = export_onnx(model_name, onnx_dir)
+        self.model_path = os.path.join(self.model_dir, 'model.int8.onnx' if quantized else 'model.onnx')
+
+        with open(os.path.join(self.model_dir, 'backend.json')) as config_file:
+            config = json.load(config_file)
+        self.pooling = config['pooling']
+        self.normalize = config['normalize']
+        self.max_seq_length = config['max_seq_length']
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(self.model_dir, 'tokenizer.json'))
+        self.tokenizer.enable_truncation(max_length=self.max_seq_length)
+        self.tokenizer.enable_padding(pad_id=config['pad_token_id'], pad_token=config['pad_token'])
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(self.model_path, options, providers=['CPUExecutionProvider'])
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+
+    def encode(self, texts: Union[str, List[str]], batch_size: int = 32, **kwargs) -> np.ndarray:
+        """Embed texts as a float32 matrix (one row per text)"""
+        if isinstance(texts, str):
+            return self.encode([texts], batch_size)[0]
+
+        # Batch texts of similar length together to keep padding small
+        order = np.argsort([-len(text) for text in texts], kind='stable')
+        embeddings = [None] * len(texts)
+        for start in range(0, len(texts), batch_size):
+            indices = order[start:start + batch_size]
+            for index, embedding in zip(indices, self._encode_batch([texts[i] for i in indices])):
+                embeddings[index] = embedding
+
+        if not embeddings:
+            return np.zeros((0, self.session.get_outputs()[0].shape[-1] or 0), dtype=np.float32)
+        return np.vstack(embeddings).astype(np.float32)
+
+    def parameter_bytes(self) -> int:
+        """Size of the model weights in bytes"""
+        return os.path.getsize(self.model_path)
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Run one padded batch through the model and pool the token embeddings"""
+        encodings = self.tokenizer.encode_batch(texts)
+        inputs = {
+            'input_ids': np.array([encoding.ids for encoding in encodings], dtype=np.int64),
+            'attention_mask': np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64),
+            'token_type_ids': np.array([encoding.type_ids for encoding in encodings], dtype=np.int64),
+        }
+        token_embeddings = self.session.run(None, {name: inputs[name] for name in self.input_names})[0]
+
+        if self.pooling == 'cls':
+            embeddings = token_embeddings[:, 0]
+        else:
+            mask = inputs['attention_mask'][..., None].astype(np.float32)
+            embeddings = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+        if self.normalize:
+            embeddings = embeddings / np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
+
+
+def export_onnx(model_name: str, onnx_dir: str) -> str:
+    """Export a sentence-transformers model to ONNX plus a dynamic int8 copy; returns the model directory.
+
+    Needs torch and sentence-transformers, but only the first time: the exported
+    files are reused on later loads.
+    """
+    model_dir = os.path.join(onnx_dir, model_name.replace('/', '__'))
+    if os.path.exists(os.path.join(model_dir, 'backend.json')):
+        return model_dir
+
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers.models import Normalize, Pooling
+
+    logger.info(f"Exporting {model_name} to ONNX in {model_dir}")
+    model = SentenceTransformer(model_name, device='cpu')
+    transformer = model[0]
+    pooling = next((module for module in model if isinstance(module, Pooling)), None)
+    tokenizer = transformer.tokenizer
+
+    # Write into a temporary directory and move it into place, so concurrent
+    # workers never load a half-written export
+    os.makedirs(onnx_dir, exist_ok=True)
+    temp_dir = tempfile.mkdtemp(dir=onnx_dir)
+    try:
+        sample = tokenizer(['warm up'], return_tensors='pt')
+        input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+        dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names}
+        dynamic_axes['token_embeddings'] = {0: 'batch', 1: 'sequence'}
+
+        with torch.no_grad():
+            torch.onnx.export(
+                transformer.auto_model.eval(),
+                tuple(sample[name] for name in input_names),
+                os.path.join(temp_dir, 'model.onnx'),
+                input_names=input_names,
+                output_names=['token_embeddings'],
+                dynamic_axes=dynamic_axes,
+                opset_version=14
+            )
+        quantize_dynamic(
+            os.path.join(temp_dir, 'model.onnx'),
+            os.path.join(temp_dir, 'model.int8.onnx'),
+            weight_type=QuantType.QInt8
+        )
+
+        tokenizer.save_pretrained(temp_dir)
+        with open(os.path.join(temp_dir, 'backend.json'), 'w') as config_file:
+            json.dump({
+                'model_name': model_name,
+                'pooling': 'cls' if pooling is not None and pooling.pooling_mode_cls_token else 'mean',
+                'normalize': any(isinstance(module, Normalize) for module in model),
+                'max_seq_length': model.max_seq_length,
+                'pad_token': tokenizer.pad_token,
+                'pad_token_id': tokenizer.pad_token_id
+            }, config_file)
+
+        try:
+            os.rename(temp_dir, model_dir)
+        except OSError:
+            # Another worker finished its export first
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+    return model_dir
@@ -0,0 +1,163 @@
+"""
+Embedding Store Module
+Persistent content-addressed cache of sentence embeddings
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
+
+class EmbeddingStore:
+    """Append-only float32 matrix on disk with a content-hash id index.
+
+    Layout of a store directory:
+        vectors.f32  raw float32 rows, one embedding per row
+        ids.txt      one hex key per line, line N describes row N
+        meta.json    model name, version and embedding dimension
+    """
+
+    def __init__(self, directory: str, model_name: str, model_version: str):
+        self.model_name = model_name
+        self.model_version = str(model_version)
+        self.directory = os.path.join(directory, model_name.replace('/', '__'), self.model_version)
+        self.vectors_path = os.path.join(self.directory, 'vectors.f32')
+        self.ids_path = os.path.join(self.directory, 'ids.txt')
+        self.meta_path = os.path.join(self.directory, 'meta.json')
+        self.lock_path = os.path.join(self.directory, '.lock')
+
+        self.hits = 0
+        self.misses = 0
+
+        self._index: Dict[str, int] = {}
+        self._ids_offset = 0
+        self._dimension: Optional[int] = None
+        self._vectors = None
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._refresh()
+
+    def key_for(self, text: str) -> str:
+        """SHA-256 of the normalized text plus model name and version"""
+        normalized = ' '.join((text or '').split())
+        payload = f"{self.model_name}\0{self.model_version}\0{normalized}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def encode(self, texts: List[str], encoder: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """Return embeddings for texts, calling encoder only for texts not in the store"""
+        keys = [self.key_for(text) for text in texts]
+
+        with self._lock:
+            if any(key not in self._index for key in keys):
+                self._refresh()
+
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key not in self._index and key not in missing:
+                    missing[key] = text
+
+            missed = sum(1 for key in keys if key in missing)
+            self.misses += missed
+            self.hits += len(keys) - missed
+
+            new_vectors = {}
+            if missing:
+                encoded = np.asarray(encoder(list(missing.values())), dtype=np.float32)
+                new_vectors = dict(zip(missing.keys(), encoded))
+                self._append(new_vectors)
+
+            rows = []
+            for key in keys:
+                if key in new_vectors:
+                    rows.append(new_vectors[key])
+                else:
+                    rows.append(np.array(self._vectors[self._index[key]]))
+
+        return np.vstack(rows) if rows else np.zeros((0, self._dimension or 0), dtype=np.float32)
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and size of the store"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'entries': len(self._index),
+            'dimension': self._dimension,
+            'path': self.directory
+        }
+
+    def _refresh(self) -> None:
+        """Pick up rows appended since the last read (possibly by other processes)"""
+        if self._dimension is None and os.path.exists(self.meta_path):
+            with open(self.meta_path) as meta_file:
+                self._dimension = json.load(meta_file)['dimension']
+
+        if not os.path.exists(self.ids_path) or self._dimension is None:
+            return
+
+        with open(self.ids_path) as ids_file:
+            ids_file.seek(self._ids_offset)
+            new_ids = ids_file.read()
+        # Ignore a partially written trailing line
+        complete = new_ids[:new_ids.rfind('\n') + 1]
+        self._ids_offset += len(complete.encode('utf-8'))
+        for key in complete.splitlines():
+            self._index[key] = len(self._index)
+
+        self._map_vectors()
+
+    def _map_vectors(self) -> None:
+        """Memory-map the rows covered by the id index"""
+        if self._index:
+            self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode='r',
+                                      shape=(len(self._index), self._dimension))
+        else:
+            self._vectors = None
+
+    def _append(self, new_vectors: Dict[str, np.ndarray]) -> None:
+        """Append vectors first and ids second so a crash never indexes a missing row"""
+        with open(self.lock_path, 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._refresh()
+                pending = {key: vector for key, vector in new_vectors.items() if key not in self._index}
+                if not pending:
+                    return
+
+                if self._dimension is None:
+                    self._dimension = int(next(iter(pending.values())).shape[0])
+                    with open(self.meta_path, 'w') as meta_file:
+                        json.dump({
+                            'model_name': self.model_name,
+                            'model_version': self.model_version,
+                            'dimension': self._dimension
+                        }, meta_file)
+
+                with open(self.vectors_path, 'ab') as vectors_file:
+                    # Drop rows left behind by an interrupted append
+                    vectors_file.truncate(len(self._index) * self._dimension * 4)
+                    vectors_file.write(np.vstack(list(pending.values())).astype(np.float32).tobytes())
+                    vectors_file.flush()
+                    os.fsync(vectors_file.fileno())
+
+                with open(self.ids_path, 'a') as ids_file:
+                    # Drop a partial line left behind by an interrupted append
+                    ids_file.truncate(self._ids_offset)
+                    ids_file.write(''.join(f"{key}\n" for key in pending))
+
+                self._refresh()
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -3,30 +3,56 @@ Job Description Parsing Module
 Extracts and structures requirements from job descriptions
 """
 
-import re
-import spacy
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import json
+from config import Config
+from model_registry import get_spacy_nlp
+from patterns import (
+    JD_EXPERIENCE_LEVELS, JD_LOCATIONS, JD_SALARIES, LIST_ITEM_SEPARATORS, SKILL_SEPARATORS, clean_text, jd_lines
+)
+from skill_taxonomy import SKILL_TAXONOMY, SOFT, TECHNICAL
 
 class JobDescriptionParser:
-    def __init__(self):
-        # Load spaCy model for NLP processing
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Warning: spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+    def __init__(self, nlp=None):
+        # spaCy pipeline for NLP processing (shared per process unless one is passed in)
+        self.nlp = nlp if nlp is not None else get_spacy_nlp()
     
     def parse_job_description(self, jd_text: str) -> Dict:
         """Parse job description and extract structured requirements"""
         # Clean the text
         jd_text = self._clean_text(jd_text)
         
+        return self._structure_requirements(jd_text)
+    
+    def parse_many(self, jd_texts: List[str], batch_size: int = None, n_process: int = None) -> Iterator[Dict]:
+        """Parse many job descriptions, streaming their header regions through nlp.pipe; yields results in order"""
+        batch_size = batch_size or Config.NLP_BATCH_SIZE
+        n_process = n_process or Config.NLP_N_PROCESS
+        
+        cleaned = (self._clean_text(jd_text) for jd_text in jd_texts)
+        if not self.nlp:
+            for jd_text in cleaned:
+                yield self._structure_requirements(jd_text)
+            return
+        
+        documents = self.nlp.pipe(
+            ((self._ner_input(jd_text), jd_text) for jd_text in cleaned),
+            as_tuples=True, batch_size=batch_size, n_process=n_process
+        )
+        for doc, jd_text in documents:
+            yield self._structure_requirements(jd_text, doc)
+    
+    def _ner_input(self, text: str) -> str:
+        """Header region of the job description, where the location is stated"""
+        return text[:Config.NER_HEADER_CHARS]
+    
+    def _structure_requirements(self, jd_text: str, doc=None) -> Dict:
+        """Extract the structured requirements from cleaned job description text"""
         # Extract different sections
         structured_data = {
             'title': self._extract_job_title(jd_text),
             'company': self._extract_company_name(jd_text),
-            'location': self._extract_location(jd_text),
+            'location': self._extract_location(jd_text, doc),
             'experience_level': self._extract_experience_level(jd_text),
             'employment_type': self._extract_employment_type(jd_text),
             'salary_range': self._extract_salary_range(jd_text),
@@ -45,54 +71,38 @@ class JobDescriptionParser:
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.\,\;\:\!\?\-\(\)]', '', text)
-        return text.strip()
+        return clean_text(text)
     
     def _extract_job_title(self, text: str) -> str:
         """Extract job title from the beginning of the text"""
-        lines = text.split('\n')
-        for line in lines[:5]:  # Check first 5 lines
-            line = line.strip()
-            if len(line) > 5 and len(line) < 100:
-                # Look for common job title patterns
-                title_indicators = ['engineer', 'developer', 'analyst', 'manager', 'specialist', 'consultant', 'architect']
-                if any(indicator in line.lower() for indicator in title_indicators):
-                    return line
+        for line, groups in jd_lines(text)[:5]:  # Check first 5 lines
+            # Look for common job title patterns
+            if len(line) > 5 and len(line) < 100 and 'title' in groups:
+                return line
         return ""
     
     def _extract_company_name(self, text: str) -> str:
         """Extract company name"""
-        lines = text.split('\n')
-        for line in lines[:10]:  # Check first 10 lines
-            line = line.strip()
-            if len(line) > 3 and len(line) < 100:
-                # Look for company indicators
-                company_indicators = ['inc', 'corp', 'ltd', 'llc', 'company', 'technologies', 'solutions', 'systems']
-                if any(indicator in line.lower() for indicator in company_indicators):
-                    return line
+        for line, groups in jd_lines(text)[:10]:  # Check first 10 lines
+            # Look for company indicators
+            if len(line) > 3 and len(line) < 100 and 'company' in groups:
+                return line
         return ""
     
-    def _extract_location(self, text: str) -> str:
+    def _extract_location(self, text: str, doc=None) -> str:
         """Extract job location"""
         if not self.nlp:
             return ""
         
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self.nlp(self._ner_input(text))
         for ent in doc.ents:
             if ent.label_ == "GPE":  # Geopolitical entity
                 return ent.text
         
         # Fallback: look for common location patterns
-        location_patterns = [
-            r'(?:in|at|based in|located in)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*(?:India|USA|UK|Canada|Australia)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in JD_LOCATIONS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         
@@ -100,18 +110,9 @@ class JobDescriptionParser:
     
     def _extract_experience_level(self, text: str) -> str:
         """Extract required experience level"""
-        experience_patterns = {
-            'entry': r'(?:entry|fresher|0-1|0-2)\s*(?:years?|yrs?)',
-            'junior': r'(?:junior|1-3|2-4)\s*(?:years?|yrs?)',
-            'mid': r'(?:mid|3-5|4-6|5-7)\s*(?:years?|yrs?)',
-            'senior': r'(?:senior|5-8|6-10|7-12)\s*(?:years?|yrs?)',
-            'lead': r'(?:lead|principal|8-12|10-15)\s*(?:years?|yrs?)',
-            'executive': r'(?:executive|director|15\+|12\+)\s*(?:years?|yrs?)'
-        }
-        
         text_lower = text.lower()
-        for level, pattern in experience_patterns.items():
-            if re.search(pattern, text_lower):
+        for level, pattern in JD_EXPERIENCE_LEVELS:
+            if pattern.search(text_lower):
                 return level
         
         return "not_specified"
@@ -135,14 +136,8 @@ class JobDescriptionParser:
     
     def _extract_salary_range(self, text: str) -> Dict:
         """Extract salary range"""
-        salary_patterns = [
-            r'₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*-\s*₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:lpa|lakhs?|crores?|k|thousand)',
-            r'₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:lpa|lakhs?|crores?|k|thousand)\s*-\s*₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:lpa|lakhs?|crores?|k|thousand)',
-            r'(\d+)\s*-\s*(\d+)\s*(?:lpa|lakhs?|crores?)'
-        ]
-        
-        for pattern in salary_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in JD_SALARIES:
+            match = pattern.search(text)
             if match:
                 return {
                     'min': match.group(1),
@@ -154,7 +149,7 @@ class JobDescriptionParser:
     
     def _extract_must_have_skills(self, text: str) -> List[str]:
         """Extract must-have skills"""
-        must_have_sections = self._find_requirement_sections(text, ['must have', 'required', 'mandatory', 'essential'])
+        must_have_sections = self._find_requirement_sections(text, 'must_have')
         skills = []
         
         for section in must_have_sections:
@@ -164,7 +159,7 @@ class JobDescriptionParser:
     
     def _extract_good_to_have_skills(self, text: str) -> List[str]:
         """Extract good-to-have skills"""
-        good_to_have_sections = self._find_requirement_sections(text, ['good to have', 'preferred', 'nice to have', 'desired', 'optional'])
+        good_to_have_sections = self._find_requirement_sections(text, 'good_to_have')
         skills = []
         
         for section in good_to_have_sections:
@@ -174,25 +169,16 @@ class JobDescriptionParser:
     
     def _extract_qualifications(self, text: str) -> List[str]:
         """Extract educational qualifications"""
-        qualification_keywords = ['bachelor', 'master', 'phd', 'diploma', 'degree', 'certification', 'qualification']
-        qualifications = []
-        
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if any(keyword in line.lower() for keyword in qualification_keywords):
-                qualifications.append(line)
-        
-        return qualifications
+        return [line for line, groups in jd_lines(text) if 'qualifications' in groups]
     
     def _extract_responsibilities(self, text: str) -> List[str]:
         """Extract job responsibilities"""
-        responsibility_sections = self._find_requirement_sections(text, ['responsibilities', 'duties', 'role', 'what you will do'])
+        responsibility_sections = self._find_requirement_sections(text, 'responsibilities')
         responsibilities = []
         
         for section in responsibility_sections:
             # Split by bullet points or line breaks
-            items = re.split(r'[•\-\*\n]', section)
+            items = LIST_ITEM_SEPARATORS.split(section)
             for item in items:
                 item = item.strip()
                 if len(item) > 10:  # Meaningful responsibility
@@ -202,12 +188,12 @@ class JobDescriptionParser:
     
     def _extract_benefits(self, text: str) -> List[str]:
         """Extract job benefits"""
-        benefit_sections = self._find_requirement_sections(text, ['benefits', 'perks', 'compensation', 'package'])
+        benefit_sections = self._find_requirement_sections(text, 'benefits')
         benefits = []
         
         for section in benefit_sections:
             # Split by bullet points or line breaks
-            items = re.split(r'[•\-\*\n]', section)
+            items = LIST_ITEM_SEPARATORS.split(section)
             for item in items:
                 item = item.strip()
                 if len(item) > 5:  # Meaningful benefit
@@ -217,80 +203,32 @@ class JobDescriptionParser:
     
     def _extract_education_requirements(self, text: str) -> List[str]:
         """Extract education requirements"""
-        education_keywords = ['bachelor', 'master', 'phd', 'diploma', 'degree', 'education', 'qualification']
-        education_requirements = []
-        
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if any(keyword in line.lower() for keyword in education_keywords):
-                education_requirements.append(line)
-        
-        return education_requirements
+        return [line for line, groups in jd_lines(text) if 'education' in groups]
     
     def _extract_certification_requirements(self, text: str) -> List[str]:
         """Extract certification requirements"""
-        cert_keywords = ['certification', 'certificate', 'certified', 'license', 'accreditation']
-        certifications = []
-        
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if any(keyword in line.lower() for keyword in cert_keywords):
-                certifications.append(line)
-        
-        return certifications
+        return [line for line, groups in jd_lines(text) if 'certifications' in groups]
     
     def _extract_soft_skills(self, text: str) -> List[str]:
         """Extract soft skills requirements"""
-        soft_skills = [
-            'communication', 'leadership', 'teamwork', 'problem solving', 'analytical',
-            'creative', 'adaptable', 'time management', 'project management', 'mentoring',
-            'collaboration', 'presentation', 'negotiation', 'customer service'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in soft_skills:
-            if skill in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills
+        return SKILL_TAXONOMY.find(text, SOFT)
     
     def _extract_technical_requirements(self, text: str) -> List[str]:
         """Extract technical requirements"""
-        technical_skills = [
-            'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
-            'sql', 'mongodb', 'postgresql', 'mysql', 'aws', 'azure', 'docker',
-            'kubernetes', 'git', 'jenkins', 'agile', 'scrum', 'machine learning',
-            'data science', 'artificial intelligence', 'deep learning', 'tensorflow',
-            'pytorch', 'pandas', 'numpy', 'scikit-learn', 'flask', 'django',
-            'spring', 'hibernate', 'microservices', 'rest api', 'graphql'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in technical_skills:
-            if skill in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills
+        return SKILL_TAXONOMY.find(text, TECHNICAL)
     
-    def _find_requirement_sections(self, text: str, keywords: List[str]) -> List[str]:
-        """Find sections containing specific keywords"""
+    def _find_requirement_sections(self, text: str, group: str) -> List[str]:
+        """Find sections whose heading contains a keyword of group (see patterns.JD_LINE_KEYWORDS)"""
         sections = []
-        lines = text.split('\n')
+        lines = jd_lines(text)
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-            if any(keyword in line_lower for keyword in keywords):
+        for i, (line, groups) in enumerate(lines):
+            if group in groups:
                 # Extract the section content
                 section_content = []
-                for j in range(i + 1, min(i + 10, len(lines))):  # Next 10 lines
-                    if lines[j].strip():
-                        section_content.append(lines[j].strip())
+                for next_line, _ in lines[i + 1:i + 10]:  # Next 10 lines
+                    if next_line:
+                        section_content.append(next_line)
                     else:
                         break
                 if section_content:
@@ -303,7 +241,7 @@ class JobDescriptionParser:
         skills = []
         
         # Split by common separators
-        skill_candidates = re.split(r'[,;|•\-\n]', section)
+        skill_candidates = SKILL_SEPARATORS.split(section)
         for skill in skill_candidates:
             skill = skill.strip()
             if len(skill) > 2 and len(skill) < 100:  # Reasonable skill length
@@ -0,0 +1,54 @@
+"""
+Job Matching Module
+Ranks all active jobs for one resume by skill coverage and embedding similarity in a single vectorized pass
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+def rank_jobs(job_ids: Iterable[str], skill_coverage: Dict[str, float], job_vectors: Tuple[List[str], np.ndarray],
+              resume_vector: Optional[np.ndarray], k: int, min_skill_coverage: float = 0.1,
+              hard_match_weight: float = 0.4, semantic_weight: float = 0.4,
+              nearest_job_ids: Iterable[str] = ()) -> List[Dict]:
+    """Best k jobs for a resume, highest score (0-100) first.
+
+    Jobs whose skill coverage by the resume is below min_skill_coverage are
+    skipped before any similarity is computed, unless they are among
+    nearest_job_ids (the job vectors nearest to the resume vector, from the
+    vector index): a job sharing no indexed skill can still rank on similarity,
+    but only when it has a vector close enough to the resume's. Jobs are scored
+    at once from their coverage and the cosine similarity of their vector to the
+    resume vector (0 when either vector is missing), weighted like the hard and
+    semantic match.
+    """
+    nearest_job_ids = set(nearest_job_ids)
+    candidates = [
+        job_id for job_id in job_ids
+        if skill_coverage.get(job_id, 0.0) >= min_skill_coverage or job_id in nearest_job_ids
+    ]
+    if not candidates or k <= 0:
+        return []
+
+    coverage = np.array([skill_coverage.get(job_id, 0.0) for job_id in candidates], dtype=np.float32)
+    similarity = np.zeros(len(candidates), dtype=np.float32)
+    vector_ids, vectors = job_vectors
+    if resume_vector is not None and len(vector_ids):
+        positions = {job_id: row for row, job_id in enumerate(vector_ids)}
+        rows = np.array([positions.get(job_id, -1) for job_id in candidates])
+        has_vector = rows >= 0
+        similarity[has_vector] = vectors[rows[has_vector]] @ np.asarray(resume_vector, dtype=np.float32)
+
+    scores = (hard_match_weight * coverage + semantic_weight * np.clip(similarity, 0.0, 1.0)) * 100
+    scores /= hard_match_weight + semantic_weight
+    top = np.argsort(-scores, kind='stable')[:k]
+    return [
+        {
+            'job_id': candidates[index],
+            'score': round(float(scores[index]), 2),
+            'skill_coverage': round(float(coverage[index]), 4),
+            'similarity': round(float(similarity[index]), 4)
+        }
+        for index in top
+    ]
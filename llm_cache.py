@@ -0,0 +1,108 @@
+"""
+LLM Cache Module
+Persistent cache of LLM responses keyed by the rendered prompt
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class LLMCache:
+    """SQLite-backed response cache with a TTL and size-bounded LRU eviction"""
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+            """)
+            self._connection.execute("""
+                CREATE INDEX IF NOT EXISTS idx_llm_responses_last_accessed
+                ON llm_responses(last_accessed)
+            """)
+
+    @staticmethod
+    def key_for(prompt: str, model: str, temperature: float) -> str:
+        """SHA-256 of the rendered prompt, model name and temperature"""
+        payload = f"{model}\0{temperature}\0{prompt}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None when missing or expired"""
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                'SELECT response, created_at FROM llm_responses WHERE key = ?', (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._connection.execute('DELETE FROM llm_responses WHERE key = ?', (key,))
+                self.misses += 1
+                return None
+
+            self._connection.execute('UPDATE llm_responses SET last_accessed = ? WHERE key = ?', (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str, model: str) -> None:
+        """Store a response, evicting the least recently used entries beyond max_entries"""
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO llm_responses (key, model, response, created_at, last_accessed) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, model, response, now, now)
+            )
+
+            entries = self._connection.execute('SELECT COUNT(*) FROM llm_responses').fetchone()[0]
+            if entries > self.max_entries:
+                self._connection.execute(
+                    'DELETE FROM llm_responses WHERE key IN '
+                    '(SELECT key FROM llm_responses ORDER BY last_accessed ASC LIMIT ?)',
+                    (entries - self.max_entries,)
+                )
+
+    def purge_expired(self) -> int:
+        """Delete all expired entries; returns how many were removed"""
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                'DELETE FROM llm_responses WHERE created_at < ?', (time.time() - self.ttl_seconds,)
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and size of the cache"""
+        with self._lock:
+            entries = self._connection.execute('SELECT COUNT(*) FROM llm_responses').fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'entries': entries,
+            'path': self.path
+        }
@@ -0,0 +1,202 @@
+"""
+LLM Client Module
+Asynchronous chat-completion client with bounded concurrency, a shared rate limit and retries
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Token bucket kept in a Redis hash so all worker processes draw from one budget.
+# Returns the seconds to wait before retrying (0 when a token was taken).
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'timestamp')
+local tokens = tonumber(state[1]) or capacity
+local timestamp = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - timestamp) * rate)
+
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'timestamp', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    """Raised when a completion request fails for good"""
+
+
+class LocalTokenBucket:
+    """In-process token bucket (used when Redis is not reachable)"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._timestamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take one token; returns 0, or the seconds to wait before trying again"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._timestamp) * self.rate)
+            self._timestamp = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+
+class RedisTokenBucket:
+    """Token bucket shared by all processes using the same Redis key"""
+
+    def __init__(self, redis_client, key: str, rate: float, capacity: float, fallback_cooldown: float = 30.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.key = key
+        self.fallback_cooldown = fallback_cooldown
+        self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+        self._fallback = LocalTokenBucket(rate, capacity)
+        self._fallback_until = 0.0
+
+    def try_acquire(self) -> float:
+        """Take one token; returns 0, or the seconds to wait before trying again"""
+        # While Redis is down, limit per process and try Redis again after the cooldown
+        if time.monotonic() >= self._fallback_until:
+            try:
+                return float(self._script(keys=[self.key], args=[self.rate, self.capacity]))
+            except Exception as e:
+                logger.warning(f"Redis rate limiter unavailable, limiting per process for "
+                               f"{self.fallback_cooldown:g}s: {e}")
+                self._fallback_until = time.monotonic() + self.fallback_cooldown
+        return self._fallback.try_acquire()
+
+
+def create_rate_limiter(redis_url: Optional[str], requests_per_minute: float, key: str = 'llm:rate_limit'):
+    """Redis-backed token bucket when a Redis URL is configured, else an in-process one"""
+    rate = requests_per_minute / 60.0
+    # Allow bursts of up to one second worth of requests
+    capacity = max(1.0, rate)
+    if redis_url:
+        try:
+            import redis
+            return RedisTokenBucket(redis.from_url(redis_url), key, rate, capacity)
+        except Exception as e:
+            logger.warning(f"Could not set up Redis rate limiter: {e}")
+    return LocalTokenBucket(rate, capacity)
+
+
+class LLMClient:
+    """Sends chat-completion requests to an OpenAI-compatible API, many at a time"""
+
+    def __init__(self, base_url: str, api_key: Optional[str], model: str, max_concurrency: int = 8,
+                 rate_limiter=None, max_retries: int = 5, timeout: float = 60.0,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def complete_many(self, prompts: List[str], temperature: float = 0.3, max_tokens: int = 500) -> List:
+        """Complete all prompts concurrently; each result is the response text or the exception raised"""
+        if not prompts:
+            return []
+        return asyncio.run(self.complete_many_async(prompts, temperature, max_tokens))
+
+    async def complete_many_async(self, prompts: List[str], temperature: float = 0.3,
+                                  max_tokens: int = 500) -> List:
+        """Async variant of complete_many, for callers already running an event loop"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        limits = httpx.Limits(max_connections=self.max_concurrency,
+                              max_keepalive_connections=self.max_concurrency)
+
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits) as client:
+            async def bounded(prompt):
+                async with semaphore:
+                    return await self.complete(client, prompt, temperature, max_tokens)
+
+            return await asyncio.gather(*(bounded(prompt) for prompt in prompts), return_exceptions=True)
+
+    async def complete(self, client: httpx.AsyncClient, prompt: str, temperature: float = 0.3,
+                       max_tokens: int = 500) -> str:
+        """Send one prompt, retrying rate-limited and server errors with jittered backoff"""
+        if not self.api_key:
+            raise LLMError('No API key provided (set OPENAI_API_KEY)')
+
+        payload = {
+            'model': self.model,
+            'messages': [{'role': 'user', 'content': prompt}],
+            'max_tokens': max_tokens,
+            'temperature': temperature
+        }
+        headers = {'Authorization': f'Bearer {self.api_key}'}
+
+        for attempt in range(self.max_retries + 1):
+            await self._acquire_rate_limit()
+
+            retry_after = None
+            try:
+                response = await client.post(f'{self.base_url}/chat/completions', json=payload, headers=headers)
+            except httpx.TransportError as e:
+                error = LLMError(f'Request failed: {e}')
+            else:
+                if response.status_code == 200:
+                    return response.json()['choices'][0]['message']['content']
+                error = LLMError(f'HTTP {response.status_code}: {response.text[:200]}')
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    raise error
+                retry_after = self._retry_after(response)
+
+            if attempt == self.max_retries:
+                raise error
+            if retry_after is None:
+                retry_after = self._backoff(attempt)
+            await asyncio.sleep(min(retry_after, self.backoff_max))
+
+    async def _acquire_rate_limit(self) -> None:
+        """Wait until the shared token bucket grants a request"""
+        if self.rate_limiter is None:
+            return
+        while True:
+            wait = self.rate_limiter.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Seconds requested by the server's Retry-After header, if any"""
+        try:
+            return max(0.0, float(response.headers['retry-after']))
+        except (KeyError, ValueError):
+            return None
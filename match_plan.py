@@ -0,0 +1,92 @@
+"""
+Match Plan Module
+Compiles the job-side inputs of the relevance engine once per job
+"""
+
+from typing import Dict, List, Optional
+
+# Bump whenever the plan layout or the way it is derived changes;
+# stored plans with another version are recompiled on next use.
+MATCH_PLAN_VERSION = 3
+
+
+def build_match_plan(job_requirements: Dict, embedding: Optional[List[float]] = None,
+                     model_name: str = '', model_version: str = '', tfidf_index=None,
+                     chunk_embeddings: Optional[List[List[float]]] = None, chunking: str = '') -> Dict:
+    """Normalize the parsed job requirements into a JSON-serializable match plan"""
+    must_have_skills = list(job_requirements.get('must_have_skills', []))
+    good_to_have_skills = list(job_requirements.get('good_to_have_skills', []))
+    technical_requirements = list(job_requirements.get('technical_requirements', []))
+    certifications = list(job_requirements.get('certifications', []))
+
+    required_skills = must_have_skills + good_to_have_skills + technical_requirements
+    required_skills_text = skills_text(required_skills)
+
+    return {
+        'version': MATCH_PLAN_VERSION,
+        'model_name': model_name,
+        'model_version': str(model_version),
+        'required_skills': required_skills,
+        'required_skills_lower': [skill.lower() for skill in required_skills],
+        'must_have_mask': [True] * len(must_have_skills) + [False] * (len(required_skills) - len(must_have_skills)),
+        'required_skills_text': required_skills_text,
+        'tfidf': tfidf_index.term_counts(required_skills_text) if tfidf_index is not None else None,
+        'certifications': certifications,
+        'certifications_lower': [cert.lower() for cert in certifications],
+        'project_types': infer_required_project_types(technical_requirements),
+        'embedding': [float(value) for value in embedding] if embedding is not None else None,
+        'chunking': chunking,
+        'chunk_embeddings': [
+            [float(value) for value in chunk_embedding] for chunk_embedding in chunk_embeddings
+        ] if chunk_embeddings is not None else None
+    }
+
+
+def is_current(plan: Optional[Dict], model_name: str, model_version: str, chunking: str = '') -> bool:
+    """Check that a stored plan was compiled with this plan version, embedding model and chunking"""
+    return bool(plan) and (
+        plan.get('version') == MATCH_PLAN_VERSION and
+        plan.get('model_name') == model_name and
+        plan.get('model_version') == str(model_version) and
+        plan.get('chunking') == chunking and
+        plan.get('embedding') is not None and
+        plan.get('chunk_embeddings') is not None and
+        plan.get('tfidf') is not None
+    )
+
+
+def skills_text(skills: List[str]) -> str:
+    """Skill list as the single lowercased document used for TF-IDF"""
+    return ' '.join(skills).lower()
+
+
+def job_skills_text(job_requirements: Dict) -> str:
+    """The document a job contributes to the TF-IDF corpus"""
+    return skills_text(
+        list(job_requirements.get('must_have_skills', [])) +
+        list(job_requirements.get('good_to_have_skills', [])) +
+        list(job_requirements.get('technical_requirements', []))
+    )
+
+
+def infer_required_project_types(technical_skills: List[str]) -> List[str]:
+    """Infer required project types from technical requirements"""
+    project_types = []
+    technical_skills = [skill.lower() for skill in technical_skills]
+
+    if any('web' in skill or 'frontend' in skill for skill in technical_skills):
+        project_types.append('Web Application')
+
+    if any('mobile' in skill or 'android' in skill or 'ios' in skill for skill in technical_skills):
+        project_types.append('Mobile Application')
+
+    if any('machine learning' in skill or 'ai' in skill or 'data science' in skill for skill in technical_skills):
+        project_types.append('Machine Learning Project')
+
+    if any('database' in skill or 'sql' in skill for skill in technical_skills):
+        project_types.append('Database Project')
+
+    if any('api' in skill or 'microservice' in skill for skill in technical_skills):
+        project_types.append('API Development')
+
+    return project_types
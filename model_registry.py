@@ -0,0 +1,327 @@
+"""
+Model Registry Module
+Loads scoring models once per process and shares them across tasks
+"""
+
+import logging
+import os
+import resource
+import threading
+import time
+from typing import Dict, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# spaCy components the parsers never use (only named entities are read)
+SPACY_DISABLED_COMPONENTS = ['tagger', 'parser', 'attribute_ruler', 'lemmatizer']
+
+_lock = threading.RLock()
+_sentence_models: Dict[str, object] = {}
+_load_times: Dict[str, float] = {}
+_embedding_stores: Dict[str, object] = {}
+_tfidf_index = None
+_skill_table = None
+_skill_index = None
+_vector_indexes: Dict[str, object] = {}
+_llm_cache = None
+_llm_client = None
+_relevance_engine = None
+_spacy_nlp = None
+_spacy_loaded = False
+_resume_parser = None
+_jd_parser = None
+_text_extractor = None
+_warm_up_time: Optional[float] = None
+
+
+def get_sentence_model(model_name: str = None):
+    """Return the process-wide sentence embedding model, loading it on first use"""
+    model_name = model_name or Config.SENTENCE_TRANSFORMER_MODEL
+    model = _sentence_models.get(model_name)
+    if model is None:
+        with _lock:
+            model = _sentence_models.get(model_name)
+            if model is None:
+                from embedding_backends import load_backend
+
+                start_time = time.time()
+                model = load_backend(Config.EMBEDDING_BACKEND, model_name, Config.ONNX_MODEL_DIR,
+                                     Config.EMBEDDING_NUM_THREADS)
+                _load_times[model_name] = time.time() - start_time
+                _sentence_models[model_name] = model
+                logger.info(f"Loaded sentence model {model_name} ({Config.EMBEDDING_BACKEND}) "
+                            f"in {_load_times[model_name]:.2f}s")
+    return model
+
+
+def embedding_version() -> str:
+    """Version key of the embeddings: model version plus backend, since backends differ slightly"""
+    if Config.EMBEDDING_BACKEND == 'torch':
+        return Config.EMBEDDING_MODEL_VERSION
+    return f"{Config.EMBEDDING_MODEL_VERSION}+{Config.EMBEDDING_BACKEND}"
+
+
+def embedding_key(model_name: str = None) -> str:
+    """Model and version of the embeddings: vectors with different keys are not comparable"""
+    return f"{model_name or Config.SENTENCE_TRANSFORMER_MODEL}@{embedding_version()}"
+
+
+def get_spacy_nlp():
+    """Return the process-wide spaCy pipeline (NER only), or None when the model is not installed"""
+    global _spacy_nlp, _spacy_loaded
+    if not _spacy_loaded:
+        with _lock:
+            if not _spacy_loaded:
+                import spacy
+
+                start_time = time.time()
+                try:
+                    # Only doc.ents is used: skip tagging, parsing and lemmatization
+                    _spacy_nlp = spacy.load(Config.SPACY_MODEL, disable=SPACY_DISABLED_COMPONENTS)
+                    _load_times[Config.SPACY_MODEL] = time.time() - start_time
+                    logger.info(f"Loaded spaCy model {Config.SPACY_MODEL} in {_load_times[Config.SPACY_MODEL]:.2f}s")
+                except OSError:
+                    print(f"Warning: spaCy model not found. Install with: python -m spacy download {Config.SPACY_MODEL}")
+                    _spacy_nlp = None
+                _spacy_loaded = True
+    return _spacy_nlp
+
+
+def get_resume_parser():
+    """Return the process-wide resume parser"""
+    global _resume_parser
+    if _resume_parser is None:
+        with _lock:
+            if _resume_parser is None:
+                from resume_parser import ResumeParser
+                _resume_parser = ResumeParser()
+    return _resume_parser
+
+
+def get_text_extractor():
+    """Return the process-wide text extractor (its worker pool starts on first use)"""
+    global _text_extractor
+    if _text_extractor is None:
+        with _lock:
+            if _text_extractor is None:
+                from text_extraction import TextExtractor
+                _text_extractor = TextExtractor(
+                    max_workers=Config.EXTRACTION_WORKERS,
+                    pages_per_task=Config.EXTRACTION_PAGES_PER_TASK,
+                    max_pages=Config.EXTRACTION_MAX_PAGES,
+                    timeout=Config.EXTRACTION_TIMEOUT
+                )
+    return _text_extractor
+
+
+def get_jd_parser():
+    """Return the process-wide job description parser"""
+    global _jd_parser
+    if _jd_parser is None:
+        with _lock:
+            if _jd_parser is None:
+                from jd_parser import JobDescriptionParser
+                _jd_parser = JobDescriptionParser()
+    return _jd_parser
+
+
+def get_embedding_store(model_name: str = None):
+    """Return the process-wide embedding cache for a model, or None when disabled"""
+    if not Config.EMBEDDING_CACHE_ENABLED:
+        return None
+
+    model_name = model_name or Config.SENTENCE_TRANSFORMER_MODEL
+    store = _embedding_stores.get(model_name)
+    if store is None:
+        with _lock:
+            store = _embedding_stores.get(model_name)
+            if store is None:
+                from embedding_store import EmbeddingStore
+                store = EmbeddingStore(Config.EMBEDDING_CACHE_DIR, model_name, embedding_version())
+                _embedding_stores[model_name] = store
+    return store
+
+
+def get_tfidf_index():
+    """Return the process-wide corpus TF-IDF index"""
+    global _tfidf_index
+    if _tfidf_index is None:
+        with _lock:
+            if _tfidf_index is None:
+                from tfidf_index import CorpusTfidf
+                _tfidf_index = CorpusTfidf(Config.TFIDF_INDEX_PATH, Config.TFIDF_N_FEATURES)
+    return _tfidf_index
+
+
+def get_skill_similarity_table():
+    """Return the process-wide skill similarity table, or None when disabled (built on first use if missing)"""
+    global _skill_table
+    if not Config.SKILL_SIMILARITY_TABLE_ENABLED:
+        return None
+
+    if _skill_table is None:
+        with _lock:
+            if _skill_table is None:
+                from skill_similarity import load_or_build_table
+                _skill_table = load_or_build_table(Config.SKILL_SIMILARITY_TABLE_PATH,
+                                                   Config.SKILL_SIMILARITY_OOV_CACHE_SIZE)
+    return _skill_table
+
+
+def get_skill_index():
+    """Return the process-wide resume/job x skill index"""
+    global _skill_index
+    if _skill_index is None:
+        with _lock:
+            if _skill_index is None:
+                from skill_index import SkillIndex
+                _skill_index = SkillIndex(Config.SKILL_INDEX_PATH, Config.SKILL_INDEX_MUST_HAVE_WEIGHT)
+    return _skill_index
+
+
+def get_vector_index(name: str):
+    """Return the process-wide nearest-neighbour index of resume or job embeddings ('resumes', 'jobs')"""
+    index = _vector_indexes.get(name)
+    if index is None:
+        with _lock:
+            index = _vector_indexes.get(name)
+            if index is None:
+                from vector_index import VectorIndex
+                index = VectorIndex(os.path.join(Config.VECTOR_INDEX_DIR, name), name, embedding_key(),
+                                    Config.CHROMA_HOST, Config.CHROMA_PORT)
+                _vector_indexes[name] = index
+    return index
+
+
+def get_llm_cache():
+    """Return the process-wide LLM response cache, or None when disabled"""
+    global _llm_cache
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+
+    if _llm_cache is None:
+        with _lock:
+            if _llm_cache is None:
+                from llm_cache import LLMCache
+                _llm_cache = LLMCache(Config.LLM_CACHE_PATH, Config.LLM_CACHE_TTL, Config.LLM_CACHE_MAX_ENTRIES)
+    return _llm_cache
+
+
+def get_llm_client():
+    """Return the process-wide LLM client (rate limit shared across processes through Redis)"""
+    global _llm_client
+    if _llm_client is None:
+        with _lock:
+            if _llm_client is None:
+                from llm_client import LLMClient, create_rate_limiter
+                _llm_client = LLMClient(
+                    Config.LLM_API_BASE,
+                    Config.OPENAI_API_KEY,
+                    Config.OPENAI_MODEL,
+                    max_concurrency=Config.LLM_MAX_CONCURRENCY,
+                    rate_limiter=create_rate_limiter(Config.REDIS_URL, Config.LLM_REQUESTS_PER_MINUTE),
+                    max_retries=Config.LLM_MAX_RETRIES,
+                    timeout=Config.LLM_REQUEST_TIMEOUT
+                )
+    return _llm_client
+
+
+def get_relevance_engine():
+    """Return the process-wide relevance engine"""
+    global _relevance_engine
+    if _relevance_engine is None:
+        with _lock:
+            if _relevance_engine is None:
+                from relevance_engine import RelevanceEngine
+                _relevance_engine = RelevanceEngine()
+    return _relevance_engine
+
+
+def warm_up() -> Dict:
+    """Load all scoring models and run a dummy encode so the first task is not slowed down"""
+    global _warm_up_time
+    start_time = time.time()
+    engine = get_relevance_engine()
+    engine.sentence_model.encode(["warm up"])
+    get_resume_parser()
+    _warm_up_time = time.time() - start_time
+    logger.info(f"Scoring models warmed up in {_warm_up_time:.2f}s")
+    return get_status()
+
+
+def reset() -> None:
+    """Drop all loaded models (used by benchmarks and tests)"""
+    global _relevance_engine, _tfidf_index, _skill_table, _skill_index, _llm_cache, _llm_client, _warm_up_time
+    global _spacy_nlp, _spacy_loaded, _resume_parser, _jd_parser, _text_extractor
+    with _lock:
+        if _text_extractor is not None:
+            _text_extractor.shutdown()
+        _sentence_models.clear()
+        _load_times.clear()
+        _embedding_stores.clear()
+        _vector_indexes.clear()
+        _tfidf_index = None
+        _skill_table = None
+        _skill_index = None
+        _llm_cache = None
+        _llm_client = None
+        _relevance_engine = None
+        _spacy_nlp = None
+        _spacy_loaded = False
+        _resume_parser = None
+        _jd_parser = None
+        _text_extractor = None
+        _warm_up_time = None
+
+
+def get_status() -> Dict:
+    """Report load state and memory footprint of the models in this process"""
+    models = {}
+    for model_name, model in _sentence_models.items():
+        models[model_name] = {
+            'loaded': True,
+            'backend': getattr(model, 'name', None),
+            'load_time': round(_load_times.get(model_name, 0.0), 3),
+            'parameter_bytes': _parameter_bytes(model),
+        }
+
+    return {
+        'pid': os.getpid(),
+        'engine_loaded': _relevance_engine is not None,
+        'warmed_up': _warm_up_time is not None,
+        'warm_up_time': round(_warm_up_time, 3) if _warm_up_time is not None else None,
+        'models': models,
+        'embedding_cache': {name: store.stats() for name, store in _embedding_stores.items()},
+        'spacy': {
+            'model': Config.SPACY_MODEL,
+            'loaded': _spacy_nlp is not None,
+            'pipeline': _spacy_nlp.pipe_names if _spacy_nlp is not None else [],
+            'load_time': round(_load_times.get(Config.SPACY_MODEL, 0.0), 3),
+        },
+        'tfidf_corpus': _tfidf_index.stats() if _tfidf_index is not None else None,
+        'skill_similarity_table': _skill_table.stats() if _skill_table is not None else None,
+        'skill_index': _skill_index.stats() if _skill_index is not None else None,
+        'vector_indexes': {name: index.stats() for name, index in _vector_indexes.items()},
+        'llm_cache': _llm_cache.stats() if _llm_cache is not None else None,
+        'process_rss_mb': round(_process_rss_bytes() / (1024 * 1024), 1),
+    }
+
+
+def _parameter_bytes(model) -> int:
+    """Size of the model weights in bytes"""
+    try:
+        return int(model.parameter_bytes())
+    except Exception:
+        return 0
+
+
+def _process_rss_bytes() -> int:
+    """Current resident set size of this process"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        # Peak RSS, reported in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
@@ -17,6 +17,7 @@ class Job(db.Model):
     location = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
     requirements = db.Column(JSON)  # Must-have skills, good-to-have skills, qualifications
+    match_plan = db.Column(JSON)  # Compiled scoring inputs derived from requirements (see match_plan.py)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = db.Column(db.Boolean, default=True)
@@ -45,8 +46,9 @@ class Resume(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     filename = db.Column(db.String(255), nullable=False)
     original_filename = db.Column(db.String(255), nullable=False)
-    file_path = db.Column(db.String(500), nullable=False)
+    file_path = db.Column(db.String(500), nullable=False)  # Storage uri (local://, s3://) or legacy path
     file_type = db.Column(db.String(10), nullable=False)  # PDF, DOCX
+    content_hash = db.Column(db.String(64), index=True)  # SHA-256 of the uploaded file
     student_name = db.Column(db.String(200), nullable=False)
     student_email = db.Column(db.String(255), nullable=False)
     student_phone = db.Column(db.String(20))
@@ -65,6 +67,7 @@ class Resume(db.Model):
             'filename': self.filename,
             'original_filename': self.original_filename,
             'file_type': self.file_type,
+            'content_hash': self.content_hash,
             'student_name': self.student_name,
             'student_email': self.student_email,
             'student_phone': self.student_phone,
@@ -75,6 +78,22 @@ class Resume(db.Model):
             'is_processed': self.is_processed,
             'evaluation_count': len(self.evaluations)
         }
+    
+    def processed_twin(self):
+        """Another resume with the same file content that has already been parsed"""
+        if not self.content_hash:
+            return None
+        return Resume.query.filter(
+            Resume.content_hash == self.content_hash,
+            Resume.is_processed.is_(True),
+            Resume.id != self.id
+        ).first()
+    
+    def copy_parsed_data(self, other: 'Resume') -> None:
+        """Reuse the extracted text and parsed data of a resume with the same file content"""
+        self.extracted_text = other.extracted_text
+        self.parsed_data = other.parsed_data
+        self.is_processed = True
 
 class Evaluation(db.Model):
     """Resume Evaluation Results Model"""
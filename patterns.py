@@ -0,0 +1,135 @@
+"""
+Patterns Module
+Regular expressions and keyword lists shared by the resume and job description parsers, compiled once per process
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to one combined regular expression
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Finds which keyword groups occur anywhere in a text, in one scan of the text"""
+
+    def __init__(self, keyword_groups: Dict[str, Iterable[str]]):
+        groups_by_keyword: Dict[str, set] = {}
+        for group, keywords in keyword_groups.items():
+            for keyword in keywords:
+                groups_by_keyword.setdefault(keyword, set()).add(group)
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, groups in groups_by_keyword.items():
+                self._automaton.add_word(keyword, frozenset(groups))
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            # A lookahead finds a match at every position, overlapping ones included. At one
+            # position only the longest keyword is reported, so it also carries the groups
+            # of the keywords that are its prefixes.
+            self._groups = {
+                keyword: frozenset().union(*(
+                    other_groups for other, other_groups in groups_by_keyword.items() if keyword.startswith(other)
+                ))
+                for keyword in groups_by_keyword
+            }
+            alternatives = sorted(groups_by_keyword, key=len, reverse=True)
+            self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, alternatives)) + '))')
+
+    def groups(self, text: str) -> FrozenSet[str]:
+        """All groups with at least one keyword contained in text"""
+        if not text:
+            return frozenset()
+        if self._automaton is not None:
+            return frozenset().union(*(groups for _, groups in self._automaton.iter(text)))
+        return frozenset().union(*(self._groups[match.group(1)] for match in self._pattern.finditer(text)))
+
+
+# Text cleaning (both parsers)
+WHITESPACE = re.compile(r'\s+')
+DISALLOWED_CHARACTERS = re.compile(r'[^\w\s\.\,\;\:\!\?\-\(\)]')
+
+# Separators of skill lists and of bulleted items
+SKILL_SEPARATORS = re.compile(r'[,;|•\-\n]')
+LIST_ITEM_SEPARATORS = re.compile(r'[•\-\*\n]')
+
+# Contact details
+EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE = re.compile(r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})')
+LINKEDIN = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+
+# 2020-2023, 2020 to 2023, 01/2020-12/2023
+DATE_RANGE = re.compile(r'\d{4}\s*-\s*\d{4}|\d{4}\s*to\s*\d{4}|\d{1,2}/\d{4}\s*-\s*\d{1,2}/\d{4}')
+
+# Resume line keyword groups; a line belongs to a group when its lowercased
+# text contains any of the group's keywords
+RESUME_LINE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'summary': ('summary', 'objective', 'profile', 'about', 'overview'),
+    'experience': ('experience', 'employment', 'work history', 'career'),
+    'education': ('education', 'academic', 'qualification', 'degree'),
+    'degree': ('bachelor', 'master', 'phd', 'diploma', 'certificate', 'degree'),
+    'institution': ('university', 'college', 'institute'),
+    'skills': ('skills', 'technical skills', 'technologies', 'tools'),
+    'certifications': ('certification', 'certificate', 'certified', 'license'),
+    'projects': ('projects', 'project', 'portfolio'),
+    'achievements': ('achievement', 'award', 'recognition', 'honor'),
+    'job_title': ('engineer', 'developer', 'analyst', 'manager', 'director', 'lead', 'senior', 'junior'),
+    'company': ('inc', 'corp', 'ltd', 'llc', 'company', 'technologies', 'solutions'),
+    'date_word': ('present', 'current'),
+}
+RESUME_LINE_MATCHER = KeywordMatcher(RESUME_LINE_KEYWORDS)
+
+# Job description line keyword groups: section headings and requirement lines
+JD_LINE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'title': ('engineer', 'developer', 'analyst', 'manager', 'specialist', 'consultant', 'architect'),
+    'company': ('inc', 'corp', 'ltd', 'llc', 'company', 'technologies', 'solutions', 'systems'),
+    'must_have': ('must have', 'required', 'mandatory', 'essential'),
+    'good_to_have': ('good to have', 'preferred', 'nice to have', 'desired', 'optional'),
+    'responsibilities': ('responsibilities', 'duties', 'role', 'what you will do'),
+    'benefits': ('benefits', 'perks', 'compensation', 'package'),
+    'qualifications': ('bachelor', 'master', 'phd', 'diploma', 'degree', 'certification', 'qualification'),
+    'education': ('bachelor', 'master', 'phd', 'diploma', 'degree', 'education', 'qualification'),
+    'certifications': ('certification', 'certificate', 'certified', 'license', 'accreditation'),
+}
+JD_LINE_MATCHER = KeywordMatcher(JD_LINE_KEYWORDS)
+
+# Job description fields
+JD_LOCATIONS = (
+    re.compile(r'(?:in|at|based in|located in)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE),
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*(?:India|USA|UK|Canada|Australia)', re.IGNORECASE),
+)
+# Matched against lowercased text, in order
+JD_EXPERIENCE_LEVELS = (
+    ('entry', re.compile(r'(?:entry|fresher|0-1|0-2)\s*(?:years?|yrs?)')),
+    ('junior', re.compile(r'(?:junior|1-3|2-4)\s*(?:years?|yrs?)')),
+    ('mid', re.compile(r'(?:mid|3-5|4-6|5-7)\s*(?:years?|yrs?)')),
+    ('senior', re.compile(r'(?:senior|5-8|6-10|7-12)\s*(?:years?|yrs?)')),
+    ('lead', re.compile(r'(?:lead|principal|8-12|10-15)\s*(?:years?|yrs?)')),
+    ('executive', re.compile(r'(?:executive|director|15\+|12\+)\s*(?:years?|yrs?)')),
+)
+JD_SALARIES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*-\s*₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:lpa|lakhs?|crores?|k|thousand)',
+    r'₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:lpa|lakhs?|crores?|k|thousand)\s*-\s*₹?\s*(\d+(?:,\d{3})*(?:\.\d{2})?)\s*(?:lpa|lakhs?|crores?|k|thousand)',
+    r'(\d+)\s*-\s*(\d+)\s*(?:lpa|lakhs?|crores?)',
+))
+
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace and drop characters other than word characters and basic punctuation"""
+    text = WHITESPACE.sub(' ', text)
+    text = DISALLOWED_CHARACTERS.sub('', text)
+    return text.strip()
+
+
+@lru_cache(maxsize=16)
+def jd_lines(text: str) -> Tuple[Tuple[str, FrozenSet[str]], ...]:
+    """Stripped lines of a job description with their keyword groups.
+
+    Cached, so the extractors of one parse share a single classification pass.
+    """
+    return tuple((line, JD_LINE_MATCHER.groups(line.lower())) for line in (raw.strip() for raw in text.split('\n')))
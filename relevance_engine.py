@@ -3,30 +3,53 @@ Relevance Engine Module
 Implements hybrid scoring system combining hard and semantic matching
 """
 
-import os
-import openai
-from sentence_transformers import SentenceTransformer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from fuzzywuzzy import fuzz
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 import json
+from config import Config
+from model_registry import (
+    embedding_version, get_embedding_store, get_llm_cache, get_llm_client, get_sentence_model,
+    get_skill_similarity_table, get_tfidf_index
+)
+from match_plan import build_match_plan, is_current as match_plan_is_current, skills_text
+from skill_similarity import SkillSimilarityMatrix, MATCH_THRESHOLD
+from semantic_chunks import chunk_job, chunk_resume
+from vector_index import mean_embedding
 
 class RelevanceEngine:
-    def __init__(self):
-        # Initialize OpenAI
-        openai.api_key = os.getenv('OPENAI_API_KEY')
+    def __init__(self, sentence_model=None, embedding_store=None, tfidf_index=None, llm_cache=None,
+                 llm_client=None, skill_table=None):
+        # OpenAI-compatible chat client (concurrent, rate limited across workers)
+        self.llm_client = llm_client or get_llm_client()
+        self.llm_model = self.llm_client.model
+        self.llm_temperature = 0.3
+        
+        # Cache of LLM responses keyed by rendered prompt, model and temperature
+        self.llm_cache = llm_cache or get_llm_cache()
         
         # Initialize sentence transformer for semantic similarity
-        self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # (shared per process through the model registry unless one is passed in)
+        self.model_name = Config.SENTENCE_TRANSFORMER_MODEL
+        self.embedding_version = embedding_version()
+        self.sentence_model = sentence_model or get_sentence_model(self.model_name)
         
-        # Initialize TF-IDF vectorizer for hard matching
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=1000,
-            stop_words='english',
-            ngram_range=(1, 2)
-        )
+        # Content-addressed embedding cache, consulted before calling the model
+        self.embedding_store = embedding_store or get_embedding_store(self.model_name)
+        
+        # Chunking settings the job chunk embeddings of a match plan were compiled with
+        if Config.SEMANTIC_CHUNKING:
+            self.chunking = f"{Config.SEMANTIC_CHUNK_WORDS}w/{Config.SEMANTIC_MAX_JOB_CHUNKS}"
+        else:
+            self.chunking = 'off'
+        
+        # Corpus-level TF-IDF for hard matching (document frequencies over all resumes and jobs)
+        self.tfidf_index = tfidf_index or get_tfidf_index()
+        
+        # Precomputed skill-to-skill similarities: hard matching becomes table lookups
+        self.skill_table = skill_table or get_skill_similarity_table()
+        
+        # Skip the LLM when hard match and semantic scores already decide the verdict
+        self.cascade_scoring = Config.CASCADE_SCORING
         
         # Weights for different scoring components
         self.weights = {
@@ -35,28 +58,115 @@ class RelevanceEngine:
             'llm_reasoning': 0.2
         }
     
-    def evaluate_relevance(self, resume_data: Dict, job_requirements: Dict) -> Dict:
+    def evaluate_relevance(self, resume_data: Dict, job_requirements: Dict, match_plan: Dict = None) -> Dict:
         """Main method to evaluate resume relevance against job requirements"""
         
+        # Job-side work is precompiled once per job
+        plan = self._resolve_match_plan(job_requirements, match_plan)
+        
         # Extract text for analysis
         resume_text = resume_data.get('raw_text', '')
-        job_description = job_requirements.get('description', '')
-        
-        # Step 1: Hard Match (Keyword and skill matching)
-        hard_match_score, hard_match_details = self._calculate_hard_match_score(
-            resume_data, job_requirements
-        )
         
-        # Step 2: Semantic Match (Embedding similarity)
+        # Semantic Match (Chunk-by-chunk embedding similarity)
         semantic_score, semantic_details = self._calculate_semantic_score(
-            resume_text, job_description
+            resume_text, plan['chunk_embeddings']
         )
         
-        # Step 3: LLM Reasoning (Contextual understanding)
-        llm_score, llm_details = self._calculate_llm_score(
-            resume_data, job_requirements
+        return self._score_resume(resume_data, job_requirements, plan, semantic_score, semantic_details)
+    
+    def evaluate_many(self, resumes: List[Dict], job_requirements: Dict, batch_size: int = None,
+                      match_plan: Dict = None) -> List[Dict]:
+        """Evaluate many resumes against one job, embedding all resumes in batched calls"""
+        if not resumes:
+            return []
+        
+        batch_size = batch_size or Config.EMBEDDING_BATCH_SIZE
+        plan = self._resolve_match_plan(job_requirements, match_plan)
+        
+        # Embed the chunks of all resumes in batches, then score against the job chunks at once
+        semantic_results = self._calculate_semantic_scores(
+            [resume.get('raw_text', '') for resume in resumes],
+            plan['chunk_embeddings'],
+            batch_size=batch_size
         )
         
+        # Cheap stages first, so the cascade knows which resumes still need the LLM
+        hard_matches = [self._run_hard_match(resume_data, plan) for resume_data in resumes]
+        llm_results = [
+            self._cascade_llm_estimate(hard_match[2], semantic_score, semantic_details)
+            for hard_match, (semantic_score, semantic_details) in zip(hard_matches, semantic_results)
+        ]
+        
+        # LLM reasoning for the remaining resumes, many requests in flight at once
+        pending = [index for index, llm_result in enumerate(llm_results) if llm_result is None]
+        pending_results = self._calculate_llm_scores([resumes[index] for index in pending], job_requirements)
+        for index, llm_result in zip(pending, pending_results):
+            llm_results[index] = llm_result
+        
+        return [
+            self._score_resume(resume_data, job_requirements, plan, semantic_score, semantic_details,
+                               llm_result, hard_match)
+            for resume_data, (semantic_score, semantic_details), llm_result, hard_match
+            in zip(resumes, semantic_results, llm_results, hard_matches)
+        ]
+    
+    def compile_match_plan(self, job_requirements: Dict, description: str = None) -> Dict:
+        """Precompute the job-side inputs of scoring (normalized skills, masks, embedding)"""
+        if description is None:
+            description = job_requirements.get('description', '')
+        
+        try:
+            # Whole description and its chunks in one batched call
+            job_chunks = self._job_chunks(job_requirements, description)
+            embeddings = self._encode_texts([description] + job_chunks)
+            embedding, chunk_embeddings = embeddings[0], embeddings[1:].tolist()
+        except Exception:
+            # Plan stays incomplete and is recompiled on next use
+            embedding, chunk_embeddings = None, None
+        
+        return build_match_plan(job_requirements, embedding, self.model_name, self.embedding_version,
+                                tfidf_index=self.tfidf_index, chunk_embeddings=chunk_embeddings,
+                                chunking=self.chunking)
+    
+    def embed_resumes(self, resume_texts: List[str], batch_size: int = None) -> List[Optional[np.ndarray]]:
+        """One unit vector per resume, the mean of its chunk embeddings (shared with semantic matching)"""
+        resume_chunks = [self._resume_chunks(text) for text in resume_texts]
+        chunks = [chunk for chunks in resume_chunks for chunk in chunks]
+        embeddings = self._encode_texts(chunks, batch_size=batch_size) if chunks else np.zeros((0, 0))
+        offsets = np.cumsum([0] + [len(chunks) for chunks in resume_chunks])
+        return [mean_embedding(embeddings[start:end]) for start, end in zip(offsets[:-1], offsets[1:])]
+    
+    def is_match_plan_current(self, match_plan: Dict) -> bool:
+        """Check whether a stored match plan can be used by this engine"""
+        return match_plan_is_current(match_plan, self.model_name, self.embedding_version, self.chunking)
+    
+    def _resolve_match_plan(self, job_requirements: Dict, match_plan: Dict = None) -> Dict:
+        """Use the stored match plan when current, otherwise compile one on the fly"""
+        if self.is_match_plan_current(match_plan):
+            return match_plan
+        return self.compile_match_plan(job_requirements)
+    
+    def _score_resume(self, resume_data: Dict, job_requirements: Dict, plan: Dict,
+                      semantic_score: float, semantic_details: Dict, llm_result: Tuple[float, Dict] = None,
+                      hard_match: Tuple = None) -> Dict:
+        """Combine a precomputed semantic score with hard match and LLM reasoning"""
+        
+        # Step 1: Hard Match (Keyword and skill matching), unless already computed for a batch
+        if hard_match is None:
+            hard_match = self._run_hard_match(resume_data, plan)
+        skill_matrix, cert_matrix, hard_match_score, hard_match_details = hard_match
+        
+        # Step 2: LLM Reasoning (Contextual understanding), skipped when the cheap scores are decisive
+        if llm_result is None:
+            llm_result = self._cascade_llm_estimate(hard_match_score, semantic_score, semantic_details)
+        if llm_result is None:
+            llm_result = self._calculate_llm_score(resume_data, job_requirements)
+        llm_score, llm_details = llm_result
+        
+        stages = ['hard_match', 'semantic_match']
+        if not llm_details.get('skipped'):
+            stages.append('llm_reasoning')
+        
         # Calculate weighted final score
         final_score = (
             hard_match_score * self.weights['hard_match'] +
@@ -68,7 +178,7 @@ class RelevanceEngine:
         verdict = self._determine_verdict(final_score)
         
         # Generate missing elements and feedback
-        missing_elements = self._identify_missing_elements(resume_data, job_requirements)
+        missing_elements = self._identify_missing_elements(resume_data, plan, skill_matrix, cert_matrix)
         feedback = self._generate_feedback(resume_data, job_requirements, final_score, missing_elements)
         
         return {
@@ -80,10 +190,11 @@ class RelevanceEngine:
             'missing_skills': missing_elements.get('skills', []),
             'missing_certifications': missing_elements.get('certifications', []),
             'missing_projects': missing_elements.get('projects', []),
-            'strengths': self._identify_strengths(resume_data, job_requirements),
-            'weaknesses': self._identify_weaknesses(resume_data, job_requirements),
+            'strengths': self._identify_strengths(resume_data, plan, skill_matrix),
+            'weaknesses': self._identify_weaknesses(resume_data, job_requirements, missing_elements),
             'improvement_suggestions': feedback.get('suggestions', ''),
             'detailed_feedback': feedback.get('detailed', ''),
+            'stages': stages,
             'scoring_details': {
                 'hard_match': hard_match_details,
                 'semantic_match': semantic_details,
@@ -91,41 +202,90 @@ class RelevanceEngine:
             }
         }
     
-    def _calculate_hard_match_score(self, resume_data: Dict, job_requirements: Dict) -> Tuple[float, Dict]:
+    def _run_hard_match(self, resume_data: Dict, plan: Dict) -> Tuple:
+        """Similarity matrices and hard match score of one resume"""
+        # Fuzzy similarity of every (required, resume) pair, shared by all skill checks
+        skill_matrix, cert_matrix = self._build_similarity_matrices(resume_data, plan)
+        hard_match_score, hard_match_details = self._calculate_hard_match_score(
+            resume_data, plan, skill_matrix
+        )
+        return skill_matrix, cert_matrix, hard_match_score, hard_match_details
+    
+    def _cascade_llm_estimate(self, hard_match_score: float, semantic_score: float,
+                              semantic_details: Dict) -> Optional[Tuple[float, Dict]]:
+        """Stand-in LLM result when no LLM score could change the verdict, else None"""
+        if not self.cascade_scoring or 'error' in semantic_details:
+            return None
+        
+        partial_score = (
+            hard_match_score * self.weights['hard_match'] +
+            semantic_score * self.weights['semantic_match']
+        )
+        lowest_verdict = self._determine_verdict(partial_score)
+        highest_verdict = self._determine_verdict(partial_score + 100 * self.weights['llm_reasoning'])
+        if lowest_verdict != highest_verdict:
+            return None
+        
+        # Renormalize the cheap scores so the final score stays on the same scale
+        estimate = float(partial_score / (self.weights['hard_match'] + self.weights['semantic_match']))
+        return estimate, {
+            'skipped': True,
+            'reason': f"Verdict is {lowest_verdict} for any LLM score",
+            'estimated_score': round(estimate, 2)
+        }
+    
+    def _build_similarity_matrices(self, resume_data: Dict, plan: Dict) -> Tuple[SkillSimilarityMatrix, SkillSimilarityMatrix]:
+        """Build the skill and certification similarity matrices for one resume"""
+        structured_resume = resume_data.get('structured_data', {})
+        skill_matrix = SkillSimilarityMatrix(
+            plan['required_skills'], structured_resume.get('skills', []), plan['required_skills_lower'],
+            self.skill_table
+        )
+        cert_matrix = SkillSimilarityMatrix(
+            plan['certifications'], structured_resume.get('certifications', []), plan['certifications_lower'],
+            self.skill_table
+        )
+        return skill_matrix, cert_matrix
+    
+    def _encode_texts(self, texts: List[str], batch_size: int = None) -> np.ndarray:
+        """Embed texts, reading from the embedding cache before calling the model"""
+        batch_size = batch_size or Config.EMBEDDING_BATCH_SIZE
+        
+        def encode(batch):
+            return self.sentence_model.encode(batch, batch_size=batch_size)
+        
+        if self.embedding_store is None:
+            return np.asarray(encode(texts), dtype=np.float32)
+        return self.embedding_store.encode(texts, encode)
+    
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize embedding rows so dot products are cosine similarities"""
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
+    def _calculate_hard_match_score(self, resume_data: Dict, plan: Dict,
+                                    skill_matrix: SkillSimilarityMatrix) -> Tuple[float, Dict]:
         """Calculate hard match score based on keyword and skill matching"""
         structured_resume = resume_data.get('structured_data', {})
         
         # Extract skills from resume
         resume_skills = structured_resume.get('skills', [])
-        resume_skills_text = ' '.join(resume_skills).lower()
-        
-        # Extract requirements from job
-        must_have_skills = job_requirements.get('must_have_skills', [])
-        good_to_have_skills = job_requirements.get('good_to_have_skills', [])
-        technical_requirements = job_requirements.get('technical_requirements', [])
         
-        # Combine all required skills
-        all_required_skills = must_have_skills + good_to_have_skills + technical_requirements
-        required_skills_text = ' '.join(all_required_skills).lower()
-        
-        # Calculate TF-IDF similarity
+        # Calculate TF-IDF similarity against the job vector precomputed in the match plan
         try:
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([resume_skills_text, required_skills_text])
-            tfidf_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            resume_term_counts = self.tfidf_index.term_counts(skills_text(resume_skills))
+            tfidf_similarity = self.tfidf_index.similarity(resume_term_counts, plan['tfidf'])
         except:
             tfidf_similarity = 0.0
         
-        # Calculate fuzzy matching for individual skills
-        skill_matches = []
-        for skill in all_required_skills:
-            best_match = 0
-            for resume_skill in resume_skills:
-                match_ratio = fuzz.ratio(skill.lower(), resume_skill.lower())
-                best_match = max(best_match, match_ratio)
-            skill_matches.append(best_match)
+        # Best fuzzy match for each required skill
+        skill_matches = skill_matrix.best_scores()
         
         # Calculate average skill match
-        avg_skill_match = np.mean(skill_matches) if skill_matches else 0
+        avg_skill_match = np.mean(skill_matches) if len(skill_matches) else 0
         
         # Weighted combination
         hard_match_score = (tfidf_similarity * 0.6 + avg_skill_match / 100 * 0.4) * 100
@@ -134,20 +294,17 @@ class RelevanceEngine:
         matched_skills = []
         missing_skills = []
         
-        for skill in must_have_skills:
-            best_match = 0
-            best_resume_skill = None
-            for resume_skill in resume_skills:
-                match_ratio = fuzz.ratio(skill.lower(), resume_skill.lower())
-                if match_ratio > best_match:
-                    best_match = match_ratio
-                    best_resume_skill = resume_skill
+        for skill, must_have, best_match, best_resume_skill in zip(
+            plan['required_skills'], plan['must_have_mask'], skill_matches, skill_matrix.best_matches()
+        ):
+            if not must_have:
+                continue
             
-            if best_match >= 70:  # Threshold for match
+            if best_match >= MATCH_THRESHOLD:
                 matched_skills.append({
                     'required': skill,
                     'matched': best_resume_skill,
-                    'confidence': best_match
+                    'confidence': int(best_match)
                 })
             else:
                 missing_skills.append(skill)
@@ -159,32 +316,110 @@ class RelevanceEngine:
             'missing_skills': missing_skills
         }
     
-    def _calculate_semantic_score(self, resume_text: str, job_description: str) -> Tuple[float, Dict]:
+    def _calculate_semantic_score(self, resume_text: str, job_chunk_embeddings: List[List[float]]) -> Tuple[float, Dict]:
         """Calculate semantic similarity using sentence embeddings"""
+        return self._calculate_semantic_scores([resume_text], job_chunk_embeddings)[0]
+    
+    def _calculate_semantic_scores(self, resume_texts: List[str], job_chunk_embeddings: List[List[float]],
+                                   batch_size: int = None) -> List[Tuple[float, Dict]]:
+        """Chunk-by-chunk similarity: best resume chunk per job chunk, averaged over job chunks"""
         try:
-            # Generate embeddings
-            resume_embedding = self.sentence_model.encode([resume_text])
-            job_embedding = self.sentence_model.encode([job_description])
+            if not job_chunk_embeddings:
+                raise ValueError('Job embedding is not available')
             
-            # Calculate cosine similarity
-            similarity = cosine_similarity(resume_embedding, job_embedding)[0][0]
-            semantic_score = similarity * 100
+            # Chunk all resumes and embed every chunk in batched calls (cached chunks are not re-encoded)
+            resume_chunks = [self._resume_chunks(text) for text in resume_texts]
+            offsets = np.cumsum([0] + [len(chunks) for chunks in resume_chunks[:-1]])
+            chunk_embeddings = self._normalize_rows(self._encode_texts(
+                [chunk for chunks in resume_chunks for chunk in chunks],
+                batch_size=batch_size
+            ))
             
-            return semantic_score, {
-                'similarity': similarity,
-                'embedding_model': 'all-MiniLM-L6-v2'
-            }
+            # (resume chunks x job chunks) cosine similarities, max-pooled per resume and job chunk
+            similarities = chunk_embeddings @ self._normalize_rows(job_chunk_embeddings).T
+            best_per_job_chunk = np.maximum.reduceat(similarities, offsets, axis=0)
+            pooled = best_per_job_chunk.mean(axis=1)
+            
+            return [
+                (similarity * 100, {
+                    'similarity': similarity,
+                    'pooling': 'max-mean',
+                    'resume_chunks': len(chunks),
+                    'job_chunks': len(job_chunk_embeddings),
+                    'embedding_model': self.model_name
+                })
+                for similarity, chunks in zip(pooled.tolist(), resume_chunks)
+            ]
         except Exception as e:
-            return 0.0, {'error': str(e)}
+            return [(0.0, {'error': str(e)})] * len(resume_texts)
+    
+    def _resume_chunks(self, resume_text: str) -> List[str]:
+        """Resume passages to embed (the whole text when chunking is disabled)"""
+        if not Config.SEMANTIC_CHUNKING:
+            return [resume_text]
+        return chunk_resume(resume_text, Config.SEMANTIC_CHUNK_WORDS, Config.SEMANTIC_MAX_RESUME_CHUNKS)
+    
+    def _job_chunks(self, job_requirements: Dict, description: str) -> List[str]:
+        """Job passages to embed (the whole description when chunking is disabled)"""
+        if not Config.SEMANTIC_CHUNKING:
+            return [description]
+        return chunk_job(job_requirements, description, Config.SEMANTIC_CHUNK_WORDS, Config.SEMANTIC_MAX_JOB_CHUNKS)
     
     def _calculate_llm_score(self, resume_data: Dict, job_requirements: Dict) -> Tuple[float, Dict]:
         """Calculate LLM-based reasoning score"""
-        try:
-            # Prepare context for LLM
-            resume_summary = self._create_resume_summary(resume_data)
-            job_summary = self._create_job_summary(job_requirements)
-            
-            prompt = f"""
+        return self._calculate_llm_scores([resume_data], job_requirements)[0]
+    
+    def _calculate_llm_scores(self, resumes: List[Dict], job_requirements: Dict) -> List[Tuple[float, Dict]]:
+        """Calculate LLM-based reasoning scores, sending all uncached prompts concurrently"""
+        results = [None] * len(resumes)
+        pending = []
+        
+        for index, resume_data in enumerate(resumes):
+            try:
+                # Prepare context for LLM
+                prompt = self._build_llm_prompt(resume_data, job_requirements)
+                
+                # Reuse an earlier response to the same prompt when cached
+                cache_key = None
+                if self.llm_cache is not None:
+                    cache_key = self.llm_cache.key_for(prompt, self.llm_model, self.llm_temperature)
+                    llm_response = self.llm_cache.get(cache_key)
+                    if llm_response is not None:
+                        results[index] = self._llm_result(llm_response, cache_hit=True)
+                        continue
+                pending.append((index, prompt, cache_key))
+            except Exception as e:
+                results[index] = (50.0, {'error': str(e)})
+        
+        if pending:
+            responses = self.llm_client.complete_many(
+                [prompt for _, prompt, _ in pending],
+                temperature=self.llm_temperature,
+                max_tokens=500
+            )
+            for (index, _, cache_key), llm_response in zip(pending, responses):
+                if isinstance(llm_response, Exception):
+                    results[index] = (50.0, {'error': str(llm_response)})
+                    continue
+                
+                if self.llm_cache is not None:
+                    self.llm_cache.set(cache_key, llm_response, self.llm_model)
+                results[index] = self._llm_result(llm_response, cache_hit=False)
+        
+        return results
+    
+    def _llm_result(self, llm_response: str, cache_hit: bool) -> Tuple[float, Dict]:
+        """Parsed score and details of one LLM response"""
+        score, details = self._parse_llm_response(llm_response)
+        details['cache_hit'] = cache_hit
+        return score, details
+    
+    def _build_llm_prompt(self, resume_data: Dict, job_requirements: Dict) -> str:
+        """Render the reasoning prompt for one resume/job pair"""
+        resume_summary = self._create_resume_summary(resume_data)
+        job_summary = self._create_job_summary(job_requirements)
+        
+        return f"""
             Analyze the following resume against the job requirements and provide a relevance score (0-100) and reasoning.
             
             JOB REQUIREMENTS:
@@ -207,38 +442,28 @@ class RelevanceEngine:
                 "weaknesses": ["<weakness1>", "<weakness2>"]
             }}
             """
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.3
-            )
-            
-            # Parse LLM response
-            llm_response = response.choices[0].message.content
-            try:
-                llm_data = json.loads(llm_response)
-                score = float(llm_data.get('score', 0))
-                reasoning = llm_data.get('reasoning', '')
-                strengths = llm_data.get('strengths', [])
-                weaknesses = llm_data.get('weaknesses', [])
-            except:
-                # Fallback parsing
-                score = 50.0
-                reasoning = llm_response
-                strengths = []
-                weaknesses = []
-            
-            return score, {
-                'reasoning': reasoning,
-                'strengths': strengths,
-                'weaknesses': weaknesses,
-                'raw_response': llm_response
-            }
-            
-        except Exception as e:
-            return 50.0, {'error': str(e)}
+    
+    def _parse_llm_response(self, llm_response: str) -> Tuple[float, Dict]:
+        """Parse the JSON answer of the LLM into a score and details"""
+        try:
+            llm_data = json.loads(llm_response)
+            score = float(llm_data.get('score', 0))
+            reasoning = llm_data.get('reasoning', '')
+            strengths = llm_data.get('strengths', [])
+            weaknesses = llm_data.get('weaknesses', [])
+        except:
+            # Fallback parsing
+            score = 50.0
+            reasoning = llm_response
+            strengths = []
+            weaknesses = []
+        
+        return score, {
+            'reasoning': reasoning,
+            'strengths': strengths,
+            'weaknesses': weaknesses,
+            'raw_response': llm_response
+        }
     
     def _create_resume_summary(self, resume_data: Dict) -> str:
         """Create a concise summary of the resume"""
@@ -331,7 +556,8 @@ class RelevanceEngine:
         else:
             return "Low"
     
-    def _identify_missing_elements(self, resume_data: Dict, job_requirements: Dict) -> Dict:
+    def _identify_missing_elements(self, resume_data: Dict, plan: Dict, skill_matrix: SkillSimilarityMatrix,
+                                   cert_matrix: SkillSimilarityMatrix) -> Dict:
         """Identify missing skills, certifications, and projects"""
         structured_resume = resume_data.get('structured_data', {})
         
@@ -342,28 +568,19 @@ class RelevanceEngine:
         }
         
         # Check missing skills
-        resume_skills = [skill.lower() for skill in structured_resume.get('skills', [])]
-        required_skills = job_requirements.get('must_have_skills', [])
-        
-        for skill in required_skills:
-            skill_lower = skill.lower()
-            if not any(fuzz.ratio(skill_lower, resume_skill) >= 70 for resume_skill in resume_skills):
+        for skill, must_have, matched in zip(plan['required_skills'], plan['must_have_mask'], skill_matrix.matched_mask()):
+            if must_have and not matched:
                 missing_elements['skills'].append(skill)
         
         # Check missing certifications
-        resume_certs = [cert.lower() for cert in structured_resume.get('certifications', [])]
-        required_certs = job_requirements.get('certifications', [])
-        
-        for cert in required_certs:
-            cert_lower = cert.lower()
-            if not any(fuzz.ratio(cert_lower, resume_cert) >= 70 for resume_cert in resume_certs):
+        for cert, matched in zip(plan['certifications'], cert_matrix.matched_mask()):
+            if not matched:
                 missing_elements['certifications'].append(cert)
         
-        # Check missing project types (based on job requirements)
+        # Check missing project types (inferred from job requirements when the plan was compiled)
         resume_projects = structured_resume.get('projects', [])
-        project_types = self._infer_required_project_types(job_requirements)
         
-        for project_type in project_types:
+        for project_type in plan['project_types']:
             if not any(project_type.lower() in project.get('title', '').lower() or 
                       project_type.lower() in project.get('description', '').lower() 
                       for project in resume_projects):
@@ -371,43 +588,17 @@ class RelevanceEngine:
         
         return missing_elements
     
-    def _infer_required_project_types(self, job_requirements: Dict) -> List[str]:
-        """Infer required project types from job requirements"""
-        project_types = []
-        
-        # Analyze technical requirements to infer project types
-        technical_skills = job_requirements.get('technical_requirements', [])
-        
-        if any('web' in skill.lower() or 'frontend' in skill.lower() for skill in technical_skills):
-            project_types.append('Web Application')
-        
-        if any('mobile' in skill.lower() or 'android' in skill.lower() or 'ios' in skill.lower() for skill in technical_skills):
-            project_types.append('Mobile Application')
-        
-        if any('machine learning' in skill.lower() or 'ai' in skill.lower() or 'data science' in skill.lower() for skill in technical_skills):
-            project_types.append('Machine Learning Project')
-        
-        if any('database' in skill.lower() or 'sql' in skill.lower() for skill in technical_skills):
-            project_types.append('Database Project')
-        
-        if any('api' in skill.lower() or 'microservice' in skill.lower() for skill in technical_skills):
-            project_types.append('API Development')
-        
-        return project_types
-    
-    def _identify_strengths(self, resume_data: Dict, job_requirements: Dict) -> List[str]:
+    def _identify_strengths(self, resume_data: Dict, plan: Dict, skill_matrix: SkillSimilarityMatrix) -> List[str]:
         """Identify strengths in the resume"""
         strengths = []
         structured_resume = resume_data.get('structured_data', {})
         
         # Check skill matches
-        resume_skills = [skill.lower() for skill in structured_resume.get('skills', [])]
-        required_skills = job_requirements.get('must_have_skills', [])
-        
-        matched_skills = []
-        for skill in required_skills:
-            if any(fuzz.ratio(skill.lower(), resume_skill) >= 70 for resume_skill in resume_skills):
-                matched_skills.append(skill)
+        matched_skills = [
+            skill for skill, must_have, matched
+            in zip(plan['required_skills'], plan['must_have_mask'], skill_matrix.matched_mask())
+            if must_have and matched
+        ]
         
         if matched_skills:
             strengths.append(f"Strong technical skills: {', '.join(matched_skills[:5])}")
@@ -424,13 +615,13 @@ class RelevanceEngine:
         
         return strengths
     
-    def _identify_weaknesses(self, resume_data: Dict, job_requirements: Dict) -> List[str]:
+    def _identify_weaknesses(self, resume_data: Dict, job_requirements: Dict, missing_elements: Dict) -> List[str]:
         """Identify weaknesses in the resume"""
         weaknesses = []
         structured_resume = resume_data.get('structured_data', {})
         
         # Check missing critical skills
-        missing_skills = self._identify_missing_elements(resume_data, job_requirements)['skills']
+        missing_skills = missing_elements.get('skills', [])
         if missing_skills:
             weaknesses.append(f"Missing critical skills: {', '.join(missing_skills[:5])}")
         
@@ -0,0 +1,58 @@
+"""
+Resume Segmenter Module
+Classifies every resume line once against all section keywords
+"""
+
+from typing import Dict, FrozenSet, List
+
+from patterns import DATE_RANGE, RESUME_LINE_MATCHER
+
+
+class ResumeLine:
+    """One stripped resume line with its lowercased text and keyword groups"""
+
+    __slots__ = ('text', 'lower', 'groups')
+
+    def __init__(self, text: str, lower: str, groups: FrozenSet[str]):
+        self.text = text
+        self.lower = lower
+        self.groups = groups
+
+    @property
+    def is_date_range(self) -> bool:
+        """Whether the line contains a date range or 'present'/'current'"""
+        return 'date_word' in self.groups or DATE_RANGE.search(self.lower) is not None
+
+
+class ResumeSections:
+    """Section map of a resume: every line classified once, shared by all extractors"""
+
+    def __init__(self, lines: List[ResumeLine]):
+        self.lines = lines
+
+        # Index of the first line of each keyword group (its section heading)
+        self.starts: Dict[str, int] = {}
+        for index, line in enumerate(lines):
+            for group in line.groups:
+                self.starts.setdefault(group, index)
+
+    def section(self, group: str) -> List[ResumeLine]:
+        """Non-empty lines after the first heading of group, skipping the group's own headings"""
+        start = self.starts.get(group)
+        if start is None:
+            return []
+        return [line for line in self.lines[start + 1:] if line.text and group not in line.groups]
+
+    def matching(self, group: str) -> List[ResumeLine]:
+        """Lines containing a keyword of group"""
+        return [line for line in self.lines if group in line.groups]
+
+
+def segment_resume(text: str) -> ResumeSections:
+    """Split text into lines and classify each of them in a single pass"""
+    lines = []
+    for raw_line in text.split('\n'):
+        stripped = raw_line.strip()
+        lower = stripped.lower()
+        lines.append(ResumeLine(stripped, lower, RESUME_LINE_MATCHER.groups(lower)))
+    return ResumeSections(lines)
@@ -7,11 +7,10 @@ from werkzeug.utils import secure_filename
 import os
 import uuid
 from models import Job, Resume, Evaluation, db
-from resume_parser import ResumeParser
-from jd_parser import JobDescriptionParser
-from relevance_engine import RelevanceEngine
-from tasks import process_resume_evaluation
-from utils import allowed_file, generate_unique_filename, validate_email, validate_phone
+# Parsers, the scoring engine and the Celery tasks are imported inside the
+# routes that use them, so the API process starts without the ML stack
+from storage import get_storage
+from utils import allowed_file, validate_email, validate_phone
 
 api_bp = Blueprint('api', __name__)
 
@@ -25,8 +24,9 @@ def create_job():
     try:
         data = request.get_json()
         
-        # Parse job description
-        jd_parser = JobDescriptionParser()
+        # Parse job description (parser and spaCy pipeline shared per process)
+        import model_registry
+        jd_parser = model_registry.get_jd_parser()
         parsed_jd = jd_parser.parse_job_description(data['description'])
         
         job = Job(
@@ -40,6 +40,10 @@ def create_job():
         db.session.add(job)
         db.session.commit()
         
+        # Precompute the job's match plan in the background
+        from tasks import compile_job_match_plan
+        compile_job_match_plan.delay(job.id)
+        
         return jsonify({
             'success': True,
             'message': 'Job created successfully',
@@ -102,6 +106,70 @@ def get_job(job_id):
             'message': f'Error fetching job: {str(e)}'
         }), 500
 
+@api_bp.route('/jobs/<job_id>/candidates', methods=['GET'])
+def get_job_candidates(job_id):
+    """Top-K resumes for a job by semantic similarity, optionally queueing their full evaluation"""
+    try:
+        job = Job.query.get(job_id)
+        if not job:
+            return jsonify({
+                'success': False,
+                'message': 'Job not found'
+            }), 404
+        
+        k = request.args.get('k', current_app.config['CANDIDATES_DEFAULT_K'], type=int)
+        k = max(1, min(k, current_app.config['CANDIDATES_MAX_K']))
+        evaluate = request.args.get('evaluate', 'false').lower() == 'true'
+        
+        # The job's query vector comes from its compiled match plan, so no model is loaded here
+        import model_registry
+        from vector_index import plan_vector
+        resume_index = model_registry.get_vector_index('resumes')
+        query_vector = plan_vector(job.match_plan, resume_index.embedding_key)
+        if query_vector is None:
+            from tasks import compile_job_match_plan
+            compile_job_match_plan.delay(job.id)
+            return jsonify({
+                'success': False,
+                'message': 'Job match plan is being compiled, retry shortly'
+            }), 409
+        
+        matches = resume_index.search(query_vector, k)
+        resumes = {
+            resume.id: resume
+            for resume in Resume.query.filter(Resume.id.in_([resume_id for resume_id, _ in matches])).all()
+        }
+        candidates = [
+            {
+                'resume_id': resume_id,
+                'student_name': resumes[resume_id].student_name,
+                'student_email': resumes[resume_id].student_email,
+                'similarity': round(similarity, 4)
+            }
+            for resume_id, similarity in matches if resume_id in resumes
+        ]
+        
+        # Full evaluations only for the retrieved candidates (existing evaluations are skipped)
+        task_id = None
+        if evaluate and candidates:
+            from tasks import evaluate_resume_batch
+            task_id = evaluate_resume_batch.delay(
+                job.id, [candidate['resume_id'] for candidate in candidates]
+            ).id
+        
+        return jsonify({
+            'success': True,
+            'job_id': job.id,
+            'candidates': candidates,
+            'task_id': task_id
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error finding candidates: {str(e)}'
+        }), 500
+
 # Resume Routes
 @api_bp.route('/resumes', methods=['POST'])
 def upload_resume():
@@ -151,32 +219,44 @@ def upload_resume():
                 'message': 'Invalid phone number format'
             }), 400
         
-        # Save file
-        unique_filename = generate_unique_filename(file.filename)
-        file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], 'resumes', unique_filename)
-        file.save(file_path)
+        # Store the file under the hash of its content (streamed, hashed on the way)
+        file_type = file.filename.rsplit('.', 1)[1].lower()
+        file_uri, content_hash = get_storage().put(file.stream, f".{file_type}")
         
         # Create resume record
         resume = Resume(
-            filename=unique_filename,
+            filename=file_uri.rsplit('/', 1)[-1],
             original_filename=file.filename,
-            file_path=file_path,
-            file_type=file.filename.rsplit('.', 1)[1].lower(),
+            file_path=file_uri,
+            file_type=file_type,
+            content_hash=content_hash,
             student_name=student_name,
             student_email=student_email,
             student_phone=student_phone
         )
         
+        # Same file uploaded before: reuse its parsed data (and, through the
+        # embedding cache, its embeddings) instead of parsing it again
+        twin = resume.processed_twin()
+        if twin is not None:
+            resume.copy_parsed_data(twin)
+        
         db.session.add(resume)
         db.session.commit()
         
-        # Process resume in background
-        process_resume_evaluation.delay(resume.id)
+        # Process resume in background (a re-uploaded file only needs indexing)
+        if twin is None:
+            from tasks import process_resume_evaluation
+            process_resume_evaluation.delay(resume.id)
+        else:
+            from tasks import index_resume
+            index_resume.delay(resume.id)
         
         return jsonify({
             'success': True,
             'message': 'Resume uploaded successfully',
-            'resume': resume.to_dict()
+            'resume': resume.to_dict(),
+            'duplicate_of': twin.id if twin is not None else None
         }), 201
         
     except Exception as e:
@@ -214,6 +294,80 @@ def get_resumes():
             'message': f'Error fetching resumes: {str(e)}'
         }), 500
 
+@api_bp.route('/resumes/<resume_id>/matching-jobs', methods=['GET'])
+def get_matching_jobs(resume_id):
+    """Top-K active jobs for a resume, optionally queueing full evaluations of that shortlist"""
+    try:
+        resume = Resume.query.get(resume_id)
+        if not resume:
+            return jsonify({
+                'success': False,
+                'message': 'Resume not found'
+            }), 404
+        
+        if not resume.is_processed:
+            return jsonify({
+                'success': False,
+                'message': 'Resume has not been parsed yet'
+            }), 409
+        
+        k = request.args.get('k', current_app.config['MATCHING_JOBS_DEFAULT_K'], type=int)
+        k = max(1, min(k, current_app.config['MATCHING_JOBS_MAX_K']))
+        evaluate = request.args.get('evaluate', 'false').lower() == 'true'
+        
+        # Skill coverage prefilter plus the k nearest job vectors, then one similarity product over
+        # the remaining jobs; vectors come from the indexes, so no model is loaded here
+        import model_registry
+        from job_matching import rank_jobs
+        resume_vector = model_registry.get_vector_index('resumes').vector(resume.id)
+        job_index = model_registry.get_vector_index('jobs')
+        nearest_job_ids = []
+        if resume_vector is not None:
+            nearest_job_ids = [job_id for job_id, _ in job_index.search(resume_vector, k)]
+        active_job_ids = [job_id for job_id, in Job.query.filter_by(is_active=True).with_entities(Job.id).all()]
+        ranked = rank_jobs(
+            active_job_ids,
+            model_registry.get_skill_index().job_coverage((resume.parsed_data or {}).get('skills', [])),
+            job_index.vectors(),
+            resume_vector,
+            k,
+            min_skill_coverage=current_app.config['MATCHING_JOBS_MIN_SKILL_COVERAGE'],
+            hard_match_weight=current_app.config['HARD_MATCH_WEIGHT'],
+            semantic_weight=current_app.config['SEMANTIC_MATCH_WEIGHT'],
+            nearest_job_ids=nearest_job_ids
+        )
+        
+        jobs = {job.id: job for job in Job.query.filter(Job.id.in_([match['job_id'] for match in ranked])).all()}
+        matching_jobs = [
+            {
+                **match,
+                'title': jobs[match['job_id']].title,
+                'company': jobs[match['job_id']].company,
+                'location': jobs[match['job_id']].location
+            }
+            for match in ranked
+        ]
+        
+        # Full evaluations only for the shortlisted jobs (existing evaluations are skipped)
+        task_id = None
+        if evaluate and matching_jobs:
+            from tasks import evaluate_resume_jobs
+            task_id = evaluate_resume_jobs.delay(resume.id, [match['job_id'] for match in matching_jobs]).id
+        
+        return jsonify({
+            'success': True,
+            'resume_id': resume.id,
+            'matching_jobs': matching_jobs,
+            'semantic_ranking': resume_vector is not None,
+            'task_id': task_id
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error finding matching jobs: {str(e)}'
+        }), 500
+
 # Evaluation Routes
 @api_bp.route('/evaluations', methods=['POST'])
 def create_evaluation():
@@ -241,6 +395,7 @@ def create_evaluation():
             }), 400
         
         # Process evaluation in background
+        from tasks import process_resume_evaluation
         task = process_resume_evaluation.delay(resume_id, job_id)
         
         return jsonify({
@@ -0,0 +1,84 @@
+"""
+Semantic Chunks Module
+Splits resumes and job descriptions into bounded passages for chunked semantic matching
+"""
+
+import re
+from typing import Dict, List
+
+# Lines that start a new resume section
+RESUME_SECTION_HEADINGS = {
+    'summary', 'professional summary', 'objective', 'profile', 'about me',
+    'experience', 'work experience', 'professional experience', 'employment history', 'internships',
+    'education', 'academic background', 'skills', 'technical skills', 'core competencies',
+    'certifications', 'certificates', 'projects', 'academic projects', 'achievements', 'awards',
+    'publications', 'languages', 'interests', 'activities', 'volunteering'
+}
+
+
+def chunk_resume(text: str, max_words: int, max_chunks: int) -> List[str]:
+    """Split resume text at section headings, then into windows of at most max_words"""
+    sections = []
+    current = []
+    for line in (text or '').splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if current and _is_section_heading(line):
+            sections.append(' '.join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append(' '.join(current))
+
+    chunks = []
+    for section in sections:
+        chunks.extend(_windows(section, max_words))
+    return _bounded(chunks, max_chunks)
+
+
+def chunk_job(job_requirements: Dict, description: str, max_words: int, max_chunks: int) -> List[str]:
+    """Split a job into responsibility, qualification and description passages"""
+    chunks = (
+        _pack(job_requirements.get('responsibilities', []), max_words) +
+        _pack(job_requirements.get('qualifications', []), max_words) +
+        _windows(description or '', max_words)
+    )
+    # The parser may return the same passage under several headings
+    return _bounded(list(dict.fromkeys(chunks)), max_chunks)
+
+
+def _is_section_heading(line: str) -> bool:
+    """Whether a line looks like a resume section heading"""
+    heading = re.sub(r'[^a-z ]', '', line.lower()).strip()
+    return heading in RESUME_SECTION_HEADINGS
+
+
+def _windows(text: str, max_words: int) -> List[str]:
+    """Consecutive windows of at most max_words words"""
+    words = text.split()
+    return [' '.join(words[start:start + max_words]) for start in range(0, len(words), max_words)]
+
+
+def _pack(items: List[str], max_words: int) -> List[str]:
+    """Greedily join short list items into passages of at most max_words words"""
+    passages = []
+    current = []
+    current_words = 0
+    for item in items:
+        for window in _windows(item, max_words):
+            words = len(window.split())
+            if current and current_words + words > max_words:
+                passages.append('. '.join(current))
+                current = []
+                current_words = 0
+            current.append(window)
+            current_words += words
+    if current:
+        passages.append('. '.join(current))
+    return passages
+
+
+def _bounded(chunks: List[str], max_chunks: int) -> List[str]:
+    """Keep at most max_chunks passages, and always at least one"""
+    return chunks[:max_chunks] or ['']
@@ -0,0 +1,243 @@
+"""
+Skill Index Module
+Resumes and jobs as sparse rows over the canonical skills, so skill coverage of every pair is one matrix product
+"""
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from skill_taxonomy import SKILL_TAXONOMY
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
+RESUMES = 'resume'
+JOBS = 'job'
+
+# Rows mapped under another taxonomy are dropped on load and re-read by the next sync
+TAXONOMY_VERSION = hashlib.sha256(
+    json.dumps(sorted(SKILL_TAXONOMY.names().items())).encode('utf-8')
+).hexdigest()[:16]
+
+
+def canonical_skills(entries: Iterable[str]) -> List[str]:
+    """Canonical skills of a list of skill entries; entries outside the taxonomy keep their lowercased name"""
+    skills = []
+    for entry in entries or []:
+        found = SKILL_TAXONOMY.find(entry)
+        if not found:
+            name = SKILL_TAXONOMY.canonical(entry)
+            found = [name] if name else []
+        skills.extend(skill for skill in found if skill not in skills)
+    return skills
+
+
+def resume_skill_weights(skills: List[str]) -> Dict[str, float]:
+    """A resume row: 1 for every canonical skill it lists"""
+    return {skill: 1.0 for skill in canonical_skills(skills)}
+
+
+def job_skill_weights(job_requirements: Dict, must_have_weight: float = 2.0) -> Dict[str, float]:
+    """A job row: must-have skills weigh must_have_weight, other required skills 1, summing to 1"""
+    weights: Dict[str, float] = {}
+    for field, weight in (('must_have_skills', must_have_weight), ('good_to_have_skills', 1.0),
+                          ('technical_requirements', 1.0)):
+        for skill in canonical_skills(job_requirements.get(field, [])):
+            weights[skill] = max(weights.get(skill, 0.0), weight)
+
+    total = sum(weights.values())
+    return {skill: weight / total for skill, weight in weights.items()} if total else {}
+
+
+class SkillIndex:
+    """Resumes x skills (binary) and jobs x skills (weights summing to 1) as CSR matrices.
+
+    Rows are replaced one record at a time as resumes are parsed and jobs change,
+    each stamped with the record's update time so a sync re-reads only changed
+    records. The product of the two matrices is the weighted share of each job's
+    skills that each resume lists. State is persisted to one .npz file.
+    """
+
+    def __init__(self, path: str, must_have_weight: float = 2.0):
+        self.path = path
+        self.must_have_weight = must_have_weight
+        self.skills: List[str] = []
+        self._columns: Dict[str, int] = {}
+        # kind -> id -> (stamp, column indices, weights)
+        self._rows: Dict[str, Dict[str, Tuple[float, np.ndarray, np.ndarray]]] = {RESUMES: {}, JOBS: {}}
+        self._matrices: Dict[str, Tuple[List[str], sparse.csr_matrix]] = {}
+        self._state_stamp = None
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._reload_if_changed()
+
+    def update_resumes(self, resumes: Dict[str, Tuple[float, List[str]]], removed: Iterable[str] = ()) -> int:
+        """Set the rows of resumes (id -> (stamp, skills)) and drop removed ones; returns rows changed"""
+        rows = {resume_id: (stamp, resume_skill_weights(skills)) for resume_id, (stamp, skills) in resumes.items()}
+        return self._update(RESUMES, rows, removed)
+
+    def update_jobs(self, jobs: Dict[str, Tuple[float, Dict]], removed: Iterable[str] = ()) -> int:
+        """Set the rows of jobs (id -> (stamp, requirements)) and drop removed ones; returns rows changed"""
+        rows = {
+            job_id: (stamp, job_skill_weights(requirements or {}, self.must_have_weight))
+            for job_id, (stamp, requirements) in jobs.items()
+        }
+        return self._update(JOBS, rows, removed)
+
+    def stale(self, kind: str, current: Dict[str, float]) -> Tuple[List[str], List[str]]:
+        """Compare with the records that exist (id -> stamp): ids to re-read and indexed ids to drop"""
+        self._reload_if_changed()
+        rows = self._rows[kind]
+        changed = [record_id for record_id, stamp in current.items()
+                   if record_id not in rows or rows[record_id][0] != stamp]
+        removed = [record_id for record_id in rows if record_id not in current]
+        return changed, removed
+
+    def matrix(self, kind: str) -> Tuple[List[str], sparse.csr_matrix]:
+        """Row ids and the CSR matrix of resumes or jobs over all indexed skills"""
+        self._reload_if_changed()
+        if kind not in self._matrices:
+            rows = self._rows[kind]
+            ids = sorted(rows)
+            lengths = np.fromiter((len(rows[row_id][1]) for row_id in ids), dtype=np.int64, count=len(ids))
+            indptr = np.concatenate(([0], np.cumsum(lengths)))
+            indices = np.concatenate([rows[row_id][1] for row_id in ids]) if ids else np.zeros(0, dtype=np.int32)
+            weights = np.concatenate([rows[row_id][2] for row_id in ids]) if ids else np.zeros(0, dtype=np.float32)
+            matrix = sparse.csr_matrix((weights, indices, indptr), shape=(len(ids), len(self.skills)))
+            self._matrices[kind] = (ids, matrix)
+        return self._matrices[kind]
+
+    def coverage(self) -> Tuple[List[str], List[str], sparse.csr_matrix]:
+        """Job ids, resume ids and the jobs x resumes skill coverage (0-1), zeros left out"""
+        job_ids, jobs = self.matrix(JOBS)
+        resume_ids, resumes = self.matrix(RESUMES)
+        return job_ids, resume_ids, (jobs @ resumes.T).tocsr()
+
+    def job_coverage(self, skills: List[str]) -> Dict[str, float]:
+        """Coverage of every indexed job by one resume's skills (job id -> 0-1), zeros left out"""
+        job_ids, jobs = self.matrix(JOBS)
+        columns = [self._columns[skill] for skill in resume_skill_weights(skills) if skill in self._columns]
+        coverage = np.asarray(jobs[:, columns].sum(axis=1)).ravel()
+        return {job_ids[row]: float(coverage[row]) for row in np.flatnonzero(coverage)}
+
+    def top_resumes(self, top_k: int = None, min_coverage: float = 0.0) -> Dict[str, List[Tuple[str, float]]]:
+        """Best-covering resumes of every job, highest coverage first"""
+        job_ids, resume_ids, coverage = self.coverage()
+        ranked = {}
+        for row, job_id in enumerate(job_ids):
+            start, end = coverage.indptr[row], coverage.indptr[row + 1]
+            columns, values = coverage.indices[start:end], coverage.data[start:end]
+            keep = values >= min_coverage
+            columns, values = columns[keep], values[keep]
+            if top_k is not None and len(values) > top_k:
+                best = np.argpartition(-values, top_k - 1)[:top_k]
+                columns, values = columns[best], values[best]
+            order = np.lexsort((columns, -values))
+            ranked[job_id] = [(resume_ids[columns[i]], round(float(values[i]), 4)) for i in order]
+        return ranked
+
+    def stats(self) -> Dict:
+        """Size of the index"""
+        self._reload_if_changed()
+        return {
+            'resumes': len(self._rows[RESUMES]),
+            'jobs': len(self._rows[JOBS]),
+            'skills': len(self.skills),
+            'path': self.path
+        }
+
+    def _update(self, kind: str, rows: Dict[str, Tuple[float, Dict[str, float]]], removed: Iterable[str]) -> int:
+        """Replace and drop rows of one kind under the writer lock"""
+        with self._exclusive():
+            self._reload_if_changed()
+
+            changed = 0
+            for record_id in removed:
+                changed += self._rows[kind].pop(record_id, None) is not None
+            for record_id, (stamp, weights) in rows.items():
+                columns = np.array([self._column(skill) for skill in weights], dtype=np.int32)
+                values = np.array(list(weights.values()), dtype=np.float32)
+                order = np.argsort(columns)
+                self._rows[kind][record_id] = (float(stamp), columns[order], values[order])
+                changed += 1
+
+            if changed:
+                self._matrices.clear()
+                self._save()
+            return changed
+
+    def _column(self, skill: str) -> int:
+        """Column of a skill, adding it to the vocabulary when new"""
+        column = self._columns.get(skill)
+        if column is None:
+            column = self._columns[skill] = len(self.skills)
+            self.skills.append(skill)
+        return column
+
+    @contextmanager
+    def _exclusive(self):
+        """Serialize writers across threads and worker processes"""
+        with self._lock, open(f"{self.path}.lock", 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _reload_if_changed(self) -> None:
+        """Load the persisted state if another process has written a newer one"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._state_stamp:
+            return
+
+        with np.load(self.path) as state:
+            self.skills = state['skills'].tolist()
+            self._columns = {skill: column for column, skill in enumerate(self.skills)}
+            current = str(state['taxonomy_version']) == TAXONOMY_VERSION
+            for kind in (RESUMES, JOBS):
+                self._rows[kind] = {}
+                if not current:
+                    continue
+                indptr, indices, weights = state[f'{kind}_indptr'], state[f'{kind}_indices'], state[f'{kind}_weights']
+                for row, (record_id, record_stamp) in enumerate(zip(state[f'{kind}_ids'].tolist(),
+                                                                    state[f'{kind}_stamps'].tolist())):
+                    start, end = indptr[row], indptr[row + 1]
+                    self._rows[kind][record_id] = (record_stamp, indices[start:end], weights[start:end])
+        self._matrices.clear()
+        self._state_stamp = stamp
+
+    def _save(self) -> None:
+        """Atomically write the state so readers never see a partial file"""
+        arrays = {}
+        for kind in (RESUMES, JOBS):
+            ids, matrix = self.matrix(kind)
+            arrays[f'{kind}_ids'] = np.array(ids, dtype=str)
+            arrays[f'{kind}_stamps'] = np.array([self._rows[kind][row_id][0] for row_id in ids], dtype=np.float64)
+            arrays[f'{kind}_indptr'] = matrix.indptr
+            arrays[f'{kind}_indices'] = matrix.indices
+            arrays[f'{kind}_weights'] = matrix.data
+
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as state_file:
+            np.savez(state_file, taxonomy_version=TAXONOMY_VERSION, skills=np.array(self.skills, dtype=str), **arrays)
+        os.replace(temp_path, self.path)
+        stat = os.stat(self.path)
+        self._state_stamp = (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,284 @@
+"""
+Skill Similarity Module
+Computes fuzzy skill similarity for all (required, resume) skill pairs at once,
+from a precomputed table over the skill taxonomy where possible
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+import numpy as np
+from fuzzywuzzy import fuzz
+
+try:
+    from rapidfuzz import fuzz as rapid_fuzz
+    from rapidfuzz.process import cdist
+except ImportError:  # Fall back to pairwise fuzzywuzzy calls
+    cdist = None
+
+logger = logging.getLogger(__name__)
+
+# Minimum fuzz.ratio for a resume skill to count as a match
+MATCH_THRESHOLD = 70
+
+# Bump when the way table scores are computed changes
+TABLE_SCORER = 'fuzz.ratio+aliases/1'
+
+
+def similarity_matrix(queries: List[str], choices: List[str]) -> np.ndarray:
+    """fuzz.ratio for every (query, choice) pair, as an integer matrix of shape (queries, choices)"""
+    if not queries or not choices:
+        return np.zeros((len(queries), len(choices)), dtype=np.int32)
+
+    if cdist is None:
+        return np.array([[fuzz.ratio(query, choice) for choice in choices] for query in queries], dtype=np.int32)
+
+    # rapidfuzz computes the same normalized Indel similarity as python-Levenshtein,
+    # fuzzywuzzy rounds it to the nearest integer
+    return np.rint(cdist(queries, choices, scorer=rapid_fuzz.ratio, dtype=np.float64)).astype(np.int32)
+
+
+def vocabulary_version(vocabulary: List[str]) -> str:
+    """Version of a table: changes with the vocabulary and with TABLE_SCORER"""
+    payload = json.dumps([TABLE_SCORER, vocabulary], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class SkillSimilarityTable:
+    """Precomputed similarity of every pair of taxonomy skill names and aliases.
+
+    Scores are fuzz.ratio, except that aliases of one canonical skill score
+    100 and, when built with embeddings, close synonyms score their cosine
+    similarity. The scores are a uint8 .npy array, memory-mapped on load and
+    indexed by a vocabulary stored next to it as JSON. A name outside the
+    vocabulary is scored with fuzz.ratio against the whole vocabulary once,
+    and its row kept in a bounded LRU (oov_cache_size names).
+    """
+
+    def __init__(self, vocabulary: List[str], table: np.ndarray, version: str = None,
+                 oov_cache_size: int = 10000, metadata: Dict = None):
+        self.vocabulary = vocabulary
+        self.table = table
+        self.version = version or vocabulary_version(vocabulary)
+        self.metadata = metadata or {}
+        self.oov_cache_size = oov_cache_size
+        self._index = {name: index for index, name in enumerate(vocabulary)}
+        self._oov_cache: OrderedDict = OrderedDict()
+        self._oov_hits = 0
+        self._oov_misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, groups: Dict[str, List[str]], encode: Callable = None, synonym_threshold: float = 0.85,
+              oov_cache_size: int = 10000) -> 'SkillSimilarityTable':
+        """Score all pairs of the names in groups (canonical skill -> its names, lowercase).
+
+        With encode (texts -> embeddings), pairs whose embeddings have a cosine
+        similarity of at least synonym_threshold score at least that similarity.
+        """
+        vocabulary = sorted({name for names in groups.values() for name in names})
+        index = {name: position for position, name in enumerate(vocabulary)}
+        table = similarity_matrix(vocabulary, vocabulary)
+        for names in groups.values():
+            positions = [index[name] for name in names]
+            table[np.ix_(positions, positions)] = 100
+
+        metadata = {'embeddings': False}
+        if encode is not None and vocabulary:
+            embeddings = np.asarray(encode(vocabulary), dtype=np.float32)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            embeddings /= norms
+            cosine = embeddings @ embeddings.T
+            synonyms = cosine >= synonym_threshold
+            table[synonyms] = np.maximum(table[synonyms], np.rint(cosine[synonyms] * 100).astype(np.int32))
+            metadata = {'embeddings': True, 'synonym_threshold': synonym_threshold}
+
+        return cls(vocabulary, np.clip(table, 0, 100).astype(np.uint8), oov_cache_size=oov_cache_size,
+                   metadata=metadata)
+
+    @classmethod
+    def load(cls, path: str, oov_cache_size: int = 10000) -> 'SkillSimilarityTable':
+        """Memory-map a saved table"""
+        with open(_vocabulary_path(path), encoding='utf-8') as vocabulary_file:
+            saved = json.load(vocabulary_file)
+        table = np.load(path, mmap_mode='r')
+        if table.shape != (len(saved['vocabulary']),) * 2:
+            raise ValueError(f"Skill similarity table {path} does not match its vocabulary")
+        return cls(saved['vocabulary'], table, saved['version'], oov_cache_size, saved.get('metadata'))
+
+    def save(self, path: str) -> None:
+        """Write the table and its vocabulary, each atomically"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as table_file:
+            np.save(table_file, np.ascontiguousarray(self.table, dtype=np.uint8))
+        os.replace(temp_path, path)
+
+        vocabulary_path = _vocabulary_path(path)
+        temp_path = f"{vocabulary_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as vocabulary_file:
+            json.dump({'version': self.version, 'metadata': self.metadata, 'vocabulary': self.vocabulary},
+                      vocabulary_file, ensure_ascii=False)
+        os.replace(temp_path, vocabulary_path)
+
+    def scores(self, queries: List[str], choices: List[str]) -> np.ndarray:
+        """Scores of lowercased queries x choices, as an integer matrix like similarity_matrix"""
+        if not queries or not choices or not self.vocabulary:
+            return similarity_matrix(queries, choices)
+
+        rows = np.fromiter((self._index.get(query, -1) for query in queries), dtype=np.intp, count=len(queries))
+        columns = np.fromiter((self._index.get(choice, -1) for choice in choices), dtype=np.intp,
+                              count=len(choices))
+        unknown_rows, unknown_columns = np.flatnonzero(rows < 0), np.flatnonzero(columns < 0)
+
+        # Each query's scores against the whole vocabulary; a name outside it is
+        # scored against the vocabulary once (through the LRU)
+        query_rows = self.table[rows]
+        if len(unknown_rows):
+            query_rows[unknown_rows] = self._oov_rows([queries[index] for index in unknown_rows])
+        result = query_rows[:, columns].astype(np.int32)
+
+        if len(unknown_columns):
+            # Scores are symmetric: a choice outside the vocabulary reads its own row
+            known_rows = np.flatnonzero(rows >= 0)
+            oov_columns = self._oov_rows([choices[index] for index in unknown_columns])
+            result[np.ix_(known_rows, unknown_columns)] = oov_columns[:, rows[known_rows]].T
+            if len(unknown_rows):
+                result[np.ix_(unknown_rows, unknown_columns)] = similarity_matrix(
+                    [queries[index] for index in unknown_rows], [choices[index] for index in unknown_columns]
+                )
+        return result
+
+    def stats(self) -> Dict:
+        """Table size and out-of-vocabulary cache usage"""
+        return {
+            'version': self.version,
+            'skills': len(self.vocabulary),
+            'embeddings': bool(self.metadata.get('embeddings')),
+            'oov_cache_entries': len(self._oov_cache),
+            'oov_cache_hits': self._oov_hits,
+            'oov_cache_misses': self._oov_misses,
+        }
+
+    def _oov_rows(self, names: List[str]) -> np.ndarray:
+        """fuzz.ratio of names outside the vocabulary against the whole vocabulary, through the LRU"""
+        rows = [None] * len(names)
+        with self._lock:
+            for position, name in enumerate(names):
+                row = self._oov_cache.get(name)
+                if row is not None:
+                    self._oov_cache.move_to_end(name)
+                    rows[position] = row
+        missing = [position for position, row in enumerate(rows) if row is None]
+        self._oov_hits += len(names) - len(missing)
+        self._oov_misses += len(missing)
+
+        if missing:
+            computed = similarity_matrix([names[position] for position in missing], self.vocabulary).astype(np.uint8)
+            with self._lock:
+                for position, row in zip(missing, computed):
+                    rows[position] = row
+                    self._oov_cache[names[position]] = row
+                while len(self._oov_cache) > self.oov_cache_size:
+                    self._oov_cache.popitem(last=False)
+        return np.stack(rows)
+
+
+def taxonomy_groups() -> Dict[str, List[str]]:
+    """Names of each canonical skill in the skill taxonomy"""
+    from skill_taxonomy import SKILL_TAXONOMY
+    return SKILL_TAXONOMY.names()
+
+
+def load_or_build_table(path: str, oov_cache_size: int = 10000) -> SkillSimilarityTable:
+    """Load the saved table if it was built for the current taxonomy, otherwise build and save one"""
+    groups = taxonomy_groups()
+    expected_version = vocabulary_version(sorted({name for names in groups.values() for name in names}))
+    try:
+        table = SkillSimilarityTable.load(path, oov_cache_size)
+        if table.version == expected_version:
+            return table
+        logger.info(f"Skill similarity table {path} is out of date; rebuilding")
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Could not load skill similarity table {path} ({e}); rebuilding")
+
+    table = SkillSimilarityTable.build(groups, oov_cache_size=oov_cache_size)
+    try:
+        table.save(path)
+    except OSError as e:
+        logger.warning(f"Could not save skill similarity table {path}: {e}")
+    return table
+
+
+def _vocabulary_path(path: str) -> str:
+    """Vocabulary JSON saved next to a table"""
+    return f"{os.path.splitext(path)[0]}.json"
+
+
+class SkillSimilarityMatrix:
+    """Similarity of each required item (rows) against each resume item (columns)"""
+
+    def __init__(self, required: List[str], candidates: List[str], required_lower: List[str] = None,
+                 table: SkillSimilarityTable = None):
+        self.required = required
+        self.candidates = candidates
+        if required_lower is None:
+            required_lower = [item.lower() for item in required]
+        candidates_lower = [item.lower() for item in candidates]
+        if table is not None:
+            self.scores = table.scores(required_lower, candidates_lower)
+        else:
+            self.scores = similarity_matrix(required_lower, candidates_lower)
+
+    def best_scores(self) -> np.ndarray:
+        """Best score per required item (0 when the resume lists nothing)"""
+        if not self.candidates:
+            return np.zeros(len(self.required), dtype=np.int32)
+        return self.scores.max(axis=1)
+
+    def best_matches(self) -> List[str]:
+        """Best matching resume item per required item (first one on ties, None when nothing scores)"""
+        if not self.candidates:
+            return [None] * len(self.required)
+        best_scores = self.best_scores()
+        return [
+            self.candidates[index] if score > 0 else None
+            for index, score in zip(self.scores.argmax(axis=1), best_scores)
+        ]
+
+    def matched_mask(self, threshold: int = MATCH_THRESHOLD) -> np.ndarray:
+        """Whether each required item has a resume item scoring at least threshold"""
+        return self.best_scores() >= threshold
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from config import Config
+
+    argument_parser = argparse.ArgumentParser(description="Build the skill similarity table for the skill taxonomy")
+    argument_parser.add_argument('--embeddings', action='store_true',
+                                 help="also score synonyms by sentence embedding similarity")
+    argument_parser.add_argument('--synonym-threshold', type=float, default=0.85,
+                                 help="minimum cosine similarity for an embedding synonym")
+    arguments = argument_parser.parse_args()
+
+    encode = None
+    if arguments.embeddings:
+        from model_registry import get_sentence_model
+        encode = get_sentence_model().encode
+
+    built = SkillSimilarityTable.build(taxonomy_groups(), encode, arguments.synonym_threshold)
+    built.save(Config.SKILL_SIMILARITY_TABLE_PATH)
+    print(f"✅ Saved {len(built.vocabulary)}x{len(built.vocabulary)} skill similarity table "
+          f"(version {built.version}) to {Config.SKILL_SIMILARITY_TABLE_PATH}")
@@ -0,0 +1,213 @@
+"""
+Skill Taxonomy Module
+Canonical skills and their aliases, compiled once into a multi-pattern matcher shared by every skill extractor
+"""
+
+import re
+import string
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # Fall back to one combined regular expression
+    ahocorasick = None
+
+TECHNICAL = 'technical'
+SOFT = 'soft'
+
+# (canonical name, category, aliases); names and aliases are lowercase
+SKILLS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ('python', TECHNICAL, ('python3',)),
+    ('java', TECHNICAL, ()),
+    ('javascript', TECHNICAL, ('js', 'ecmascript')),
+    ('react', TECHNICAL, ('react.js', 'reactjs')),
+    ('angular', TECHNICAL, ('angularjs', 'angular.js')),
+    ('vue', TECHNICAL, ('vue.js', 'vuejs')),
+    ('node.js', TECHNICAL, ('nodejs', 'node js')),
+    ('sql', TECHNICAL, ()),
+    ('mongodb', TECHNICAL, ('mongo',)),
+    ('postgresql', TECHNICAL, ('postgres',)),
+    ('mysql', TECHNICAL, ()),
+    ('aws', TECHNICAL, ('amazon web services',)),
+    ('azure', TECHNICAL, ('microsoft azure',)),
+    ('docker', TECHNICAL, ()),
+    ('kubernetes', TECHNICAL, ('k8s',)),
+    ('git', TECHNICAL, ()),
+    ('jenkins', TECHNICAL, ()),
+    ('agile', TECHNICAL, ()),
+    ('scrum', TECHNICAL, ()),
+    ('machine learning', TECHNICAL, ('ml',)),
+    ('data science', TECHNICAL, ()),
+    ('artificial intelligence', TECHNICAL, ('ai',)),
+    ('deep learning', TECHNICAL, ()),
+    ('tensorflow', TECHNICAL, ()),
+    ('pytorch', TECHNICAL, ()),
+    ('pandas', TECHNICAL, ()),
+    ('numpy', TECHNICAL, ()),
+    ('scikit-learn', TECHNICAL, ('sklearn', 'scikit learn')),
+    ('flask', TECHNICAL, ()),
+    ('django', TECHNICAL, ()),
+    ('spring', TECHNICAL, ('spring boot',)),
+    ('hibernate', TECHNICAL, ()),
+    ('microservices', TECHNICAL, ('microservice', 'micro-services')),
+    ('rest api', TECHNICAL, ('rest apis', 'restful api', 'restful apis')),
+    ('graphql', TECHNICAL, ()),
+    ('html', TECHNICAL, ('html5',)),
+    ('css', TECHNICAL, ('css3',)),
+    ('bootstrap', TECHNICAL, ()),
+    ('jquery', TECHNICAL, ()),
+    ('php', TECHNICAL, ()),
+    ('ruby', TECHNICAL, ()),
+    ('go', TECHNICAL, ('golang',)),
+    ('rust', TECHNICAL, ()),
+    ('c++', TECHNICAL, ('cpp',)),
+    ('c#', TECHNICAL, ('csharp',)),
+    ('swift', TECHNICAL, ()),
+    ('kotlin', TECHNICAL, ()),
+    ('android', TECHNICAL, ()),
+    ('ios', TECHNICAL, ()),
+    ('xamarin', TECHNICAL, ()),
+    ('tableau', TECHNICAL, ()),
+    ('power bi', TECHNICAL, ('powerbi',)),
+    ('excel', TECHNICAL, ('ms excel',)),
+    ('vba', TECHNICAL, ()),
+    ('r', TECHNICAL, ()),
+    ('matlab', TECHNICAL, ()),
+    ('sas', TECHNICAL, ()),
+    ('linux', TECHNICAL, ()),
+    ('windows', TECHNICAL, ()),
+    ('macos', TECHNICAL, ('mac os',)),
+    ('unix', TECHNICAL, ()),
+    ('bash', TECHNICAL, ()),
+    ('powershell', TECHNICAL, ()),
+    ('communication', SOFT, ()),
+    ('leadership', SOFT, ()),
+    ('teamwork', SOFT, ()),
+    ('problem solving', SOFT, ('problem-solving',)),
+    ('analytical', SOFT, ()),
+    ('creative', SOFT, ()),
+    ('adaptable', SOFT, ()),
+    ('time management', SOFT, ()),
+    ('project management', SOFT, ()),
+    ('mentoring', SOFT, ()),
+    ('collaboration', SOFT, ()),
+    ('presentation', SOFT, ()),
+    ('negotiation', SOFT, ()),
+    ('customer service', SOFT, ()),
+)
+
+# Aliases this short ('go', 'r', 'c#') occur inside many words, so they are looked up as
+# whole tokens of the text with separators blanked out. Joiners stay, so 'go-to', 'r&d'
+# and "i'd" do not match.
+SHORT_ALIAS_LENGTH = 2
+_SHORT_ALIAS_SEPARATORS = str.maketrans({
+    character: ' ' for character in string.punctuation + string.whitespace + '\u00a0\u00b7\u2013\u2014\u2022'
+    if character not in "&'-#+"
+})
+
+
+class SkillTaxonomy:
+    """Canonical skills with aliases, found as whole words in one scan of a text.
+
+    Overlapping aliases resolve leftmost-longest, so 'node.js' is not also
+    read as 'js' and 'mysql' not as 'sql'.
+    """
+
+    def __init__(self, skills: Iterable[Tuple[str, str, Tuple[str, ...]]]):
+        self.categories: Dict[str, str] = {}
+        self._order: Dict[str, int] = {}
+        self._aliases: Dict[str, str] = {}
+        for canonical, category, aliases in skills:
+            self._order[canonical] = len(self._order)
+            self.categories[canonical] = category
+            for alias in (canonical,) + tuple(aliases):
+                self._aliases[alias] = canonical
+
+        long_aliases = sorted((alias for alias in self._aliases if len(alias) > SHORT_ALIAS_LENGTH),
+                              key=len, reverse=True)
+        self._short_aliases = [alias for alias in self._aliases if len(alias) <= SHORT_ALIAS_LENGTH]
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for alias in long_aliases:
+                self._automaton.add_word(alias, (len(alias), self._aliases[alias]))
+            self._automaton.make_automaton()
+            self._short_automaton = ahocorasick.Automaton()
+            for alias in self._short_aliases:
+                self._short_automaton.add_word(f" {alias} ", (len(alias), self._aliases[alias]))
+            self._short_automaton.make_automaton()
+        else:
+            self._automaton = self._short_automaton = None
+            # Longest alternatives first: at one position the longest alias wins, as with iter_long
+            self._pattern = re.compile('|'.join(map(re.escape, long_aliases)))
+            self._short_pattern = re.compile(' (' + '|'.join(map(re.escape, self._short_aliases)) + ')(?= )')
+
+    def find(self, text: str, category: str = None) -> List[str]:
+        """Canonical skills mentioned in text (optionally of one category), in taxonomy order"""
+        if not text:
+            return []
+        text_lower = text.lower()
+        found = set()
+        span_starts, span_ends = [], []
+        for start, end, canonical in self._matches(text_lower):
+            span_starts.append(start)
+            span_ends.append(end)
+            if canonical not in found and _is_whole_word(text_lower, start, end):
+                found.add(canonical)
+
+        for start, canonical in self._short_matches(text_lower):
+            # Inside a longer alias ('js' in 'node.js') it is part of that one
+            index = bisect_right(span_starts, start) - 1
+            if index < 0 or span_ends[index] <= start:
+                found.add(canonical)
+
+        if category is not None:
+            found = [skill for skill in found if self.categories[skill] == category]
+        return sorted(found, key=self._order.__getitem__)
+
+    def canonical(self, skill: str) -> str:
+        """Canonical name of a skill or alias; unknown skills come back lowercased"""
+        key = skill.strip().lower()
+        return self._aliases.get(key, key)
+
+    def names(self) -> Dict[str, List[str]]:
+        """Every canonical skill with all of its names (itself and its aliases)"""
+        names: Dict[str, List[str]] = {skill: [] for skill in self._order}
+        for alias, canonical in self._aliases.items():
+            names[canonical].append(alias)
+        return names
+
+    def skills(self, category: str = None) -> List[str]:
+        """All canonical skills (optionally of one category), in taxonomy order"""
+        return [skill for skill in self._order if category is None or self.categories[skill] == category]
+
+    def _matches(self, text_lower: str) -> Iterator[Tuple[int, int, str]]:
+        """(start, end, canonical) of the non-overlapping occurrences of the longer aliases"""
+        if self._automaton is not None:
+            for end_index, (length, canonical) in self._automaton.iter_long(text_lower):
+                yield end_index - length + 1, end_index + 1, canonical
+        else:
+            for match in self._pattern.finditer(text_lower):
+                yield match.start(), match.end(), self._aliases[match.group()]
+
+    def _short_matches(self, text_lower: str) -> Iterator[Tuple[int, str]]:
+        """(start, canonical) of the short aliases standing alone as tokens"""
+        if not self._short_aliases:
+            return
+        padded = f" {text_lower.translate(_SHORT_ALIAS_SEPARATORS)} "
+        if self._short_automaton is not None:
+            # Keys are ' alias ': the key starts at the alias position of the unpadded text
+            for end_index, (length, canonical) in self._short_automaton.iter(padded):
+                yield end_index - length - 1, canonical
+        else:
+            for match in self._short_pattern.finditer(padded):
+                yield match.start(), self._aliases[match.group(1)]
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is not part of a longer word"""
+    return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+
+
+SKILL_TAXONOMY = SkillTaxonomy(SKILLS)
@@ -0,0 +1,197 @@
+"""
+Storage Module
+Content-addressed upload storage on the local filesystem or an S3-compatible object store
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+from config import Config
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def content_key(content_hash: str, suffix: str) -> str:
+    """Sharded object key of a file: ab/cd/abcd....pdf"""
+    return f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}{suffix}"
+
+
+def _copy_hashing(source: BinaryIO, target: BinaryIO) -> str:
+    """Copy a stream chunk by chunk and return the SHA-256 of its content"""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+        digest.update(chunk)
+        target.write(chunk)
+    return digest.hexdigest()
+
+
+class LocalStorage:
+    """Files under a root directory, named by the hash of their content"""
+
+    scheme = 'local'
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def put(self, stream: BinaryIO, suffix: str = '') -> Tuple[str, str]:
+        """Store a stream; returns (uri, content hash). Identical content is stored once."""
+        os.makedirs(self.root, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.root, prefix='.upload-', delete=False) as temp_file:
+            try:
+                content_hash = _copy_hashing(stream, temp_file)
+            except Exception:
+                temp_file.close()
+                os.remove(temp_file.name)
+                raise
+
+        key = content_key(content_hash, suffix)
+        path = os.path.join(self.root, key)
+        if os.path.exists(path):
+            os.remove(temp_file.name)
+            # Uploaded again now: keep it out of the age-based cleanup
+            os.utime(path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_file.name, path)
+        return f"{self.scheme}://{key}", content_hash
+
+    def open(self, uri: str) -> BinaryIO:
+        """Binary file object to stream the content from"""
+        return open(self._path(uri), 'rb')
+
+    @contextmanager
+    def local_copy(self, uri: str) -> Iterator[str]:
+        """Filesystem path of the content (the stored file itself)"""
+        yield self._path(uri)
+
+    def exists(self, uri: str) -> bool:
+        """Whether the content is stored"""
+        return os.path.exists(self._path(uri))
+
+    def delete(self, uri: str) -> None:
+        """Remove the content, if stored"""
+        try:
+            os.remove(self._path(uri))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, uri: str) -> str:
+        """Filesystem path of a local:// uri"""
+        return os.path.join(self.root, uri[len(self.scheme) + 3:])
+
+
+class S3Storage:
+    """Objects in an S3-compatible bucket (AWS S3, MinIO, ...), keyed by the hash of their content"""
+
+    scheme = 's3'
+
+    def __init__(self, bucket: str, prefix: str = '', endpoint_url: str = None, client=None):
+        if client is None:
+            import boto3
+            client = boto3.client('s3', endpoint_url=endpoint_url)
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def put(self, stream: BinaryIO, suffix: str = '') -> Tuple[str, str]:
+        """Store a stream; returns (uri, content hash). Identical content is uploaded once."""
+        # The key depends on the hash, so spool the upload (to disk when large) while hashing it
+        with tempfile.SpooledTemporaryFile(max_size=8 * CHUNK_SIZE) as spool:
+            content_hash = _copy_hashing(stream, spool)
+            key = self.prefix + content_key(content_hash, suffix)
+            if not self._head(key):
+                spool.seek(0)
+                self.client.upload_fileobj(spool, self.bucket, key)
+        return f"{self.scheme}://{self.bucket}/{key}", content_hash
+
+    def open(self, uri: str) -> BinaryIO:
+        """Streaming body of the object"""
+        bucket, key = self._location(uri)
+        return self.client.get_object(Bucket=bucket, Key=key)['Body']
+
+    @contextmanager
+    def local_copy(self, uri: str) -> Iterator[str]:
+        """Download the object to a temporary file (keeping its extension) for the parsers"""
+        bucket, key = self._location(uri)
+        temp_file = tempfile.NamedTemporaryFile(suffix=os.path.splitext(key)[1], delete=False)
+        try:
+            with temp_file:
+                self.client.download_fileobj(bucket, key, temp_file)
+            yield temp_file.name
+        finally:
+            os.remove(temp_file.name)
+
+    def exists(self, uri: str) -> bool:
+        """Whether the object is stored"""
+        return self._head(self._location(uri)[1])
+
+    def delete(self, uri: str) -> None:
+        """Remove the object"""
+        bucket, key = self._location(uri)
+        self.client.delete_object(Bucket=bucket, Key=key)
+
+    def _head(self, key: str) -> bool:
+        """Whether a key exists in the bucket"""
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except Exception as e:
+            if getattr(e, 'response', {}).get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            raise
+
+    def _location(self, uri: str) -> Tuple[str, str]:
+        """(bucket, key) of an s3:// uri"""
+        bucket, _, key = uri[len(self.scheme) + 3:].partition('/')
+        return bucket, key
+
+
+_lock = threading.Lock()
+_backends: Dict[str, object] = {}
+
+
+def get_storage():
+    """Return the process-wide backend new uploads are written to (Config.STORAGE_BACKEND)"""
+    return _backend(Config.STORAGE_BACKEND)
+
+
+def storage_for(uri: str):
+    """Return the backend holding a stored file, from the scheme of its uri"""
+    return _backend(uri.split('://', 1)[0])
+
+
+@contextmanager
+def local_copy(file_ref: str) -> Iterator[str]:
+    """Filesystem path of a stored file; plain paths (uploads from before storage URIs) pass through"""
+    if '://' not in file_ref:
+        yield file_ref
+        return
+    with storage_for(file_ref).local_copy(file_ref) as path:
+        yield path
+
+
+def local_path(file_ref: str) -> Optional[str]:
+    """Filesystem path of a stored file kept on local disk (local:// uris and plain paths); None otherwise"""
+    if '://' not in file_ref:
+        return file_ref
+    if file_ref.startswith(f"{LocalStorage.scheme}://"):
+        return storage_for(file_ref)._path(file_ref)
+    return None
+
+
+def _backend(name: str):
+    """Create a backend once per process"""
+    if name not in _backends:
+        with _lock:
+            if name not in _backends:
+                if name == LocalStorage.scheme:
+                    _backends[name] = LocalStorage(Config.STORAGE_LOCAL_ROOT)
+                elif name == S3Storage.scheme:
+                    _backends[name] = S3Storage(Config.S3_BUCKET, Config.S3_PREFIX, Config.S3_ENDPOINT_URL)
+                else:
+                    raise ValueError(f"Unknown storage backend: {name} (expected local or s3)")
+    return _backends[name]
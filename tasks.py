@@ -4,8 +4,11 @@ Process resume evaluations asynchronously
 """
 
 from celery import Celery
+from celery.schedules import crontab
+from celery.signals import worker_process_init
 import os
 import time
+from contextlib import ExitStack
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -29,9 +32,131 @@ celery.conf.update(
 
 # Import after Celery is configured to avoid circular imports
 from app import db
+from config import Config
 from models import Job, Resume, Evaluation
-from resume_parser import ResumeParser
-from relevance_engine import RelevanceEngine
+from utils import chunk_list
+from match_plan import job_skills_text, skills_text
+from storage import local_copy, local_path
+from skill_index import JOBS, RESUMES
+from vector_index import plan_vector
+import model_registry
+
+# Nightly skill coverage of all resumes against all active jobs, and catch-up of the
+# resume and job vector indexes and the TF-IDF corpus, and expiry of cached LLM
+# responses (run `celery -A tasks beat`)
+celery.conf.beat_schedule = {
+    'score-all-active-jobs': {
+        'task': 'tasks.score_all_active_jobs',
+        'schedule': crontab(hour=Config.NIGHTLY_SCORING_HOUR, minute=0),
+    },
+    'index-resume-embeddings': {
+        'task': 'tasks.index_resume_embeddings',
+        'schedule': crontab(hour=Config.NIGHTLY_SCORING_HOUR, minute=0),
+    },
+    'index-job-embeddings': {
+        'task': 'tasks.index_job_embeddings',
+        'schedule': crontab(hour=Config.NIGHTLY_SCORING_HOUR, minute=0),
+    },
+    'rebuild-tfidf-corpus': {
+        'task': 'tasks.rebuild_tfidf_corpus',
+        'schedule': crontab(hour=Config.NIGHTLY_SCORING_HOUR, minute=0),
+    },
+    'purge-llm-cache': {
+        'task': 'tasks.purge_llm_cache',
+        'schedule': crontab(hour=Config.NIGHTLY_SCORING_HOUR, minute=0),
+    },
+}
+
+@worker_process_init.connect
+def load_worker_models(**kwargs):
+    """Load and warm the scoring models once per worker process"""
+    try:
+        model_registry.warm_up()
+    except Exception as e:
+        # Models are loaded lazily on the first task instead
+        print(f"Warning: could not warm up scoring models: {str(e)}")
+
+def _get_match_plan(job: Job, relevance_engine) -> dict:
+    """Return the job's match plan, compiling and persisting it when missing or stale"""
+    if not relevance_engine.is_match_plan_current(job.match_plan):
+        model_registry.get_tfidf_index().add_documents({f"job:{job.id}": job_skills_text(job.requirements or {})})
+        job.match_plan = relevance_engine.compile_match_plan(job.requirements or {}, job.description)
+        db.session.commit()
+        _index_jobs([job])
+    return job.match_plan
+
+def _stamp(updated_at) -> float:
+    """Update time of a Resume or Job row as stored in the skill index"""
+    return updated_at.timestamp() if updated_at else 0.0
+
+def _index_resumes(resumes: list, removed: list = ()) -> None:
+    """Set the skill index rows of parsed resumes and drop those of removed ones"""
+    if resumes or removed:
+        model_registry.get_skill_index().update_resumes({
+            resume.id: (_stamp(resume.updated_at), (resume.parsed_data or {}).get('skills', []))
+            for resume in resumes
+        }, removed)
+
+def _embed_resumes(resumes: list) -> None:
+    """Set the resume vector index entries of parsed resumes"""
+    if resumes:
+        vectors = model_registry.get_relevance_engine().embed_resumes(
+            [resume.extracted_text or '' for resume in resumes]
+        )
+        model_registry.get_vector_index('resumes').add(
+            {resume.id: vector for resume, vector in zip(resumes, vectors) if vector is not None},
+            {resume.id: _stamp(resume.updated_at) for resume in resumes}
+        )
+
+def _index_parsed_resumes(resumes: list) -> None:
+    """Add newly parsed resumes to the skill index and the resume vector index"""
+    _index_resumes(resumes)
+    try:
+        _embed_resumes(resumes)
+    except Exception as e:
+        # The nightly index_resume_embeddings run adds them instead
+        print(f"Warning: could not add resumes to the vector index: {str(e)}")
+
+def _embed_jobs(jobs: list, removed: list = ()) -> None:
+    """Set the job vector index entries of jobs from their match plans and drop those of removed ones"""
+    vector_index = model_registry.get_vector_index('jobs')
+    vectors = {job.id: plan_vector(job.match_plan, vector_index.embedding_key) for job in jobs}
+    vector_index.add(
+        {job_id: vector for job_id, vector in vectors.items() if vector is not None},
+        {job.id: _stamp(job.updated_at) for job in jobs}
+    )
+    vector_index.remove(removed)
+
+def _index_jobs(jobs: list, removed: list = ()) -> None:
+    """Set the skill index rows and vector index entries of jobs, and drop those of removed ones"""
+    if jobs or removed:
+        model_registry.get_skill_index().update_jobs({
+            job.id: (_stamp(job.updated_at), job.requirements or {}) for job in jobs
+        }, removed)
+        try:
+            _embed_jobs(jobs, removed)
+        except Exception as e:
+            # The nightly index_job_embeddings run adds them instead
+            print(f"Warning: could not add jobs to the vector index: {str(e)}")
+
+def _create_evaluation(job_id: str, resume_id: str, evaluation_result: dict, processing_time: float) -> Evaluation:
+    """Build an Evaluation record from a RelevanceEngine result"""
+    return Evaluation(
+        job_id=job_id,
+        resume_id=resume_id,
+        relevance_score=evaluation_result['relevance_score'],
+        hard_match_score=evaluation_result['hard_match_score'],
+        semantic_match_score=evaluation_result['semantic_match_score'],
+        verdict=evaluation_result['verdict'],
+        missing_skills=evaluation_result['missing_skills'],
+        missing_certifications=evaluation_result['missing_certifications'],
+        missing_projects=evaluation_result['missing_projects'],
+        strengths=evaluation_result['strengths'],
+        weaknesses=evaluation_result['weaknesses'],
+        improvement_suggestions=evaluation_result['improvement_suggestions'],
+        detailed_feedback=evaluation_result['detailed_feedback'],
+        processing_time=processing_time
+    )
 
 @celery.task
 def process_resume_evaluation(resume_id: str, job_id: str = None):
@@ -44,16 +169,34 @@ def process_resume_evaluation(resume_id: str, job_id: str = None):
         if not resume:
             raise Exception(f"Resume with ID {resume_id} not found")
         
+        # Same file parsed since the upload: reuse its parsed data
+        if not resume.is_processed:
+            twin = resume.processed_twin()
+            if twin is not None:
+                resume.copy_parsed_data(twin)
+                db.session.commit()
+                model_registry.get_tfidf_index().add_documents({
+                    f"resume:{resume.id}": skills_text(resume.parsed_data.get('skills', []))
+                })
+                _index_parsed_resumes([resume])
+        
         # Parse resume if not already processed
         if not resume.is_processed:
-            parser = ResumeParser()
-            parsed_data = parser.parse_resume(resume.file_path)
+            parser = model_registry.get_resume_parser()
+            with local_copy(resume.file_path) as file_path:
+                parsed_data = parser.parse_resume(file_path)
             
             # Update resume with parsed data
             resume.extracted_text = parsed_data['raw_text']
             resume.parsed_data = parsed_data['structured_data']
             resume.is_processed = True
             db.session.commit()
+            
+            # Count the resume into the TF-IDF corpus and the skill and vector indexes
+            model_registry.get_tfidf_index().add_documents({
+                f"resume:{resume.id}": skills_text(resume.parsed_data.get('skills', []))
+            })
+            _index_parsed_resumes([resume])
         
         # If job_id is provided, evaluate against specific job
         if job_id:
@@ -74,31 +217,19 @@ def process_resume_evaluation(resume_id: str, job_id: str = None):
                 }
             
             # Perform evaluation
-            relevance_engine = RelevanceEngine()
+            relevance_engine = model_registry.get_relevance_engine()
             evaluation_result = relevance_engine.evaluate_relevance(
                 {
                     'raw_text': resume.extracted_text,
                     'structured_data': resume.parsed_data
                 },
-                job.requirements
+                job.requirements,
+                match_plan=_get_match_plan(job, relevance_engine)
             )
             
             # Create evaluation record
-            evaluation = Evaluation(
-                job_id=job_id,
-                resume_id=resume_id,
-                relevance_score=evaluation_result['relevance_score'],
-                hard_match_score=evaluation_result['hard_match_score'],
-                semantic_match_score=evaluation_result['semantic_match_score'],
-                verdict=evaluation_result['verdict'],
-                missing_skills=evaluation_result['missing_skills'],
-                missing_certifications=evaluation_result['missing_certifications'],
-                missing_projects=evaluation_result['missing_projects'],
-                strengths=evaluation_result['strengths'],
-                weaknesses=evaluation_result['weaknesses'],
-                improvement_suggestions=evaluation_result['improvement_suggestions'],
-                detailed_feedback=evaluation_result['detailed_feedback'],
-                processing_time=time.time() - start_time
+            evaluation = _create_evaluation(
+                job_id, resume_id, evaluation_result, time.time() - start_time
             )
             
             db.session.add(evaluation)
@@ -128,6 +259,34 @@ def process_resume_evaluation(resume_id: str, job_id: str = None):
             'processing_time': time.time() - start_time
         }
 
+@celery.task
+def index_resume(resume_id: str):
+    """Add a resume that took over the parsed data of a re-uploaded file to the TF-IDF corpus and indexes"""
+    try:
+        resume = Resume.query.get(resume_id)
+        if not resume or not resume.is_processed:
+            return {
+                'status': 'skipped',
+                'resume_id': resume_id
+            }
+        
+        model_registry.get_tfidf_index().add_documents({
+            f"resume:{resume.id}": skills_text((resume.parsed_data or {}).get('skills', []))
+        })
+        _index_parsed_resumes([resume])
+        
+        return {
+            'status': 'indexed',
+            'resume_id': resume_id
+        }
+    
+    except Exception as e:
+        db.session.rollback()
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
 @celery.task
 def batch_evaluate_resumes(job_id: str):
     """Evaluate all resumes against a specific job"""
@@ -138,28 +297,32 @@ def batch_evaluate_resumes(job_id: str):
         
         # Get all processed resumes
         resumes = Resume.query.filter_by(is_processed=True).all()
+        existing_evaluations = {
+            evaluation.resume_id: evaluation.id
+            for evaluation in Evaluation.query.filter_by(job_id=job_id).all()
+        }
         
         results = []
+        pending_resumes = []
         for resume in resumes:
-            # Check if evaluation already exists
-            existing_evaluation = Evaluation.query.filter_by(
-                job_id=job_id, resume_id=resume.id
-            ).first()
-            
-            if not existing_evaluation:
-                # Process evaluation
-                result = process_resume_evaluation.delay(resume.id, job_id)
+            if resume.id in existing_evaluations:
                 results.append({
                     'resume_id': resume.id,
                     'student_name': resume.student_name,
-                    'task_id': result.id
+                    'status': 'already_exists',
+                    'evaluation_id': existing_evaluations[resume.id]
                 })
             else:
+                pending_resumes.append(resume)
+        
+        # Score pending resumes in chunks so each task embeds many resumes at once
+        for chunk in chunk_list(pending_resumes, Config.BATCH_EVALUATION_CHUNK_SIZE):
+            result = evaluate_resume_batch.delay(job_id, [resume.id for resume in chunk])
+            for resume in chunk:
                 results.append({
                     'resume_id': resume.id,
                     'student_name': resume.student_name,
-                    'status': 'already_exists',
-                    'evaluation_id': existing_evaluation.id
+                    'task_id': result.id
                 })
         
         return {
@@ -175,6 +338,452 @@ def batch_evaluate_resumes(job_id: str):
             'message': str(e)
         }
 
+@celery.task
+def evaluate_resume_batch(job_id: str, resume_ids: list):
+    """Evaluate a chunk of processed resumes against one job in a single batched pass"""
+    start_time = time.time()
+    
+    try:
+        job = Job.query.get(job_id)
+        if not job:
+            raise Exception(f"Job with ID {job_id} not found")
+        
+        already_evaluated = {
+            evaluation.resume_id
+            for evaluation in Evaluation.query.filter(
+                Evaluation.job_id == job_id, Evaluation.resume_id.in_(resume_ids)
+            ).all()
+        }
+        resumes = [
+            resume for resume in Resume.query.filter(Resume.id.in_(resume_ids)).all()
+            if resume.is_processed and resume.id not in already_evaluated
+        ]
+        
+        relevance_engine = model_registry.get_relevance_engine()
+        evaluation_results = relevance_engine.evaluate_many(
+            [
+                {
+                    'raw_text': resume.extracted_text,
+                    'structured_data': resume.parsed_data
+                }
+                for resume in resumes
+            ],
+            job.requirements,
+            match_plan=_get_match_plan(job, relevance_engine)
+        )
+        
+        processing_time = (time.time() - start_time) / max(len(resumes), 1)
+        for resume, evaluation_result in zip(resumes, evaluation_results):
+            db.session.add(_create_evaluation(job_id, resume.id, evaluation_result, processing_time))
+        db.session.commit()
+        
+        return {
+            'status': 'completed',
+            'job_id': job_id,
+            'evaluated': len(resumes),
+            'skipped': len(resume_ids) - len(resumes),
+            'processing_time': time.time() - start_time
+        }
+    
+    except Exception as e:
+        db.session.rollback()
+        return {
+            'status': 'error',
+            'message': str(e),
+            'processing_time': time.time() - start_time
+        }
+
+@celery.task
+def evaluate_resume_jobs(resume_id: str, job_ids: list):
+    """Evaluate one processed resume against several jobs (the shortlist of its matching jobs)"""
+    start_time = time.time()
+    
+    try:
+        resume = Resume.query.get(resume_id)
+        if not resume or not resume.is_processed:
+            raise Exception(f"Processed resume with ID {resume_id} not found")
+        
+        already_evaluated = {
+            evaluation.job_id
+            for evaluation in Evaluation.query.filter(
+                Evaluation.resume_id == resume_id, Evaluation.job_id.in_(job_ids)
+            ).all()
+        }
+        jobs = [job for job in Job.query.filter(Job.id.in_(job_ids)).all() if job.id not in already_evaluated]
+        
+        # The resume's chunk embeddings are computed once and read from the embedding cache for later jobs
+        relevance_engine = model_registry.get_relevance_engine()
+        resume_data = {
+            'raw_text': resume.extracted_text,
+            'structured_data': resume.parsed_data
+        }
+        results = []
+        for job in jobs:
+            job_start_time = time.time()
+            evaluation_result = relevance_engine.evaluate_relevance(
+                resume_data, job.requirements, match_plan=_get_match_plan(job, relevance_engine)
+            )
+            evaluation = _create_evaluation(job.id, resume_id, evaluation_result, time.time() - job_start_time)
+            db.session.add(evaluation)
+            results.append(evaluation)
+        db.session.commit()
+        
+        return {
+            'status': 'completed',
+            'resume_id': resume_id,
+            'evaluations': [
+                {
+                    'job_id': evaluation.job_id,
+                    'evaluation_id': evaluation.id,
+                    'relevance_score': evaluation.relevance_score,
+                    'verdict': evaluation.verdict
+                }
+                for evaluation in results
+            ],
+            'skipped': len(job_ids) - len(jobs),
+            'processing_time': time.time() - start_time
+        }
+    
+    except Exception as e:
+        db.session.rollback()
+        return {
+            'status': 'error',
+            'message': str(e),
+            'processing_time': time.time() - start_time
+        }
+
+@celery.task
+def bulk_parse_resumes():
+    """Parse all unprocessed resumes, in chunks spread over the worker processes"""
+    try:
+        resume_ids = [resume.id for resume in Resume.query.filter_by(is_processed=False).all()]
+        
+        task_ids = [
+            parse_resume_batch.delay(chunk).id
+            for chunk in chunk_list(resume_ids, Config.BULK_PARSE_CHUNK_SIZE)
+        ]
+        
+        return {
+            'status': 'batch_started',
+            'total_resumes': len(resume_ids),
+            'task_ids': task_ids
+        }
+    
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
+@celery.task
+def parse_resume_batch(resume_ids: list):
+    """Parse a chunk of resumes, running NER over all of them in one nlp.pipe stream"""
+    start_time = time.time()
+    
+    try:
+        resumes = [
+            resume for resume in Resume.query.filter(Resume.id.in_(resume_ids)).all()
+            if not resume.is_processed
+        ]
+        
+        # Files that were already parsed (or appear twice in this chunk) are parsed only once
+        hashes = {resume.content_hash for resume in resumes if resume.content_hash}
+        parsed_by_hash = {
+            twin.content_hash: twin
+            for twin in Resume.query.filter(Resume.content_hash.in_(hashes), Resume.is_processed.is_(True)).all()
+        } if hashes else {}
+        to_parse = []
+        duplicates = []
+        for resume in resumes:
+            if resume.content_hash in parsed_by_hash:
+                duplicates.append(resume)
+            else:
+                to_parse.append(resume)
+                if resume.content_hash:
+                    parsed_by_hash[resume.content_hash] = None
+        
+        parser = model_registry.get_resume_parser()
+        failed = []
+        tfidf_documents = {}
+        indexed = []
+        with ExitStack() as local_files:
+            # Files in object storage are downloaded for the parsers
+            local_paths = {}
+            for resume in to_parse:
+                try:
+                    local_paths[resume.id] = local_files.enter_context(local_copy(resume.file_path))
+                except Exception as e:
+                    failed.append({'resume_id': resume.id, 'message': f"Error fetching file: {str(e)}"})
+            to_parse = [resume for resume in to_parse if resume.id in local_paths]
+            
+            parsed = parser.parse_many([local_paths[resume.id] for resume in to_parse])
+            for resume, parsed_data in zip(to_parse, parsed):
+                if isinstance(parsed_data, Exception):
+                    failed.append({'resume_id': resume.id, 'message': str(parsed_data)})
+                    continue
+                
+                resume.extracted_text = parsed_data['raw_text']
+                resume.parsed_data = parsed_data['structured_data']
+                resume.is_processed = True
+                tfidf_documents[f"resume:{resume.id}"] = skills_text(resume.parsed_data.get('skills', []))
+                indexed.append(resume)
+                if resume.content_hash:
+                    parsed_by_hash[resume.content_hash] = resume
+        
+        reused = 0
+        for resume in duplicates:
+            twin = parsed_by_hash[resume.content_hash]
+            if twin is None:
+                failed.append({'resume_id': resume.id, 'message': 'Duplicate of a resume that failed to parse'})
+            else:
+                resume.copy_parsed_data(twin)
+                tfidf_documents[f"resume:{resume.id}"] = skills_text(resume.parsed_data.get('skills', []))
+                indexed.append(resume)
+                reused += 1
+        db.session.commit()
+        
+        # Count the parsed resumes into the TF-IDF corpus and the skill and vector indexes
+        model_registry.get_tfidf_index().add_documents(tfidf_documents)
+        _index_parsed_resumes(indexed)
+        
+        return {
+            'status': 'completed',
+            'parsed': len(tfidf_documents) - reused,
+            'reused': reused,
+            'failed': failed,
+            'skipped': len(resume_ids) - len(resumes),
+            'processing_time': time.time() - start_time
+        }
+    
+    except Exception as e:
+        db.session.rollback()
+        return {
+            'status': 'error',
+            'message': str(e),
+            'processing_time': time.time() - start_time
+        }
+
+@celery.task
+def compile_job_match_plan(job_id: str):
+    """Compile and store the match plan of a job"""
+    try:
+        job = Job.query.get(job_id)
+        if not job:
+            raise Exception(f"Job with ID {job_id} not found")
+        
+        relevance_engine = model_registry.get_relevance_engine()
+        model_registry.get_tfidf_index().add_documents({f"job:{job.id}": job_skills_text(job.requirements or {})})
+        job.match_plan = relevance_engine.compile_match_plan(job.requirements or {}, job.description)
+        db.session.commit()
+        _index_jobs([job])
+        
+        return {
+            'status': 'completed',
+            'job_id': job_id,
+            'match_plan_version': job.match_plan['version']
+        }
+    
+    except Exception as e:
+        db.session.rollback()
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
+@celery.task
+def rebuild_tfidf_corpus():
+    """Recount TF-IDF document frequencies over all stored resumes and jobs"""
+    try:
+        tfidf_index = model_registry.get_tfidf_index()
+        documents = {
+            f"resume:{resume.id}": skills_text((resume.parsed_data or {}).get('skills', []))
+            for resume in Resume.query.filter_by(is_processed=True).all()
+        }
+        documents.update({
+            f"job:{job.id}": job_skills_text(job.requirements or {})
+            for job in Job.query.all()
+        })
+        # Counted and written in one go: readers never see a half-built corpus
+        tfidf_index.rebuild(documents)
+        
+        return {
+            'status': 'completed',
+            **tfidf_index.stats()
+        }
+    
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
+def _sync_skill_index(skill_index) -> dict:
+    """Re-read the processed resumes and active jobs changed since they were indexed; drop all others"""
+    synced = {}
+    for kind, model, query, index_rows in (
+        (RESUMES, Resume, Resume.query.filter(Resume.is_processed.is_(True)), _index_resumes),
+        (JOBS, Job, Job.query.filter(Job.is_active.is_(True)), _index_jobs),
+    ):
+        current = {
+            record_id: _stamp(updated_at)
+            for record_id, updated_at in query.with_entities(model.id, model.updated_at).all()
+        }
+        changed, removed = skill_index.stale(kind, current)
+        records = [
+            record
+            for chunk in chunk_list(changed, Config.BATCH_EVALUATION_CHUNK_SIZE)
+            for record in model.query.filter(model.id.in_(chunk)).all()
+        ]
+        index_rows(records, removed)
+        synced[kind] = {'updated': len(changed), 'removed': len(removed)}
+    return synced
+
+@celery.task
+def score_all_active_jobs(top_k: int = None, evaluate_top_k: int = None):
+    """Skill coverage of every processed resume against every active job, as one sparse matrix product"""
+    start_time = time.time()
+    
+    try:
+        skill_index = model_registry.get_skill_index()
+        synced = _sync_skill_index(skill_index)
+        ranked = skill_index.top_resumes(top_k if top_k is not None else Config.NIGHTLY_SCORING_TOP_K)
+        
+        # Fully evaluate the best-covering resumes of each job (existing evaluations are skipped)
+        evaluate_top_k = evaluate_top_k if evaluate_top_k is not None else Config.NIGHTLY_EVALUATE_TOP_K
+        task_ids = []
+        if evaluate_top_k > 0:
+            for job_id, matches in ranked.items():
+                resume_ids = [resume_id for resume_id, _ in matches[:evaluate_top_k]]
+                for chunk in chunk_list(resume_ids, Config.BATCH_EVALUATION_CHUNK_SIZE):
+                    task_ids.append(evaluate_resume_batch.delay(job_id, chunk).id)
+        
+        return {
+            'status': 'completed',
+            'synced': synced,
+            'jobs': len(ranked),
+            'resumes': skill_index.stats()['resumes'],
+            'top_matches': {
+                job_id: [{'resume_id': resume_id, 'coverage': coverage} for resume_id, coverage in matches]
+                for job_id, matches in ranked.items()
+            },
+            'task_ids': task_ids,
+            'processing_time': time.time() - start_time
+        }
+    
+    except Exception as e:
+        db.session.rollback()
+        return {
+            'status': 'error',
+            'message': str(e),
+            'processing_time': time.time() - start_time
+        }
+
+@celery.task
+def index_resume_embeddings():
+    """Embed the processed resumes missing from the resume vector index or changed since; drop the rest"""
+    start_time = time.time()
+    
+    try:
+        vector_index = model_registry.get_vector_index('resumes')
+        current = {
+            resume_id: _stamp(updated_at)
+            for resume_id, updated_at in Resume.query.filter(Resume.is_processed.is_(True))
+            .with_entities(Resume.id, Resume.updated_at).all()
+        }
+        indexed = vector_index.stamps()
+        changed = [resume_id for resume_id, stamp in current.items() if indexed.get(resume_id) != stamp]
+        removed = [resume_id for resume_id in indexed if resume_id not in current]
+        
+        # Chunks embed many resumes per batched model call
+        for chunk in chunk_list(changed, Config.BATCH_EVALUATION_CHUNK_SIZE):
+            _embed_resumes(Resume.query.filter(Resume.id.in_(chunk)).all())
+        vector_index.remove(removed)
+        
+        return {
+            'status': 'completed',
+            'embedded': len(changed),
+            'removed': len(removed),
+            **vector_index.stats(),
+            'processing_time': time.time() - start_time
+        }
+    
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': str(e),
+            'processing_time': time.time() - start_time
+        }
+
+@celery.task
+def index_job_embeddings():
+    """Add the active jobs missing from the job vector index or changed since; drop the rest"""
+    start_time = time.time()
+    
+    try:
+        vector_index = model_registry.get_vector_index('jobs')
+        current = {
+            job_id: _stamp(updated_at)
+            for job_id, updated_at in Job.query.filter(Job.is_active.is_(True))
+            .with_entities(Job.id, Job.updated_at).all()
+        }
+        indexed = vector_index.stamps()
+        changed = [job_id for job_id, stamp in current.items() if indexed.get(job_id) != stamp]
+        removed = [job_id for job_id in indexed if job_id not in current]
+        
+        # Job vectors come from the match plans; jobs without a current plan are added once it is compiled
+        compiling = 0
+        for chunk in chunk_list(changed, Config.BATCH_EVALUATION_CHUNK_SIZE):
+            jobs = Job.query.filter(Job.id.in_(chunk)).all()
+            _embed_jobs(jobs)
+            for job in jobs:
+                if plan_vector(job.match_plan, vector_index.embedding_key) is None:
+                    compile_job_match_plan.delay(job.id)
+                    compiling += 1
+        vector_index.remove(removed)
+        
+        return {
+            'status': 'completed',
+            'embedded': len(changed) - compiling,
+            'compiling': compiling,
+            'removed': len(removed),
+            **vector_index.stats(),
+            'processing_time': time.time() - start_time
+        }
+    
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': str(e),
+            'processing_time': time.time() - start_time
+        }
+
+@celery.task
+def get_model_status():
+    """Report load state and memory footprint of the models in a worker"""
+    return model_registry.get_status()
+
+@celery.task
+def purge_llm_cache():
+    """Delete the LLM responses older than LLM_CACHE_TTL from the cache"""
+    try:
+        llm_cache = model_registry.get_llm_cache()
+        if llm_cache is None:
+            return {
+                'status': 'disabled'
+            }
+        
+        return {
+            'status': 'completed',
+            'purged': llm_cache.purge_expired(),
+            **llm_cache.stats()
+        }
+    
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
+
 @celery.task
 def cleanup_old_files():
     """Clean up old uploaded files"""
@@ -185,11 +794,20 @@ def cleanup_old_files():
         upload_folder = os.path.join(os.getcwd(), 'uploads')
         cutoff_date = datetime.now() - timedelta(days=30)  # 30 days old
         
+        # Stored files are shared by every resume with the same content: keep any still referenced
+        referenced = set()
+        for (file_ref,) in Resume.query.with_entities(Resume.file_path).distinct():
+            path = local_path(file_ref) if file_ref else None
+            if path:
+                referenced.add(os.path.realpath(path))
+        
         cleaned_files = 0
         for root, dirs, files in os.walk(upload_folder):
             for file in files:
                 file_path = os.path.join(root, file)
-                file_time = datetime.fromtimestamp(os.path.getctime(file_path))
+                if os.path.realpath(file_path) in referenced:
+                    continue
+                file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
                 
                 if file_time < cutoff_date:
                     try:
@@ -0,0 +1,122 @@
+"""
+Test script for the persistent embedding cache
+Checks key normalization, hit/miss counting, sharing between instances and recovery from interrupted appends
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from embedding_store import EmbeddingStore
+
+
+class CountingEncoder:
+    """Deterministic 4-dimensional encoder that records the texts it was asked to encode"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[len(text), text.count(' '), sum(map(ord, text)) % 97, 1.0] for text in texts],
+                        dtype=np.float32)
+
+
+def test_keys_and_counters():
+    """Whitespace-only differences share a key; only missing texts are encoded, once each"""
+    print("🧪 Testing keys and counters...")
+    with tempfile.TemporaryDirectory() as directory:
+        store = EmbeddingStore(directory, 'org/model', '1')
+        assert store.key_for('Python  developer\n') == store.key_for(' Python developer')
+        assert store.key_for('Python developer') != EmbeddingStore(directory, 'org/model', '2').key_for(
+            'Python developer')
+
+        encoder = CountingEncoder()
+        first = store.encode(['Python developer', 'SQL', 'Python  developer'], encoder)
+        assert encoder.calls == [['Python developer', 'SQL']]
+        assert np.array_equal(first[0], first[2])
+        assert store.stats()['hits'] == 0 and store.stats()['misses'] == 3
+
+        second = store.encode(['SQL', 'Docker'], encoder)
+        assert encoder.calls[-1] == ['Docker']
+        assert np.array_equal(second[0], first[1])
+        stats = store.stats()
+        assert (stats['hits'], stats['misses'], stats['entries'], stats['dimension']) == (1, 4, 3, 4), stats
+        assert store.encode([], encoder).shape == (0, 4)
+    print("✅ Keys normalized and lookups counted")
+    return True
+
+
+def test_shared_between_instances():
+    """Vectors appended by one instance are read by another without encoding again"""
+    print("🧪 Testing sharing between instances...")
+    with tempfile.TemporaryDirectory() as directory:
+        writer, reader = EmbeddingStore(directory, 'model', '1'), EmbeddingStore(directory, 'model', '1')
+        encoder = CountingEncoder()
+        expected = writer.encode(['Python', 'Flask'], encoder)
+
+        assert np.array_equal(reader.encode(['Flask', 'Python'], encoder), expected[::-1])
+        assert len(encoder.calls) == 1 and reader.stats()['hits'] == 2
+
+        fresh = EmbeddingStore(directory, 'model', '1')
+        assert fresh.stats()['entries'] == 2
+        assert np.array_equal(fresh.encode(['Python'], encoder)[0], expected[0])
+    print("✅ Other instances read appended vectors")
+    return True
+
+
+def test_interrupted_appends():
+    """A partial id line or vector rows without ids are ignored and overwritten by the next append"""
+    print("🧪 Testing recovery from interrupted appends...")
+    with tempfile.TemporaryDirectory() as directory:
+        store = EmbeddingStore(directory, 'model', '1')
+        encoder = CountingEncoder()
+        expected = store.encode(['Python', 'Flask'], encoder)
+
+        # Crash after writing vectors and part of an id line
+        with open(store.vectors_path, 'ab') as vectors_file:
+            vectors_file.write(np.ones((3, 4), dtype=np.float32).tobytes())
+        with open(store.ids_path, 'a') as ids_file:
+            ids_file.write(store.key_for('Docker')[:20])
+
+        recovered = EmbeddingStore(directory, 'model', '1')
+        assert recovered.stats()['entries'] == 2
+        assert np.array_equal(recovered.encode(['Python', 'Flask'], encoder), expected)
+
+        docker = recovered.encode(['Docker', 'SQL'], encoder)
+        assert encoder.calls[-1] == ['Docker', 'SQL']
+        assert os.path.getsize(store.vectors_path) == 4 * 4 * 4
+
+        reopened = EmbeddingStore(directory, 'model', '1')
+        assert reopened.stats()['entries'] == 4
+        assert np.array_equal(reopened.encode(['Python', 'Flask', 'Docker', 'SQL'], encoder),
+                              np.vstack([expected, docker]))
+        assert len(encoder.calls) == 2
+    print("✅ Interrupted appends recovered")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Embedding Store - Test Suite")
+    print("=" * 50)
+
+    tests = [test_keys_and_counters, test_shared_between_instances, test_interrupted_appends]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
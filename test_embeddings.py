@@ -0,0 +1,118 @@
+"""
+Parity test for the embedding backends
+Checks ONNX Runtime embeddings (full precision and int8) against the PyTorch reference
+"""
+
+import sys
+
+import numpy as np
+
+from config import Config
+from embedding_backends import load_backend
+
+SENTENCES = [
+    "Backend engineer with 4 years of experience building Python web services.",
+    "Built REST APIs with Flask and PostgreSQL, deployed on AWS with Docker and Kubernetes.",
+    "Machine learning pipeline ranking resumes with scikit-learn.",
+    "Bachelor of Technology in Computer Science",
+    "Python, Flask, Django, PostgreSQL, Docker, Kubernetes, AWS, Git, REST API",
+    "We are hiring a backend developer to build scalable web APIs in Python.",
+    "Excellent communication skills and experience working in agile teams.",
+    "",
+]
+
+# Minimum cosine similarity between a backend's embedding and the reference
+TOLERANCES = {
+    'onnx': 0.9999,
+    'onnx-int8': 0.98,
+}
+
+
+def load_or_skip(backend_name):
+    """Load a backend, or return None when its dependencies or model files are not available"""
+    try:
+        return load_backend(backend_name, Config.SENTENCE_TRANSFORMER_MODEL, Config.ONNX_MODEL_DIR)
+    except Exception as e:
+        print(f"⚠️  Skipping {backend_name} backend: {e}")
+        return None
+
+
+def normalized(embeddings):
+    """L2-normalize rows, leaving zero rows untouched"""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
+
+
+def test_backend_parity():
+    """ONNX embeddings match the PyTorch reference within tolerance"""
+    print("🧪 Testing embedding backend parity...")
+
+    reference_backend = load_or_skip('torch')
+    if reference_backend is None:
+        return True
+    reference = normalized(reference_backend.encode(SENTENCES, batch_size=4))
+
+    for backend_name, tolerance in TOLERANCES.items():
+        backend = load_or_skip(backend_name)
+        if backend is None:
+            continue
+
+        embeddings = normalized(backend.encode(SENTENCES, batch_size=4))
+        assert embeddings.shape == reference.shape, (backend_name, embeddings.shape, reference.shape)
+
+        similarities = (embeddings * reference).sum(axis=1)
+        assert similarities.min() >= tolerance, (backend_name, similarities.min())
+
+        # Rankings of sentence pairs must not change
+        assert np.array_equal(
+            np.argsort(embeddings @ embeddings.T, axis=1)[:, -3:],
+            np.argsort(reference @ reference.T, axis=1)[:, -3:]
+        ), backend_name
+        print(f"✅ {backend_name}: min cosine to reference {similarities.min():.5f} (>= {tolerance})")
+
+    return True
+
+
+def test_batch_independence():
+    """Embeddings do not depend on batch size or on the order of the texts"""
+    print("🧪 Testing batch independence...")
+
+    for backend_name in TOLERANCES:
+        backend = load_or_skip(backend_name)
+        if backend is None:
+            continue
+
+        one_by_one = normalized(np.vstack([backend.encode([sentence]) for sentence in SENTENCES]))
+        batched = normalized(backend.encode(SENTENCES[::-1], batch_size=3)[::-1])
+        # int8 activations are quantized per batch, so allow the parity tolerance
+        # (the empty sentence is left out: its embedding may be all zeros)
+        similarities = (one_by_one * batched).sum(axis=1)[:-1]
+        assert similarities.min() >= TOLERANCES[backend_name], (backend_name, similarities.min())
+        print(f"✅ {backend_name}: batched and single embeddings agree")
+
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Embedding Backends - Parity Tests")
+    print("=" * 50)
+
+    tests = [test_backend_parity, test_batch_independence]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
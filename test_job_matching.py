@@ -0,0 +1,111 @@
+"""
+Test script for reverse matching (jobs for a resume)
+Checks the skill coverage prefilter, the nearest-vector exception and the combined ranking of active jobs
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from job_matching import rank_jobs
+from skill_index import SkillIndex
+from vector_index import VectorIndex
+
+JOB_VECTORS = (['backend', 'data', 'frontend'], np.array([[1.0, 0.0], [0.6, 0.8], [0.0, 1.0]], dtype=np.float32))
+
+
+def test_prefilter_and_order():
+    """Jobs are ordered by weighted coverage and similarity; those below the minimum coverage rank only when near"""
+    print("🧪 Testing ranking...")
+    coverage = {'backend': 0.5, 'data': 0.5, 'frontend': 0.0, 'inactive': 1.0}
+    ranked = rank_jobs(['backend', 'data', 'frontend'], coverage, JOB_VECTORS, np.array([1.0, 0.0]), k=5)
+    assert [match['job_id'] for match in ranked] == ['backend', 'data'], ranked
+    assert ranked[0] == {'job_id': 'backend', 'score': 75.0, 'skill_coverage': 0.5, 'similarity': 1.0}
+    assert ranked[1]['score'] == 55.0
+
+    # No skill overlap, but near enough to the resume to beat a job covering half the skills
+    ranked = rank_jobs(['backend', 'data', 'frontend'], coverage, JOB_VECTORS, np.array([0.0, 1.0]), k=2,
+                       nearest_job_ids=['frontend', 'data'])
+    assert [(match['job_id'], match['score']) for match in ranked] == [('data', 65.0), ('frontend', 50.0)], ranked
+    ranked = rank_jobs(['backend', 'data', 'frontend'], coverage, JOB_VECTORS, np.array([0.0, 1.0]), k=2)
+    assert [match['job_id'] for match in ranked] == ['data', 'backend'], ranked
+
+    # Nearest jobs that are not active are not ranked
+    ranked = rank_jobs(['backend'], coverage, JOB_VECTORS, np.array([1.0, 0.0]), k=5, nearest_job_ids=['inactive'])
+    assert [match['job_id'] for match in ranked] == ['backend'], ranked
+
+    ranked = rank_jobs(['backend', 'data', 'frontend'], coverage, JOB_VECTORS, np.array([0.0, 1.0]), k=5,
+                       min_skill_coverage=0.0)
+    assert [match['job_id'] for match in ranked] == ['data', 'frontend', 'backend'], ranked
+    assert rank_jobs(['backend'], coverage, JOB_VECTORS, None, k=5, min_skill_coverage=0.6) == []
+    print("✅ Jobs prefiltered and ranked")
+    return True
+
+
+def test_missing_vectors():
+    """Without a resume vector, or for jobs not in the vector index, similarity counts as 0"""
+    print("🧪 Testing missing vectors...")
+    coverage = {'backend': 0.2, 'new': 0.9}
+    ranked = rank_jobs(['backend', 'new'], coverage, JOB_VECTORS, np.array([1.0, 0.0]), k=5)
+    assert [(match['job_id'], match['similarity']) for match in ranked] == [('backend', 1.0), ('new', 0.0)]
+    ranked = rank_jobs(['backend', 'new'], coverage, ([], np.zeros((0, 0))), None, k=5)
+    assert [match['score'] for match in ranked] == [45.0, 10.0]
+    print("✅ Missing vectors score no similarity")
+    return True
+
+
+def test_indexes_feed_ranking():
+    """Coverage from the skill index and vectors from the job vector index rank the jobs"""
+    print("🧪 Testing ranking from the indexes...")
+    with tempfile.TemporaryDirectory() as directory:
+        skill_index = SkillIndex(os.path.join(directory, 'skills.npz'))
+        skill_index.update_jobs({
+            'backend': (1.0, {'must_have_skills': ['Python', 'Django']}),
+            'frontend': (1.0, {'must_have_skills': ['React', 'CSS']}),
+        })
+        coverage = skill_index.job_coverage(['python3', 'Docker'])
+        assert coverage == {'backend': 0.5}, coverage
+        assert skill_index.job_coverage(['Terraform']) == {}
+
+        job_index = VectorIndex(os.path.join(directory, 'vectors'), 'jobs', 'test@1')
+        job_index.add({'backend': np.array([1.0, 0.0]), 'frontend': np.array([0.0, 1.0])})
+        ids, vectors = job_index.vectors()
+        assert sorted(ids) == ['backend', 'frontend'] and vectors.shape == (2, 2)
+        assert np.allclose(job_index.vector('frontend'), [0.0, 1.0]) and job_index.vector('missing') is None
+
+        resume_vector = np.array([0.0, 1.0])
+        nearest_job_ids = [job_id for job_id, _ in job_index.search(resume_vector, 1)]
+        assert nearest_job_ids == ['frontend']
+        ranked = rank_jobs(['backend', 'frontend'], coverage, job_index.vectors(), resume_vector, k=5,
+                           nearest_job_ids=nearest_job_ids)
+        assert [(match['job_id'], match['score']) for match in ranked] == [('frontend', 50.0), ('backend', 25.0)]
+        ranked = rank_jobs(['backend', 'frontend'], coverage, job_index.vectors(), resume_vector, k=5)
+        assert [match['job_id'] for match in ranked] == ['backend']
+    print("✅ Indexes feed the ranking")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Job Matching - Test Suite")
+    print("=" * 50)
+
+    tests = [test_prefilter_and_order, test_missing_vectors, test_indexes_feed_ranking]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,100 @@
+"""
+Test script for the persistent LLM response cache
+Checks TTL expiry, LRU eviction beyond max_entries and purging of expired entries
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from llm_cache import LLMCache
+
+
+def age(cache, key, seconds):
+    """Move an entry's creation time into the past"""
+    with cache._connection:
+        cache._connection.execute('UPDATE llm_responses SET created_at = created_at - ? WHERE key = ?',
+                                  (seconds, key))
+
+
+def test_hits_and_expiry():
+    """Entries are returned until their TTL has passed, then dropped on lookup"""
+    print("🧪 Testing TTL expiry...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = LLMCache(os.path.join(directory, 'cache.sqlite3'), ttl_seconds=60, max_entries=10)
+        key = LLMCache.key_for('prompt', 'gpt-test', 0.3)
+        assert key != LLMCache.key_for('prompt', 'gpt-test', 0.7)
+        assert cache.get(key) is None
+
+        cache.set(key, '{"score": 80}', 'gpt-test')
+        assert cache.get(key) == '{"score": 80}'
+        # Another process's instance reads the same file
+        assert LLMCache(cache.path, ttl_seconds=60, max_entries=10).get(key) == '{"score": 80}'
+
+        age(cache, key, 61)
+        assert cache.get(key) is None
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (1, 2, 0), stats
+    print("✅ Expired entries not returned")
+    return True
+
+
+def test_lru_eviction():
+    """Beyond max_entries the least recently used entries are evicted"""
+    print("🧪 Testing LRU eviction...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = LLMCache(os.path.join(directory, 'cache.sqlite3'), ttl_seconds=60, max_entries=2)
+        for key in ('a', 'b'):
+            cache.set(key, key.upper(), 'gpt-test')
+            time.sleep(0.01)
+        assert cache.get('a') == 'A'
+        time.sleep(0.01)
+
+        cache.set('c', 'C', 'gpt-test')
+        assert cache.get('b') is None
+        assert (cache.get('a'), cache.get('c')) == ('A', 'C')
+        assert cache.stats()['entries'] == 2
+    print("✅ Least recently used entry evicted")
+    return True
+
+
+def test_purge_expired():
+    """Purging removes every expired entry without looking them up"""
+    print("🧪 Testing purge of expired entries...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = LLMCache(os.path.join(directory, 'cache.sqlite3'), ttl_seconds=60, max_entries=10)
+        for key in ('old-1', 'old-2', 'fresh'):
+            cache.set(key, key, 'gpt-test')
+        age(cache, 'old-1', 120)
+        age(cache, 'old-2', 61)
+
+        assert cache.purge_expired() == 2
+        assert cache.stats()['entries'] == 1 and cache.get('fresh') == 'fresh'
+        assert cache.purge_expired() == 0
+    print("✅ Expired entries purged")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 LLM Cache - Test Suite")
+    print("=" * 50)
+
+    tests = [test_hits_and_expiry, test_lru_eviction, test_purge_expired]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,213 @@
+"""
+Test script for the concurrent LLM client
+Runs against a local fake OpenAI chat-completions server, no API key or network needed
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from llm_client import LLMClient, LLMError, LocalTokenBucket, RedisTokenBucket
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Answers /chat/completions by echoing the prompt; prompts may ask for failures first"""
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = payload['messages'][0]['content']
+
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            attempt = server.attempts.get(prompt, 0)
+            server.attempts[prompt] = attempt + 1
+
+        try:
+            time.sleep(server.latency)
+            if prompt.startswith('rate-limited') and attempt == 0:
+                self._respond(429, {'error': {'message': 'Rate limit reached'}}, {'Retry-After': '0'})
+            elif prompt.startswith('flaky') and attempt < 2:
+                self._respond(503, {'error': {'message': 'Service unavailable'}})
+            elif prompt.startswith('bad-request'):
+                self._respond(400, {'error': {'message': 'Invalid request'}})
+            else:
+                content = json.dumps({'score': 80, 'reasoning': f"echo: {prompt}"})
+                self._respond(200, {'choices': [{'message': {'role': 'assistant', 'content': content}}]})
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _respond(self, status, body, headers=None):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FlakyRedisClient:
+    """The part of the redis client API the rate limiter uses; the script fails while down is set"""
+
+    def __init__(self):
+        self.down = False
+        self.calls = 0
+
+    def register_script(self, script):
+        def run(keys, args):
+            self.calls += 1
+            if self.down:
+                raise ConnectionError('Connection refused')
+            return b'0'
+        return run
+
+
+def start_fake_server(latency=0.05):
+    """Start the fake API on a free local port; returns the server"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOpenAIHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.latency = latency
+    server.requests = 0
+    server.in_flight = 0
+    server.max_in_flight = 0
+    server.attempts = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_client(server, **kwargs):
+    """Client pointed at the fake server, with fast backoff"""
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    kwargs.setdefault('backoff_base', 0.01)
+    return LLMClient(base_url, 'test-key', 'gpt-test', **kwargs)
+
+
+def test_concurrency():
+    """Many prompts are sent in parallel, never exceeding the concurrency limit"""
+    print("🧪 Testing concurrent completions...")
+    server = start_fake_server(latency=0.05)
+    try:
+        client = make_client(server, max_concurrency=8)
+        prompts = [f"resume {i}" for i in range(64)]
+
+        start_time = time.time()
+        responses = client.complete_many(prompts)
+        elapsed = time.time() - start_time
+
+        assert [json.loads(r)['reasoning'] for r in responses] == [f"echo: {p}" for p in prompts]
+        assert 1 < server.max_in_flight <= 8, server.max_in_flight
+        # 64 requests of 50ms each take 3.2s one at a time
+        assert elapsed < 1.6, elapsed
+        print(f"✅ 64 completions in {elapsed:.2f}s, at most {server.max_in_flight} in flight")
+        return True
+    finally:
+        server.shutdown()
+
+
+def test_retries():
+    """429 and 5xx responses are retried, other errors are returned per prompt"""
+    print("🧪 Testing retries...")
+    server = start_fake_server(latency=0)
+    try:
+        client = make_client(server, max_concurrency=4, max_retries=3)
+        responses = client.complete_many(['rate-limited a', 'flaky b', 'bad-request c', 'ok d'])
+
+        assert json.loads(responses[0])['reasoning'] == 'echo: rate-limited a'
+        assert json.loads(responses[1])['reasoning'] == 'echo: flaky b'
+        assert isinstance(responses[2], LLMError) and 'HTTP 400' in str(responses[2])
+        assert json.loads(responses[3])['reasoning'] == 'echo: ok d'
+        assert server.attempts == {'rate-limited a': 2, 'flaky b': 3, 'bad-request c': 1, 'ok d': 1}
+        print("✅ Rate-limited and failing requests retried, client errors not retried")
+
+        client = make_client(server, max_retries=1)
+        responses = client.complete_many(['flaky e'])
+        assert isinstance(responses[0], LLMError) and 'HTTP 503' in str(responses[0])
+        print("✅ Gives up after max_retries")
+        return True
+    finally:
+        server.shutdown()
+
+
+def test_rate_limit():
+    """The token bucket caps the request rate"""
+    print("🧪 Testing rate limiting...")
+    server = start_fake_server(latency=0)
+    try:
+        # 20 requests/s with a burst of 5: 25 requests need at least 1s
+        client = make_client(server, max_concurrency=16, rate_limiter=LocalTokenBucket(rate=20, capacity=5))
+
+        start_time = time.time()
+        responses = client.complete_many([f"resume {i}" for i in range(25)])
+        elapsed = time.time() - start_time
+
+        assert all(isinstance(response, str) for response in responses)
+        assert elapsed >= 0.95, elapsed
+        print(f"✅ 25 requests at 20/s took {elapsed:.2f}s")
+        return True
+    finally:
+        server.shutdown()
+
+
+def test_redis_recovery():
+    """A Redis outage limits per process for the cooldown only, then the shared bucket is used again"""
+    print("🧪 Testing Redis outage and recovery...")
+    redis_client = FlakyRedisClient()
+    bucket = RedisTokenBucket(redis_client, 'llm:test', rate=1, capacity=2, fallback_cooldown=0.2)
+    assert bucket.try_acquire() == 0.0 and redis_client.calls == 1
+
+    redis_client.down = True
+    assert bucket.try_acquire() == 0.0 and redis_client.calls == 2
+    # During the cooldown Redis is not tried; the local bucket runs out of tokens
+    assert bucket.try_acquire() == 0.0 and bucket.try_acquire() > 0
+    assert redis_client.calls == 2
+
+    redis_client.down = False
+    time.sleep(0.25)
+    assert bucket.try_acquire() == 0.0 and redis_client.calls == 3
+    print("✅ Shared rate limit restored after the outage")
+    return True
+
+
+def test_missing_api_key():
+    """Without an API key every prompt fails fast"""
+    print("🧪 Testing missing API key...")
+    client = LLMClient('http://127.0.0.1:9/v1', None, 'gpt-test')
+    responses = client.complete_many(['a', 'b'])
+    assert all(isinstance(response, LLMError) for response in responses)
+    print("✅ Missing API key reported per prompt")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 LLM Client - Test Suite")
+    print("=" * 50)
+
+    tests = [test_concurrency, test_retries, test_rate_limit, test_redis_recovery, test_missing_api_key]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
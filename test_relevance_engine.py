@@ -0,0 +1,196 @@
+"""
+Test script for the relevance engine
+Runs the engine with a hashing stand-in for the sentence model and a recording stand-in LLM client
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from config import Config
+from embedding_store import EmbeddingStore
+from llm_cache import LLMCache
+from relevance_engine import RelevanceEngine
+from skill_similarity import load_or_build_table
+from tfidf_index import CorpusTfidf
+
+JOB_REQUIREMENTS = {
+    'must_have_skills': ['Python', 'Flask', 'PostgreSQL'],
+    'good_to_have_skills': ['Docker'],
+    'description': 'Backend developer building Python web services with Flask and PostgreSQL.'
+}
+
+RESUME = {
+    'raw_text': 'Backend engineer. Built Python web services with Flask and PostgreSQL, deployed with Docker.',
+    'structured_data': {'skills': ['Python', 'Flask', 'PostgreSQL', 'Docker']}
+}
+
+
+class HashingSentenceModel:
+    """The part of the SentenceTransformer API the engine uses: hashed bag-of-words vectors"""
+
+    def encode(self, texts, batch_size=32, **kwargs):
+        vectors = np.zeros((len(texts), 64), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row, int(hashlib.md5(word.encode('utf-8')).hexdigest(), 16) % 64] += 1.0
+            vectors[row, 0] += 0.01
+        return vectors
+
+
+class RecordingLLMClient:
+    """The part of the LLM client API the engine uses; answers every prompt with the same score"""
+
+    model = 'gpt-test'
+
+    def __init__(self, score=70):
+        self.score = score
+        self.prompts = []
+
+    def complete_many(self, prompts, temperature=0.3, max_tokens=500):
+        self.prompts.extend(prompts)
+        return [json.dumps({'score': self.score, 'reasoning': 'stand-in'}) for _ in prompts]
+
+
+def make_engine(directory, llm_client=None):
+    """Engine whose models, caches and indexes all live under a temporary directory"""
+    return RelevanceEngine(
+        sentence_model=HashingSentenceModel(),
+        embedding_store=EmbeddingStore(os.path.join(directory, 'embeddings'), 'hashing', '1'),
+        tfidf_index=CorpusTfidf(os.path.join(directory, 'tfidf.npz'), n_features=2 ** 12),
+        llm_cache=LLMCache(os.path.join(directory, 'llm_cache.sqlite3'), ttl_seconds=3600, max_entries=100),
+        llm_client=llm_client or RecordingLLMClient(),
+        skill_table=load_or_build_table(os.path.join(directory, 'skill_similarity.npy'))
+    )
+
+
+def test_llm_cache_hit_reported():
+    """The second evaluation of the same pair reuses the cached LLM response and says so"""
+    print("🧪 Testing LLM cache hits...")
+    with tempfile.TemporaryDirectory() as directory:
+        llm_client = RecordingLLMClient()
+        engine = make_engine(directory, llm_client)
+        engine.cascade_scoring = False
+
+        first = engine.evaluate_relevance(RESUME, JOB_REQUIREMENTS)
+        second = engine.evaluate_relevance(RESUME, JOB_REQUIREMENTS)
+        assert first['scoring_details']['llm_reasoning']['cache_hit'] is False
+        assert second['scoring_details']['llm_reasoning']['cache_hit'] is True
+        assert len(llm_client.prompts) == 1
+        assert second['relevance_score'] == first['relevance_score']
+    print("✅ Cached LLM responses reused")
+    return True
+
+
+def test_cascade_keeps_verdict():
+    """The LLM is skipped only when no LLM score could change the verdict, and the skip is reported"""
+    print("🧪 Testing cascade scoring...")
+    with tempfile.TemporaryDirectory() as directory:
+        llm_client = RecordingLLMClient()
+        engine = make_engine(directory, llm_client)
+        engine.cascade_scoring = True
+        engine.llm_cache = None  # every LLM call reaches the client
+        plan = engine.compile_match_plan(JOB_REQUIREMENTS)
+        skill_matrix, cert_matrix, _, hard_match_details = engine._run_hard_match(RESUME, plan)
+
+        # (hard match, semantic) -> whether the LLM is needed; partial score = 0.4 * (hard + semantic)
+        cases = [
+            ((49.99, 49.99), False),   # 39.99: Low for any LLM score
+            ((50.01, 50.01), True),    # 40.01: Low or Medium
+            ((74.99, 74.99), True),    # 59.99: Low, Medium or High
+            ((75.01, 75.01), True),    # 60.01: Medium or High
+            ((100.0, 99.9), True),     # 79.96: Medium or High
+            ((100.0, 100.0), False),   # 80.00: High for any LLM score
+        ]
+        for (hard_match_score, semantic_score), needs_llm in cases:
+            hard_match = (skill_matrix, cert_matrix, hard_match_score, hard_match_details)
+            calls = len(llm_client.prompts)
+            result = engine._score_resume(RESUME, JOB_REQUIREMENTS, plan, semantic_score, {}, hard_match=hard_match)
+            called = len(llm_client.prompts) > calls
+            assert called == needs_llm, (hard_match_score, semantic_score)
+
+            llm_details = result['scoring_details']['llm_reasoning']
+            assert bool(llm_details.get('skipped')) != needs_llm
+            assert ('llm_reasoning' in result['stages']) == needs_llm, result['stages']
+
+            verdicts = {
+                engine._score_resume(RESUME, JOB_REQUIREMENTS, plan, semantic_score, {}, (llm_score, {}),
+                                     hard_match)['verdict']
+                for llm_score in (0.0, 100.0)
+            }
+            if not needs_llm:
+                assert verdicts == {result['verdict']}, (hard_match_score, semantic_score, verdicts)
+            else:
+                assert len(verdicts) == 2
+
+        # Without the cascade, or when semantic matching failed, the LLM is always asked
+        calls = len(llm_client.prompts)
+        engine._score_resume(RESUME, JOB_REQUIREMENTS, plan, 100.0, {'error': 'no embedding'},
+                             hard_match=(skill_matrix, cert_matrix, 100.0, hard_match_details))
+        engine.cascade_scoring = False
+        engine._score_resume(RESUME, JOB_REQUIREMENTS, plan, 0.0, {},
+                             hard_match=(skill_matrix, cert_matrix, 0.0, hard_match_details))
+        assert len(llm_client.prompts) == calls + 2
+    print("✅ Skipped LLM calls never change the verdict")
+    return True
+
+
+def test_chunk_pooling_in_batches():
+    """Resumes with different chunk counts scored in one batch match scoring each alone, and a manual max-mean"""
+    print("🧪 Testing chunk pooling...")
+    saved = Config.SEMANTIC_CHUNKING, Config.SEMANTIC_CHUNK_WORDS, Config.SEMANTIC_MAX_RESUME_CHUNKS
+    Config.SEMANTIC_CHUNKING, Config.SEMANTIC_CHUNK_WORDS, Config.SEMANTIC_MAX_RESUME_CHUNKS = True, 4, 3
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            engine = make_engine(directory)
+            texts = [
+                'Python Flask PostgreSQL',                                          # 1 chunk
+                'Java Spring developer\nSkills\nPython Flask Docker AWS Kubernetes',  # 3 chunks
+                '',                                                                 # [''] -> 1 chunk
+                'Go gRPC Kafka services at scale for payments and Python tooling',  # 4 windows, capped at 3
+            ]
+            job_chunk_embeddings = engine._encode_texts(['Python Flask developer', 'Docker Kubernetes']).tolist()
+
+            batch = engine._calculate_semantic_scores(texts, job_chunk_embeddings)
+            assert [details['resume_chunks'] for _, details in batch] == [1, 3, 1, 3], batch
+            for text, (score, details) in zip(texts, batch):
+                alone_score, _ = engine._calculate_semantic_score(text, job_chunk_embeddings)
+                assert np.isclose(score, alone_score), (text, score, alone_score)
+
+                chunks = engine._normalize_rows(engine._encode_texts(engine._resume_chunks(text)))
+                similarities = chunks @ engine._normalize_rows(job_chunk_embeddings).T
+                assert np.isclose(score, similarities.max(axis=0).mean() * 100), text
+
+            assert engine._calculate_semantic_scores(texts[:1], [])[0][1]['error']
+    finally:
+        Config.SEMANTIC_CHUNKING, Config.SEMANTIC_CHUNK_WORDS, Config.SEMANTIC_MAX_RESUME_CHUNKS = saved
+    print("✅ Chunk similarities pooled per resume")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Relevance Engine - Test Suite")
+    print("=" * 50)
+
+    tests = [test_llm_cache_hit_reported, test_cascade_keeps_verdict, test_chunk_pooling_in_batches]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
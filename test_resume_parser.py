@@ -0,0 +1,119 @@
+"""
+Golden-output tests for the resume parser
+The goldens in test_fixtures/ were recorded with the line-by-line extractors the segmenter replaced
+(skills found in free text re-recorded with the skill taxonomy's whole-word matching)
+"""
+
+import json
+import os
+import sys
+
+import patterns
+from patterns import JD_LINE_KEYWORDS, RESUME_LINE_KEYWORDS, KeywordMatcher
+from resume_parser import ResumeParser
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_fixtures')
+EXTRACTORS = ['summary', 'experience', 'education', 'skills', 'certifications', 'projects', 'achievements']
+
+
+def load_fixtures():
+    """Resume texts and their golden outputs, by file name"""
+    with open(os.path.join(FIXTURES_DIR, 'resume_parser_golden.json')) as golden_file:
+        golden = json.load(golden_file)
+    texts = {}
+    for name in golden:
+        with open(os.path.join(FIXTURES_DIR, 'resumes', name)) as resume_file:
+            texts[name] = resume_file.read()
+    return texts, golden
+
+
+def make_parser():
+    """Parser without NER (the goldens were recorded without a spaCy model)"""
+    parser = ResumeParser()
+    parser.nlp = None
+    return parser
+
+
+def normalized(result):
+    """Skills come from a set, so compare them sorted"""
+    result = dict(result)
+    if 'skills' in result:
+        result['skills'] = sorted(result['skills'])
+    return result
+
+
+def test_structured_output_unchanged():
+    """_structure_resume_data matches the recorded output for every fixture"""
+    print("🧪 Testing structured output against goldens...")
+    parser = make_parser()
+    texts, golden = load_fixtures()
+
+    for name, text in texts.items():
+        assert normalized(parser._structure_resume_data(text)) == golden[name]['structured'], name
+    print(f"✅ {len(texts)} resumes match their golden structured output")
+    return True
+
+
+def test_extractors_unchanged_on_multiline_text():
+    """Each extractor matches the recorded output on uncleaned, multi-line text"""
+    print("🧪 Testing section extractors on multi-line text...")
+    parser = make_parser()
+    texts, golden = load_fixtures()
+
+    for name, text in texts.items():
+        result = normalized({
+            extractor: getattr(parser, f"_extract_{extractor}")(text) for extractor in EXTRACTORS
+        })
+        for extractor in EXTRACTORS:
+            assert result[extractor] == golden[name]['extractors'][extractor], (name, extractor)
+    print(f"✅ {len(EXTRACTORS)} extractors match their goldens on {len(texts)} resumes")
+    return True
+
+
+def test_keyword_matchers_agree():
+    """The automaton and the regex fallback find the same groups as plain substring checks"""
+    print("🧪 Testing keyword matchers...")
+    texts, _ = load_fixtures()
+    lines = [line.strip().lower() for text in texts.values() for line in text.split('\n')]
+    lines += ['technical skills', 'certificates', 'projects portfolio', 'work history', 'nice to have', '']
+
+    for keyword_groups in (RESUME_LINE_KEYWORDS, JD_LINE_KEYWORDS):
+        automaton = patterns.ahocorasick
+        try:
+            patterns.ahocorasick = None
+            regex_matcher = KeywordMatcher(keyword_groups)
+        finally:
+            patterns.ahocorasick = automaton
+        matchers = [KeywordMatcher(keyword_groups), regex_matcher]
+
+        for line in lines:
+            expected = {group for group, keywords in keyword_groups.items() if any(keyword in line for keyword in keywords)}
+            for matcher in matchers:
+                assert matcher.groups(line) == expected, (line, matcher.groups(line), expected)
+    print(f"✅ Both matchers agree with substring checks on {len(lines)} lines")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Resume Parser - Golden Output Tests")
+    print("=" * 50)
+
+    tests = [test_structured_output_unchanged, test_extractors_unchanged_on_multiline_text,
+             test_keyword_matchers_agree]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
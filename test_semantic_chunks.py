@@ -0,0 +1,101 @@
+"""
+Test script for semantic chunking
+Checks how resumes and job descriptions are split into bounded passages
+"""
+
+import sys
+
+from semantic_chunks import _pack, chunk_job, chunk_resume
+
+RESUME_TEXT = """Jane Doe
+jane@example.com
+
+EXPERIENCE
+Backend engineer at Acme building Python services with Flask and PostgreSQL for payments
+
+Education:
+B.Tech Computer Science
+
+Skills
+Python Flask Docker
+"""
+
+
+def test_resume_sections_and_windows():
+    """Resumes split at section headings first, then into windows of at most max_words"""
+    print("🧪 Testing resume chunks...")
+    chunks = chunk_resume(RESUME_TEXT, max_words=100, max_chunks=10)
+    assert chunks == [
+        'Jane Doe jane@example.com',
+        'EXPERIENCE Backend engineer at Acme building Python services with Flask and PostgreSQL for payments',
+        'Education: B.Tech Computer Science',
+        'Skills Python Flask Docker',
+    ], chunks
+
+    chunks = chunk_resume(RESUME_TEXT, max_words=4, max_chunks=10)
+    assert all(1 <= len(chunk.split()) <= 4 for chunk in chunks), chunks
+    assert chunks[1:5] == ['EXPERIENCE Backend engineer at', 'Acme building Python services',
+                           'with Flask and PostgreSQL', 'for payments'], chunks
+    assert ' '.join(chunks).split() == ' '.join(RESUME_TEXT.split()).split()
+
+    # A heading word inside a sentence does not start a section
+    assert chunk_resume('Python skills\nstrong', 100, 10) == ['Python skills strong']
+    print("✅ Resume sections split into bounded windows")
+    return True
+
+
+def test_bounds_and_empty_text():
+    """At most max_chunks passages are kept, and an empty text still gives one (empty) passage"""
+    print("🧪 Testing chunk bounds...")
+    assert chunk_resume(RESUME_TEXT, max_words=2, max_chunks=3) == chunk_resume(RESUME_TEXT, 2, 100)[:3]
+    assert chunk_resume('', 150, 16) == ['']
+    assert chunk_resume(None, 150, 16) == ['']
+    assert chunk_resume(' \n\n ', 150, 16) == ['']
+    assert chunk_job({}, '', 150, 8) == ['']
+    print("✅ Chunk counts bounded")
+    return True
+
+
+def test_job_chunks():
+    """Short requirement items are packed together; duplicates across headings are kept once"""
+    print("🧪 Testing job chunks...")
+    assert _pack(['Build APIs', 'Write tests', 'Review code with the team'], max_words=5) == [
+        'Build APIs. Write tests', 'Review code with the team'
+    ]
+    # An item longer than max_words is windowed before packing
+    assert _pack(['one two three four five six seven'], max_words=3) == ['one two three', 'four five six', 'seven']
+    assert _pack([], 5) == []
+
+    requirements = {
+        'responsibilities': ['Build APIs', 'Write tests'],
+        'qualifications': ['Build APIs. Write tests', 'Python experience'],
+    }
+    chunks = chunk_job(requirements, 'We are hiring a backend developer', max_words=5, max_chunks=8)
+    assert chunks == ['Build APIs. Write tests', 'Python experience', 'We are hiring a backend', 'developer'], chunks
+    assert chunk_job(requirements, 'We are hiring a backend developer', 5, 2) == chunks[:2]
+    print("✅ Job passages packed and deduplicated")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Semantic Chunks - Test Suite")
+    print("=" * 50)
+
+    tests = [test_resume_sections_and_windows, test_bounds_and_empty_text, test_job_chunks]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
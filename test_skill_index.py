@@ -0,0 +1,131 @@
+"""
+Test script for the sparse skill index
+Checks row weights, all-pairs coverage against a per-pair loop, incremental updates and persistence
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from skill_index import JOBS, RESUMES, SkillIndex, canonical_skills, job_skill_weights
+
+RESUMES_SKILLS = {
+    'r1': ['Python', 'Django', 'PostgreSQL', 'Docker'],
+    'r2': ['JavaScript', 'React.js', 'Node.js'],
+    'r3': ['python3', 'K8s', 'AWS', 'Terraform'],
+    'r4': [],
+}
+JOBS_REQUIREMENTS = {
+    'j1': {'must_have_skills': ['Python', 'Docker'], 'good_to_have_skills': ['Kubernetes']},
+    'j2': {'must_have_skills': ['React'], 'technical_requirements': ['node.js', 'CSS']},
+    'j3': {'good_to_have_skills': ['Terraform', 'Ansible']},
+}
+
+
+def build_index(path: str) -> SkillIndex:
+    """Index holding the sample resumes and jobs"""
+    index = SkillIndex(path)
+    index.update_resumes({resume_id: (1.0, skills) for resume_id, skills in RESUMES_SKILLS.items()})
+    index.update_jobs({job_id: (1.0, requirements) for job_id, requirements in JOBS_REQUIREMENTS.items()})
+    return index
+
+
+def expected_coverage(job_id: str, resume_id: str) -> float:
+    """Weighted share of a job's skills listed by a resume, computed pair by pair"""
+    resume_skills = set(canonical_skills(RESUMES_SKILLS[resume_id]))
+    weights = job_skill_weights(JOBS_REQUIREMENTS[job_id])
+    return sum(weight for skill, weight in weights.items() if skill in resume_skills)
+
+
+def test_row_weights():
+    """Aliases map to canonical skills; must-have skills weigh double and job rows sum to 1"""
+    print("🧪 Testing row weights...")
+    assert canonical_skills(['python3', 'K8s', 'Terraform', ' ', 'Python']) == ['python', 'kubernetes', 'terraform']
+    weights = job_skill_weights(JOBS_REQUIREMENTS['j1'])
+    assert weights == {'python': 0.4, 'docker': 0.4, 'kubernetes': 0.2}, weights
+    assert job_skill_weights({'must_have_skills': ['Python'], 'good_to_have_skills': ['python']}) == {'python': 1.0}
+    assert job_skill_weights({}) == {}
+    print("✅ Rows weighted as expected")
+    return True
+
+
+def test_coverage_matches_pairwise():
+    """The sparse product equals the per-pair coverage for every job and resume"""
+    print("🧪 Testing all-pairs coverage...")
+    with tempfile.TemporaryDirectory() as directory:
+        index = build_index(os.path.join(directory, 'skills.npz'))
+        job_ids, resume_ids, coverage = index.coverage()
+        assert (job_ids, resume_ids) == (sorted(JOBS_REQUIREMENTS), sorted(RESUMES_SKILLS))
+        dense = coverage.toarray()
+        for row, job_id in enumerate(job_ids):
+            for column, resume_id in enumerate(resume_ids):
+                assert np.isclose(dense[row, column], expected_coverage(job_id, resume_id)), (job_id, resume_id)
+
+        ranked = index.top_resumes(top_k=1)
+        assert ranked['j1'] == [('r1', 0.8)] and ranked['j2'] == [('r2', 0.75)] and ranked['j3'] == [('r3', 0.5)]
+        assert [resume_id for resume_id, _ in index.top_resumes()['j1']] == ['r1', 'r3']
+        assert index.top_resumes(min_coverage=0.6)['j3'] == []
+    print("✅ Coverage matches the pairwise computation")
+    return True
+
+
+def test_incremental_updates():
+    """Rows are replaced and removed one record at a time; stale() finds what a sync must re-read"""
+    print("🧪 Testing incremental updates...")
+    with tempfile.TemporaryDirectory() as directory:
+        index = build_index(os.path.join(directory, 'skills.npz'))
+        index.update_resumes({'r4': (2.0, ['Docker', 'Kubernetes', 'Python'])}, removed=['r2'])
+        ranked = index.top_resumes()
+        assert ranked['j1'][0] == ('r4', 1.0) and ranked['j2'] == []
+
+        changed, removed = index.stale(RESUMES, {'r1': 1.0, 'r3': 5.0, 'r4': 2.0, 'r5': 1.0})
+        assert (sorted(changed), removed) == (['r3', 'r5'], [])
+        changed, removed = index.stale(JOBS, {'j1': 1.0})
+        assert (changed, sorted(removed)) == ([], ['j2', 'j3'])
+        assert index.update_jobs({}, removed) == 2 and index.stats()['jobs'] == 1
+    print("✅ Rows updated in place")
+    return True
+
+
+def test_state_shared_through_file():
+    """Another instance on the same file sees every write"""
+    print("🧪 Testing persistence...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index', 'skills.npz')
+        writer = build_index(path)
+        reader = SkillIndex(path)
+        assert reader.stats() == writer.stats()
+        assert (reader.coverage()[2] != writer.coverage()[2]).nnz == 0
+
+        writer.update_jobs({'j4': (3.0, {'must_have_skills': ['Rust']})})
+        assert reader.stats()['jobs'] == 4 and reader.stale(JOBS, {'j4': 3.0}) == ([], ['j1', 'j2', 'j3'])
+        assert reader.top_resumes()['j4'] == []
+    print("✅ Index state shared through its file")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Skill Index - Test Suite")
+    print("=" * 50)
+
+    tests = [test_row_weights, test_coverage_matches_pairwise, test_incremental_updates,
+             test_state_shared_through_file]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,137 @@
+"""
+Test script for the precomputed skill similarity table
+Checks that table lookups agree with fuzz.ratio, aliases, persistence and the out-of-vocabulary cache
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from skill_similarity import (
+    SkillSimilarityMatrix, SkillSimilarityTable, load_or_build_table, similarity_matrix, taxonomy_groups
+)
+
+GROUPS = {
+    'python': ['python', 'python3'],
+    'kubernetes': ['kubernetes', 'k8s'],
+    'postgresql': ['postgresql', 'postgres'],
+    'rest api': ['rest api', 'rest apis'],
+    'java': ['java'],
+}
+
+
+def test_lookups_match_fuzz_ratio():
+    """In-vocabulary, out-of-vocabulary and mixed pairs score as fuzz.ratio does"""
+    print("🧪 Testing table lookups...")
+    table = SkillSimilarityTable.build(GROUPS)
+    queries = ['python', 'java', 'terraform', 'rest api', 'javascript']
+    choices = ['python', 'pyhton', 'rest apis', 'java', 'jav', 'terraform', 'python3']
+
+    scores = table.scores(queries, choices)
+    expected = similarity_matrix(queries, choices)
+    aliases = np.array([[any(query in names and choice in names for names in GROUPS.values()) for choice in choices]
+                        for query in queries])
+    assert scores.dtype == expected.dtype and scores.shape == expected.shape
+    assert (scores[~aliases] == expected[~aliases]).all(), (scores, expected)
+    assert (scores[aliases] == 100).all()
+    assert (table.scores([], choices).shape, table.scores(queries, []).shape) == ((0, 7), (5, 0))
+    print("✅ Lookups agree with fuzz.ratio; aliases score 100")
+    return True
+
+
+def test_oov_cache_is_bounded():
+    """Names outside the vocabulary are scored once, and the cache keeps the most recent ones"""
+    print("🧪 Testing out-of-vocabulary cache...")
+    table = SkillSimilarityTable.build(GROUPS, oov_cache_size=2)
+    table.scores(['terraform'], ['python', 'java'])
+    table.scores(['terraform'], ['postgres'])
+    assert table.stats()['oov_cache_hits'] == 1 and table.stats()['oov_cache_misses'] == 1
+
+    table.scores(['kafka', 'spark'], ['python'])
+    assert table.stats()['oov_cache_entries'] == 2
+    assert list(table._oov_cache) == ['kafka', 'spark']
+    print("✅ Out-of-vocabulary rows cached with LRU eviction")
+    return True
+
+
+def test_embedding_synonyms():
+    """Pairs with close embeddings score at least their cosine similarity"""
+    print("🧪 Testing embedding synonyms...")
+    vectors = {'postgresql': [1.0, 0.0], 'postgres': [1.0, 0.0], 'java': [0.0, 1.0],
+               'python': [0.6, 0.8], 'python3': [0.6, 0.8], 'kubernetes': [0.9, 0.1], 'k8s': [0.9, 0.1],
+               'rest api': [0.0, 1.0], 'rest apis': [0.0, 1.0]}
+    table = SkillSimilarityTable.build(GROUPS, encode=lambda names: [vectors[name] for name in names],
+                                       synonym_threshold=0.9)
+    assert table.scores(['java'], ['rest api'])[0, 0] == 100
+    assert table.scores(['kubernetes'], ['postgresql'])[0, 0] == 99
+    assert table.scores(['python'], ['java'])[0, 0] == similarity_matrix(['python'], ['java'])[0, 0]
+    assert table.metadata == {'embeddings': True, 'synonym_threshold': 0.9}
+    print("✅ Embedding synonyms raise their pair scores")
+    return True
+
+
+def test_saved_table_is_memory_mapped():
+    """A saved table loads memory-mapped and is rebuilt when the taxonomy changes"""
+    print("🧪 Testing table persistence...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'skills', 'similarity.npy')
+        built = load_or_build_table(path)
+        assert os.path.exists(path) and os.path.exists(os.path.join(directory, 'skills', 'similarity.json'))
+        assert len(built.vocabulary) == sum(len(names) for names in taxonomy_groups().values())
+
+        loaded = load_or_build_table(path)
+        assert isinstance(loaded.table, np.memmap) and loaded.version == built.version
+        assert (np.asarray(loaded.table) == built.table).all()
+
+        # A table built for another vocabulary is replaced
+        SkillSimilarityTable.build(GROUPS).save(path)
+        rebuilt = load_or_build_table(path)
+        assert rebuilt.version == built.version
+        assert SkillSimilarityTable.load(path).version == built.version
+    print("✅ Saved tables are memory-mapped and versioned")
+    return True
+
+
+def test_matrix_uses_table():
+    """SkillSimilarityMatrix gives the same matches with and without a table, aliases aside"""
+    print("🧪 Testing SkillSimilarityMatrix with a table...")
+    table = SkillSimilarityTable.build(taxonomy_groups())
+    required = ['Python', 'Kubernetes', 'Terraform', 'PostgreSQL']
+    resume_skills = ['python', 'K8s', 'Docker', 'Postgres DB']
+
+    with_table = SkillSimilarityMatrix(required, resume_skills, table=table)
+    computed = SkillSimilarityMatrix(required, resume_skills)
+    best_matches = with_table.best_matches()
+    assert [best_matches[index] for index in (0, 1, 3)] == ['python', 'K8s', 'Postgres DB'], best_matches
+    assert with_table.matched_mask().tolist() == [True, True, False, True]
+    assert computed.matched_mask().tolist() == [True, False, False, True]
+    assert (with_table.scores[[0, 2, 3]] == computed.scores[[0, 2, 3]]).all()
+    print("✅ Table-backed matrix matches aliases the computed one misses")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Skill Similarity Table - Test Suite")
+    print("=" * 50)
+
+    tests = [test_lookups_match_fuzz_ratio, test_oov_cache_is_bounded, test_embedding_synonyms,
+             test_saved_table_is_memory_mapped, test_matrix_uses_table]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,120 @@
+"""
+Test script for the skill taxonomy
+Checks alias resolution, whole-word matching and that both matcher backends agree
+"""
+
+import sys
+
+import skill_taxonomy
+from skill_taxonomy import SKILL_TAXONOMY, SKILLS, SOFT, TECHNICAL, SkillTaxonomy
+
+SAMPLE_TEXT = (
+    "Senior engineer: Python3, JavaScript (React.js, Node.js), MySQL and Postgres on AWS.\n"
+    "Deployed microservices to K8s with Docker; REST APIs in Golang and C++, some C#.\n"
+    "Go-to person for R&D demos. Built ML models with sklearn; statistics in R.\n"
+    "Strong communication, problem-solving and leadership; excellent mentoring record."
+)
+
+
+def regex_taxonomy():
+    """Taxonomy built with the regex fallback, as when pyahocorasick is not installed"""
+    automaton = skill_taxonomy.ahocorasick
+    try:
+        skill_taxonomy.ahocorasick = None
+        return SkillTaxonomy(SKILLS)
+    finally:
+        skill_taxonomy.ahocorasick = automaton
+
+
+def test_aliases_resolve_to_canonical_names():
+    """Aliases are reported under their canonical name, once"""
+    print("🧪 Testing aliases...")
+    skills = SKILL_TAXONOMY.find(SAMPLE_TEXT, TECHNICAL)
+    for canonical in ('python', 'react', 'node.js', 'postgresql', 'kubernetes', 'rest api', 'go',
+                      'machine learning', 'scikit-learn'):
+        assert canonical in skills, (canonical, skills)
+    assert len(skills) == len(set(skills))
+    assert SKILL_TAXONOMY.canonical(' K8s ') == 'kubernetes'
+    assert SKILL_TAXONOMY.canonical('Terraform') == 'terraform'
+    print(f"✅ {len(skills)} canonical skills found")
+    return True
+
+
+def test_whole_words_only():
+    """Skills inside longer words, or glued to them, are not matched"""
+    print("🧪 Testing word boundaries...")
+    skills = SKILL_TAXONOMY.find(SAMPLE_TEXT, TECHNICAL)
+    # 'java' in javascript, 'sql' in mysql, 'js' in node.js, 'excel' in excellent
+    for false_positive in ('java', 'sql', 'excel', 'spring'):
+        assert false_positive not in skills, (false_positive, skills)
+    assert SKILL_TAXONOMY.find("Go-to person for R&D; googled it; ratios", TECHNICAL) == []
+    assert SKILL_TAXONOMY.find("Languages: Go, R.", TECHNICAL) == ['go', 'r']
+    assert SKILL_TAXONOMY.find("python-based tools, c++/c# and node.js", TECHNICAL) == ['python', 'node.js', 'c++', 'c#']
+    print("✅ Only whole-word mentions match")
+    return True
+
+
+def test_categories_and_order():
+    """Results are filtered by category and come out in taxonomy order"""
+    print("🧪 Testing categories...")
+    soft_skills = SKILL_TAXONOMY.find(SAMPLE_TEXT, SOFT)
+    assert soft_skills == ['communication', 'leadership', 'problem solving', 'mentoring'], soft_skills
+    every_skill = SKILL_TAXONOMY.find(SAMPLE_TEXT)
+    assert set(every_skill) == set(soft_skills) | set(SKILL_TAXONOMY.find(SAMPLE_TEXT, TECHNICAL))
+    order = SKILL_TAXONOMY.skills()
+    assert every_skill == sorted(every_skill, key=order.index)
+    print("✅ Categories and order respected")
+    return True
+
+
+def test_backends_agree():
+    """The automaton and the regex fallback find the same skills"""
+    print("🧪 Testing matcher backends...")
+    fallback = regex_taxonomy()
+    texts = SAMPLE_TEXT.split('\n') + [SAMPLE_TEXT, '', 'node.js', 'nodejs and node js', 'mysql sql', 'c++11 c++']
+    for text in texts:
+        assert fallback.find(text) == SKILL_TAXONOMY.find(text), (text, fallback.find(text), SKILL_TAXONOMY.find(text))
+    print(f"✅ Both backends agree on {len(texts)} texts")
+    return True
+
+
+def test_extractors_share_taxonomy():
+    """utils, the resume parser and the JD parser report the taxonomy's skills"""
+    print("🧪 Testing extractors...")
+    from jd_parser import JobDescriptionParser
+    from resume_parser import ResumeParser
+    from utils import extract_skills_from_text
+
+    expected = SKILL_TAXONOMY.find(SAMPLE_TEXT, TECHNICAL)
+    assert extract_skills_from_text(SAMPLE_TEXT) == expected
+    assert ResumeParser(nlp=False)._extract_skills_from_text(SAMPLE_TEXT) == expected
+    jd_parser = JobDescriptionParser(nlp=False)
+    assert jd_parser._extract_technical_requirements(SAMPLE_TEXT) == expected
+    assert jd_parser._extract_soft_skills(SAMPLE_TEXT) == SKILL_TAXONOMY.find(SAMPLE_TEXT, SOFT)
+    print("✅ All skill extractors use the taxonomy")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Skill Taxonomy - Test Suite")
+    print("=" * 50)
+
+    tests = [test_aliases_resolve_to_canonical_names, test_whole_words_only, test_categories_and_order,
+             test_backends_agree, test_extractors_share_taxonomy]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
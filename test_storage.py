@@ -0,0 +1,192 @@
+"""
+Test script for the upload storage backends
+The S3 backend runs against an in-memory stand-in client, or a real endpoint when S3_TEST_ENDPOINT_URL is set
+"""
+
+import hashlib
+import io
+import os
+import sys
+import tempfile
+
+from storage import LocalStorage, S3Storage, local_copy
+
+CONTENT = b'%PDF-1.4 resume ' * 100000  # ~1.6 MB: several read chunks
+
+
+class ClientError(Exception):
+    """Error shaped like botocore's ClientError"""
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.response = {'Error': {'Code': code}}
+
+
+class InMemoryS3Client:
+    """The part of the boto3 S3 client API the storage backend uses"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = 0
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise ClientError('404')
+        return {'ContentLength': len(self.objects[(Bucket, Key)])}
+
+    def upload_fileobj(self, fileobj, bucket, key):
+        self.uploads += 1
+        self.objects[(bucket, key)] = fileobj.read()
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise ClientError('NoSuchKey')
+        return {'Body': io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def download_fileobj(self, bucket, key, fileobj):
+        fileobj.write(self.get_object(Bucket=bucket, Key=key)['Body'].read())
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+
+def s3_storage():
+    """S3 backend against S3_TEST_ENDPOINT_URL (needs boto3), otherwise against the in-memory client"""
+    endpoint_url = os.getenv('S3_TEST_ENDPOINT_URL')
+    if endpoint_url:
+        return S3Storage(os.getenv('S3_TEST_BUCKET', 'resumes-test'), 'test/', endpoint_url)
+    return S3Storage('resumes-test', 'test/', client=InMemoryS3Client())
+
+
+def check_backend(storage):
+    """Round trip, deduplication and deletion through one backend"""
+    expected_hash = hashlib.sha256(CONTENT).hexdigest()
+
+    uri, content_hash = storage.put(io.BytesIO(CONTENT), '.pdf')
+    assert content_hash == expected_hash
+    assert uri.startswith(f"{storage.scheme}://") and uri.endswith(f"{expected_hash[:2]}/{expected_hash[2:4]}/{expected_hash}.pdf"), uri
+    assert storage.exists(uri)
+
+    # Same bytes again: same uri, stored once
+    assert storage.put(io.BytesIO(CONTENT), '.pdf') == (uri, content_hash)
+
+    stream = storage.open(uri)
+    try:
+        assert stream.read(10) + stream.read() == CONTENT
+    finally:
+        stream.close()
+
+    with local_copy(uri) as path:
+        assert path.endswith('.pdf')
+        with open(path, 'rb') as local_file:
+            assert local_file.read() == CONTENT
+
+    storage.delete(uri)
+    assert not storage.exists(uri)
+    return uri
+
+
+def test_local_storage():
+    """Content-addressed files under sharded hash directories"""
+    print("🧪 Testing local storage...")
+    import storage as storage_module
+
+    with tempfile.TemporaryDirectory() as root:
+        local_storage = LocalStorage(root)
+        storage_module._backends['local'] = local_storage
+        try:
+            check_backend(local_storage)
+        finally:
+            storage_module._backends.pop('local', None)
+        assert not [name for name in os.listdir(root) if name.startswith('.upload-')]
+    print("✅ Local storage round trip, deduplication and deletion work")
+    return True
+
+
+class FailingStream:
+    """Upload stream that breaks after the first chunk"""
+
+    def __init__(self):
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        if self.reads > 1:
+            raise IOError('Connection reset by peer')
+        return b'%PDF-1.4 partial'
+
+
+def test_local_storage_failures_and_reuse():
+    """A failed upload leaves no temporary file; storing existing content again refreshes its mtime"""
+    print("🧪 Testing local storage failures and reuse...")
+    with tempfile.TemporaryDirectory() as root:
+        local_storage = LocalStorage(root)
+        try:
+            local_storage.put(FailingStream(), '.pdf')
+            assert False, 'put should fail'
+        except IOError:
+            pass
+        assert os.listdir(root) == [], os.listdir(root)
+
+        uri, _ = local_storage.put(io.BytesIO(CONTENT), '.pdf')
+        path = local_storage._path(uri)
+        os.utime(path, (0, 0))
+        assert local_storage.put(io.BytesIO(CONTENT), '.pdf')[0] == uri
+        assert os.path.getmtime(path) > 0
+    print("✅ Failed uploads cleaned up, reused files refreshed")
+    return True
+
+
+def test_s3_storage():
+    """Objects keyed by content hash, uploaded once, streamed back"""
+    print("🧪 Testing S3 storage...")
+    import storage as storage_module
+
+    try:
+        s3 = s3_storage()
+    except ImportError as e:
+        print(f"⚠️  Skipping S3 storage: {e}")
+        return True
+
+    storage_module._backends['s3'] = s3
+    try:
+        check_backend(s3)
+    finally:
+        storage_module._backends.pop('s3', None)
+    if isinstance(s3.client, InMemoryS3Client):
+        assert s3.client.uploads == 1
+    print("✅ S3 storage round trip, deduplication and deletion work")
+    return True
+
+
+def test_legacy_paths():
+    """Paths stored before storage uris are read from the filesystem as they are"""
+    print("🧪 Testing legacy file paths...")
+    with local_copy('uploads/resumes/1234_resume.pdf') as path:
+        assert path == 'uploads/resumes/1234_resume.pdf'
+    print("✅ Legacy paths pass through")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Upload Storage - Test Suite")
+    print("=" * 50)
+
+    tests = [test_local_storage, test_local_storage_failures_and_reuse, test_s3_storage, test_legacy_paths]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,273 @@
+"""
+Test script for PDF/DOCX text extraction
+Checks the process-pool extractor and the streaming DOCX reader on generated documents
+"""
+
+import os
+import sys
+import tempfile
+import zipfile
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    import pymupdf as fitz  # Alternative import
+from docx import Document
+from docx.enum.text import WD_BREAK
+
+from text_extraction import ExtractionTimeout, TextExtractor, extract_docx
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
+<w:body>{body}</w:body>
+</w:document>"""
+
+
+def make_pdf(directory, name, page_count):
+    """PDF whose page N reads 'Page N'"""
+    doc = fitz.open()
+    for index in range(page_count):
+        doc.new_page().insert_text((72, 72), f"Page {index}\nPython developer")
+    path = os.path.join(directory, name)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def make_docx(directory, name, lines):
+    """DOCX with one paragraph per line"""
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    path = os.path.join(directory, name)
+    document.save(path)
+    return path
+
+
+def make_raw_docx(directory, name, body):
+    """DOCX whose word/document.xml body is given as raw XML"""
+    path = os.path.join(directory, name)
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('word/document.xml', DOCUMENT_XML.format(body=body))
+    return path
+
+
+def reference_pdf_text(path):
+    """Page texts concatenated in order, as the parser always did"""
+    with fitz.open(path) as doc:
+        return ''.join(page.get_text() for page in doc)
+
+
+def test_page_ranges_match_serial():
+    """Splitting a PDF across workers gives the same text, pages in order"""
+    print("🧪 Testing page-range extraction...")
+    pool_extractor = TextExtractor(max_workers=2, pages_per_task=3, max_pages=50)
+    serial_extractor = TextExtractor(max_workers=1, pages_per_task=3, max_pages=50)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = make_pdf(directory, 'long.pdf', 11)
+            expected = reference_pdf_text(path)
+
+            assert pool_extractor.extract(path) == expected
+            assert serial_extractor.extract(path) == expected
+            positions = [expected.index(f"Page {index}\n") for index in range(11)]
+            assert positions == sorted(positions)
+    finally:
+        pool_extractor.shutdown()
+    print("✅ 11-page PDF in ranges of 3 matches in-process extraction")
+    return True
+
+
+def test_page_cap():
+    """Pages after max_pages are not extracted"""
+    print("🧪 Testing page cap...")
+    extractor = TextExtractor(max_workers=1, pages_per_task=2, max_pages=4)
+    with tempfile.TemporaryDirectory() as directory:
+        text = extractor.extract(make_pdf(directory, 'capped.pdf', 9))
+    assert 'Page 3\n' in text and 'Page 4\n' not in text, text
+    print("✅ Only the first 4 of 9 pages extracted")
+    return True
+
+
+def test_pdfs_only_opened_in_workers():
+    """With a pool, the calling process never opens a PDF; long PDFs are still split and capped"""
+    print("🧪 Testing PDFs opened in workers only...")
+    import text_extraction
+
+    def refuse(*args, **kwargs):
+        raise AssertionError('PDF opened in the calling process')
+
+    extractor = TextExtractor(max_workers=2, pages_per_task=2, max_pages=5)
+    original_open = text_extraction.fitz.open
+    text_extraction.fitz.open = refuse
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            text_extraction.fitz.open = original_open
+            paths = [make_pdf(directory, 'long.pdf', 9), make_pdf(directory, 'short.pdf', 1)]
+            expected = [reference_pdf_text(path) for path in paths]
+            text_extraction.fitz.open = refuse
+
+            results = list(extractor.extract_many(paths))
+            assert results[1] == expected[1]
+            assert 'Page 4\n' in results[0] and 'Page 5\n' not in results[0], results[0]
+            assert expected[0].startswith(results[0])
+    finally:
+        text_extraction.fitz.open = original_open
+        extractor.shutdown()
+    print("✅ Page counts come back from the workers")
+    return True
+
+
+def test_extract_many_in_order_with_errors():
+    """extract_many yields one result per path, in order, with exceptions for failures"""
+    print("🧪 Testing bulk extraction...")
+    extractor = TextExtractor(max_workers=2, pages_per_task=2, max_pages=50)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [
+                make_pdf(directory, 'a.pdf', 5),
+                make_docx(directory, 'b.docx', ['Jane Doe', 'Skills', 'Python, Flask']),
+                os.path.join(directory, 'c.txt'),
+                os.path.join(directory, 'missing.pdf'),
+                make_pdf(directory, 'd.pdf', 1),
+            ]
+            results = list(extractor.extract_many(paths))
+
+            assert len(results) == len(paths)
+            assert results[0] == reference_pdf_text(paths[0])
+            assert results[1] == 'Jane Doe\nSkills\nPython, Flask\n'
+            assert isinstance(results[2], ValueError) and 'Unsupported file format' in str(results[2])
+            assert isinstance(results[3], Exception) and 'Error extracting text from PDF' in str(results[3])
+            assert results[4] == reference_pdf_text(paths[4])
+    finally:
+        extractor.shutdown()
+    print("✅ 5 documents extracted in order, failures reported per document")
+    return True
+
+
+def test_docx_paragraphs_match_python_docx():
+    """Streamed paragraph text is what python-docx reports"""
+    print("🧪 Testing streaming DOCX paragraphs...")
+    document = Document()
+    document.add_heading('Jane Doe', level=1)
+    document.add_paragraph('')
+    paragraph = document.add_paragraph('Skills:\tPython, ')
+    paragraph.add_run('Flask').bold = True
+    paragraph.add_run().add_break()
+    paragraph.add_run('Docker & Kubernetes <k8s>')
+    document.add_paragraph('Résumé – naïve café')
+    document.add_paragraph('Page one').add_run().add_break(WD_BREAK.PAGE)
+    for index in range(200):
+        document.add_paragraph(f"Built service {index} with Python")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'paragraphs.docx')
+        document.save(path)
+        expected = ''.join(paragraph.text + '\n' for paragraph in Document(path).paragraphs)
+        assert extract_docx(path) == expected
+    print("✅ 205 paragraphs match python-docx, tabs and breaks included")
+    return True
+
+
+def test_docx_tables():
+    """Table rows are extracted in document order, cells joined with ' | '"""
+    print("🧪 Testing DOCX tables...")
+    document = Document()
+    document.add_paragraph('Technical Skills')
+    table = document.add_table(rows=2, cols=3)
+    for row, values in zip(table.rows, [['Languages', 'Python', 'SQL'], ['Cloud', 'AWS', '']]):
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+    table.rows[0].cells[2].add_paragraph('Go')
+    table.rows[1].cells[2].add_table(rows=1, cols=2).rows[0].cells[0].text = 'Docker'
+    document.add_paragraph('Experience')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tables.docx')
+        document.save(path)
+        lines = extract_docx(path).splitlines()
+    assert lines == ['Technical Skills', 'Languages | Python | SQL Go', 'Cloud | AWS | Docker', 'Experience'], lines
+    print("✅ Table rows, multi-paragraph cells and nested tables extracted")
+    return True
+
+
+def test_docx_text_boxes_and_markup():
+    """Text boxes are read once, hyperlinks are read, tab stops and deleted text are not"""
+    print("🧪 Testing DOCX text boxes and markup...")
+    body = (
+        '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>'
+        '<w:r><w:t>Contact:</w:t></w:r><w:hyperlink><w:r><w:t xml:space="preserve"> jane@example.com</w:t></w:r></w:hyperlink>'
+        '<w:del><w:r><w:delText>old</w:delText></w:r></w:del></w:p>'
+        '<w:p><w:r><mc:AlternateContent>'
+        '<mc:Choice><w:drawing><w:txbxContent><w:p><w:r><w:t>Sidebar</w:t></w:r></w:p></w:txbxContent></w:drawing></mc:Choice>'
+        '<mc:Fallback><w:pict><w:txbxContent><w:p><w:r><w:t>Sidebar</w:t></w:r></w:p></w:txbxContent></w:pict></mc:Fallback>'
+        '</mc:AlternateContent></w:r><w:r><w:t>Main</w:t></w:r></w:p>'
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        lines = extract_docx(make_raw_docx(directory, 'markup.docx', body)).splitlines()
+    assert lines == ['Contact: jane@example.com', 'Sidebar', 'Main'], lines
+    print("✅ Markup handled")
+    return True
+
+
+def test_timeout():
+    """A document that takes longer than the timeout yields ExtractionTimeout"""
+    print("🧪 Testing extraction timeout...")
+    extractor = TextExtractor(max_workers=2, pages_per_task=1, max_pages=50, timeout=0)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            result = next(extractor.extract_many([make_pdf(directory, 'slow.pdf', 20)]))
+    finally:
+        extractor.shutdown()
+    assert isinstance(result, ExtractionTimeout), result
+    print("✅ Timed out documents are reported, not waited for")
+    return True
+
+
+def test_timeout_replaces_pool():
+    """After a timeout, documents in flight and later ones run in a fresh pool"""
+    print("🧪 Testing pool replacement after a timeout...")
+    extractor = TextExtractor(max_workers=2, pages_per_task=1, max_pages=50, timeout=0)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            slow, other = make_pdf(directory, 'slow.pdf', 20), make_pdf(directory, 'other.pdf', 3)
+            old_pool = extractor._get_pool()
+            results = extractor.extract_many([slow, other])
+            assert isinstance(next(results), ExtractionTimeout)
+            assert extractor._pool is not old_pool
+            extractor.timeout = 60
+            # other.pdf was in flight on the old pool and is resubmitted
+            assert next(results) == reference_pdf_text(other)
+            assert extractor.extract(other) == reference_pdf_text(other)
+    finally:
+        extractor.shutdown()
+    print("✅ Timed out pool replaced")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Text Extraction - Test Suite")
+    print("=" * 50)
+
+    tests = [test_page_ranges_match_serial, test_page_cap, test_pdfs_only_opened_in_workers,
+             test_extract_many_in_order_with_errors, test_docx_paragraphs_match_python_docx, test_docx_tables,
+             test_docx_text_boxes_and_markup, test_timeout,
+             test_timeout_replaces_pool]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
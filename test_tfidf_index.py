@@ -0,0 +1,85 @@
+"""
+Test script for the corpus TF-IDF index
+Checks that similarities are weighted by the corpus IDF and that a rebuild recounts the corpus
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from tfidf_index import CorpusTfidf
+
+DOCUMENTS = {
+    'resume:1': 'python django sql',
+    'resume:2': 'python react',
+    'resume:3': 'python kubernetes',
+    'job:1': 'python kubernetes terraform',
+}
+
+
+def test_corpus_idf():
+    """Sharing a rare term counts for more than sharing a term every document has"""
+    print("🧪 Testing corpus IDF...")
+    with tempfile.TemporaryDirectory() as directory:
+        index = CorpusTfidf(os.path.join(directory, 'corpus.npz'), n_features=2 ** 12)
+        query = index.term_counts('python kubernetes')
+        common, rare = index.term_counts('python'), index.term_counts('kubernetes')
+        assert np.isclose(index.similarity(query, common), index.similarity(query, rare))
+
+        assert index.add_documents(DOCUMENTS) == 4
+        assert index.add_documents({'resume:1': 'python'}) == 0
+        assert index.stats()['documents'] == 4
+        assert index.similarity(query, rare) > index.similarity(query, common)
+
+        # Another process's instance reads the same corpus
+        other = CorpusTfidf(index.path, n_features=2 ** 12)
+        assert np.isclose(other.similarity(query, rare), index.similarity(query, rare))
+    print("✅ Similarities weighted by the corpus IDF")
+    return True
+
+
+def test_rebuild():
+    """A rebuild gives the counts of adding the documents one by one, and forgets edited terms"""
+    print("🧪 Testing rebuild...")
+    with tempfile.TemporaryDirectory() as directory:
+        incremental = CorpusTfidf(os.path.join(directory, 'incremental.npz'), n_features=2 ** 12)
+        for document_id, text in DOCUMENTS.items():
+            incremental.add_documents({document_id: text})
+
+        rebuilt = CorpusTfidf(os.path.join(directory, 'rebuilt.npz'), n_features=2 ** 12)
+        rebuilt.add_documents({'resume:1': 'cobol fortran', 'resume:9': 'deleted resume'})
+        assert rebuilt.rebuild(DOCUMENTS) == 4
+        assert rebuilt.document_count == incremental.document_count
+        assert np.array_equal(rebuilt.document_frequency, incremental.document_frequency)
+
+        cobol = rebuilt.vectorizer.transform(['cobol']).indices
+        assert not rebuilt.document_frequency[cobol].any()
+        assert CorpusTfidf(rebuilt.path, n_features=2 ** 12).stats() == rebuilt.stats()
+    print("✅ Rebuild recounts the corpus")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 TF-IDF Index - Test Suite")
+    print("=" * 50)
+
+    tests = [test_corpus_idf, test_rebuild]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
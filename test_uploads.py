@@ -0,0 +1,188 @@
+"""
+Test script for resume uploads and their stored files
+Runs the API and tasks against an in-memory SQLite database, with Celery tasks executed eagerly
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+os.environ['FLASK_ENV'] = 'testing'
+
+from app import app, db
+from config import Config
+from models import Job, Resume
+from storage import LocalStorage
+import model_registry
+import storage as storage_module
+import tasks
+
+tasks.celery.conf.task_always_eager = True
+
+RESUME_BYTES = b'%PDF-1.4 Python developer resume'
+
+
+class StandInEngine:
+    """The part of the relevance engine the indexing tasks use; every resume embeds to the same vector"""
+
+    def embed_resumes(self, texts):
+        return [np.array([1.0, 0.0], dtype=np.float32) for _ in texts]
+
+
+def test_duplicate_upload_is_searchable():
+    """A re-uploaded file reuses the parsed data of its twin and is still added to the indexes"""
+    print("🧪 Testing duplicate uploads...")
+    saved = {name: getattr(Config, name) for name in ('TFIDF_INDEX_PATH', 'SKILL_INDEX_PATH', 'VECTOR_INDEX_DIR')}
+    with tempfile.TemporaryDirectory() as directory, app.app_context():
+        db.create_all()
+        for name in saved:
+            setattr(Config, name, os.path.join(directory, name.lower()))
+        model_registry.reset()
+        model_registry._relevance_engine = StandInEngine()
+        local_storage = storage_module._backends['local'] = LocalStorage(os.path.join(directory, 'uploads'))
+        try:
+            file_uri, content_hash = local_storage.put(io.BytesIO(RESUME_BYTES), '.pdf')
+            twin = Resume(filename='twin.pdf', original_filename='resume.pdf', file_path=file_uri, file_type='pdf',
+                          content_hash=content_hash, student_name='Jane', student_email='jane@example.com',
+                          extracted_text='Python developer', parsed_data={'skills': ['Python']}, is_processed=True)
+            job = Job(title='Backend Developer', company='Acme', location='Remote', description='Python',
+                      requirements={'must_have_skills': ['Python']},
+                      match_plan={'model_name': Config.SENTENCE_TRANSFORMER_MODEL,
+                                  'model_version': model_registry.embedding_version(),
+                                  'chunk_embeddings': [[1.0, 0.0]]})
+            db.session.add_all([twin, job])
+            db.session.commit()
+
+            response = app.test_client().post('/api/resumes', data={
+                'file': (io.BytesIO(RESUME_BYTES), 'resume.pdf'),
+                'student_name': 'Jane Doe',
+                'student_email': 'jane.doe@example.com'
+            })
+            assert response.status_code == 201, response.get_json()
+            body = response.get_json()
+            assert body['duplicate_of'] == twin.id
+            resume_id = body['resume']['id']
+
+            assert resume_id in model_registry.get_skill_index().matrix('resume')[0]
+            candidates = app.test_client().get(f'/api/jobs/{job.id}/candidates?k=5').get_json()['candidates']
+            assert resume_id in [candidate['resume_id'] for candidate in candidates], candidates
+        finally:
+            storage_module._backends.pop('local', None)
+            model_registry.reset()
+            for name, value in saved.items():
+                setattr(Config, name, value)
+            db.session.remove()
+            db.drop_all()
+    print("✅ Duplicate upload indexed and searchable")
+    return True
+
+
+class StandInParser:
+    """The part of the resume parser the batch task uses; no file in these tests needs parsing"""
+
+    def parse_many(self, file_paths):
+        assert not file_paths
+        return []
+
+
+def test_worker_twins_counted_in_corpus():
+    """Resumes the workers fill from an already parsed twin count into the TF-IDF corpus"""
+    print("🧪 Testing twins picked up by the workers...")
+    saved = {name: getattr(Config, name) for name in ('TFIDF_INDEX_PATH', 'SKILL_INDEX_PATH', 'VECTOR_INDEX_DIR')}
+    with tempfile.TemporaryDirectory() as directory, app.app_context():
+        db.create_all()
+        for name in saved:
+            setattr(Config, name, os.path.join(directory, name.lower()))
+        model_registry.reset()
+        model_registry._relevance_engine = StandInEngine()
+        model_registry._resume_parser = StandInParser()
+        try:
+            resumes = [
+                Resume(filename=f'{name}.pdf', original_filename='resume.pdf', file_path=f'local://{name}.pdf',
+                       file_type='pdf', content_hash='ab' * 32, student_name=name, student_email=f'{name}@example.com')
+                for name in ('twin', 'evaluated', 'batched')
+            ]
+            twin, evaluated, batched = resumes
+            twin.extracted_text, twin.parsed_data, twin.is_processed = 'Python developer', {'skills': ['Python']}, True
+            db.session.add_all(resumes)
+            db.session.commit()
+
+            assert tasks.process_resume_evaluation(evaluated.id)['status'] != 'error'
+            result = tasks.parse_resume_batch([batched.id])
+            assert (result['parsed'], result['reused'], result['failed']) == (0, 1, []), result
+            assert evaluated.is_processed and batched.is_processed
+
+            tfidf_index = model_registry.get_tfidf_index()
+            assert tfidf_index.stats()['documents'] == 2
+            assert tfidf_index.add_documents({f"resume:{resume.id}": 'python' for resume in (evaluated, batched)}) == 0
+        finally:
+            model_registry.reset()
+            for name, value in saved.items():
+                setattr(Config, name, value)
+            db.session.remove()
+            db.drop_all()
+    print("✅ Twins counted into the corpus")
+    return True
+
+
+def test_cleanup_keeps_referenced_files():
+    """Old stored files still referenced by a resume survive the cleanup; unreferenced ones go"""
+    print("🧪 Testing cleanup of old uploads...")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory, app.app_context():
+        os.chdir(directory)
+        db.create_all()
+        try:
+            local_storage = LocalStorage(os.path.join('uploads', 'resumes'))
+            kept_uri, kept_hash = local_storage.put(io.BytesIO(b'%PDF-1.4 kept'), '.pdf')
+            dropped_uri, _ = local_storage.put(io.BytesIO(b'%PDF-1.4 dropped'), '.pdf')
+            storage_module._backends['local'] = local_storage
+            db.session.add(Resume(filename='kept.pdf', original_filename='kept.pdf', file_path=kept_uri,
+                                  file_type='pdf', content_hash=kept_hash, student_name='Jane',
+                                  student_email='jane@example.com'))
+            db.session.commit()
+
+            old = time.time() - 40 * 24 * 3600
+            for uri in (kept_uri, dropped_uri):
+                os.utime(local_storage._path(uri), (old, old))
+
+            result = tasks.cleanup_old_files()
+            assert result['status'] == 'completed' and result['cleaned_files'] == 1, result
+            assert local_storage.exists(kept_uri) and not local_storage.exists(dropped_uri)
+        finally:
+            storage_module._backends.pop('local', None)
+            db.session.remove()
+            db.drop_all()
+            os.chdir(cwd)
+    print("✅ Referenced files kept")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Uploads - Test Suite")
+    print("=" * 50)
+
+    tests = [
+        test_duplicate_upload_is_searchable, test_worker_twins_counted_in_corpus, test_cleanup_keeps_referenced_files
+    ]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
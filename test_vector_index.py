@@ -0,0 +1,122 @@
+"""
+Test script for the resume/job vector index
+Checks nearest-neighbour search, updates, and that writes from another process are seen
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from vector_index import VectorIndex, mean_embedding, plan_vector
+
+EMBEDDING_KEY = 'all-MiniLM-L6-v2@1'
+
+
+def unit(*values):
+    """Unit-length vector"""
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_mean_embedding():
+    """Chunk embeddings average into one unit vector; plans of another model give no query vector"""
+    print("🧪 Testing mean embeddings...")
+    vector = mean_embedding([[3.0, 0.0], [0.0, 0.5]])
+    assert np.allclose(vector, unit(1.0, 1.0))
+    assert mean_embedding([]) is None and mean_embedding(None) is None
+
+    plan = {'model_name': 'all-MiniLM-L6-v2', 'model_version': '1', 'chunk_embeddings': [[1.0, 0.0]]}
+    assert np.allclose(plan_vector(plan, EMBEDDING_KEY), [1.0, 0.0])
+    assert plan_vector(dict(plan, model_version='2'), EMBEDDING_KEY) is None
+    assert plan_vector(dict(plan, chunk_embeddings=None), EMBEDDING_KEY) is None
+    assert plan_vector(None, EMBEDDING_KEY) is None
+    print("✅ Mean embeddings computed")
+    return True
+
+
+def test_search_and_updates():
+    """Nearest vectors come first; upserts replace vectors and removed ones are not returned"""
+    print("🧪 Testing search...")
+    with tempfile.TemporaryDirectory() as directory:
+        index = VectorIndex(directory, 'resumes', EMBEDDING_KEY)
+        assert index.search(unit(1.0, 0.0, 0.0), 5) == []
+        index.add({'a': unit(1.0, 0.0, 0.0), 'b': unit(1.0, 1.0, 0.0), 'c': unit(0.0, 0.0, 1.0)},
+                  {'a': 1.0, 'b': 2.0, 'c': 3.0})
+
+        matches = index.search(unit(1.0, 0.2, 0.0), 5)
+        assert [record_id for record_id, _ in matches] == ['a', 'b', 'c'], matches
+        assert np.isclose(matches[0][1], float(unit(1.0, 0.2, 0.0) @ unit(1.0, 0.0, 0.0)), atol=1e-5)
+        assert [record_id for record_id, _ in index.search(unit(1.0, 0.2, 0.0), 1, exclude=['a'])] == ['b']
+
+        index.add({'c': unit(1.0, 0.1, 0.0)}, {'c': 4.0})
+        index.remove(['a'])
+        assert [record_id for record_id, _ in index.search(unit(1.0, 0.0, 0.0), 5)] == ['c', 'b']
+        assert index.stamps() == {'b': 2.0, 'c': 4.0}
+        assert index.stats()['vectors'] == 2
+    print("✅ Search returns the nearest vectors")
+    return True
+
+
+def test_models_kept_apart():
+    """Vectors of another embedding model go to another collection"""
+    print("🧪 Testing embedding keys...")
+    with tempfile.TemporaryDirectory() as directory:
+        VectorIndex(directory, 'resumes', EMBEDDING_KEY).add({'a': unit(1.0, 0.0)})
+        other = VectorIndex(directory, 'resumes', 'all-MiniLM-L6-v2@2')
+        assert other.collection_name != VectorIndex(directory, 'resumes', EMBEDDING_KEY).collection_name
+        assert other.search(unit(1.0, 0.0), 5) == []
+    print("✅ Embedding models kept apart")
+    return True
+
+
+def test_writes_from_other_processes():
+    """A reader that already loaded the index sees vectors added by another process and stops the old system"""
+    print("🧪 Testing writes from another process...")
+    with tempfile.TemporaryDirectory() as directory:
+        reader = VectorIndex(directory, 'resumes', EMBEDDING_KEY)
+        other_collection = VectorIndex(directory, 'jobs', EMBEDDING_KEY)
+        reader.add({'a': unit(1.0, 0.0)})
+        assert [record_id for record_id, _ in reader.search(unit(0.0, 1.0), 5)] == ['a']
+        assert other_collection.stats()['vectors'] == 0
+        old_system = reader._system
+
+        script = (
+            "import sys; import numpy as np; from vector_index import VectorIndex; "
+            f"VectorIndex(sys.argv[1], 'resumes', {EMBEDDING_KEY!r}).add({{'b': np.array([0.0, 1.0])}})"
+        )
+        subprocess.run([sys.executable, '-c', script, directory], check=True, capture_output=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
+        assert [record_id for record_id, _ in reader.search(unit(0.0, 1.0), 5)] == ['b', 'a']
+
+        # The old Chroma system is stopped, not left behind; an instance sharing it reopens too
+        assert reader._system is not old_system and not old_system._running
+        assert other_collection.stats()['vectors'] == 0 and other_collection._system is reader._system
+    print("✅ Other processes' writes are visible")
+    return True
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Vector Index - Test Suite")
+    print("=" * 50)
+
+    tests = [test_mean_embedding, test_search_and_updates, test_models_kept_apart, test_writes_from_other_processes]
+    passed = 0
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__} failed: {e}")
+        print()
+
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    return passed == len(tests)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,342 @@
+"""
+Text Extraction Module
+Extracts resume text from PDF and DOCX files in a process pool, splitting large PDFs by page range
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    import pymupdf as fitz  # Alternative import
+
+logger = logging.getLogger(__name__)
+
+# WordprocessingML tags read by the streaming DOCX extractor
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_BODY, _P, _R, _T, _TBL, _TR, _TC = (_W + tag for tag in ('body', 'p', 'r', 't', 'tbl', 'tr', 'tc'))
+_BR, _CR, _TAB, _PTAB, _NO_BREAK_HYPHEN = (_W + tag for tag in ('br', 'cr', 'tab', 'ptab', 'noBreakHyphen'))
+_BR_TYPE = _W + 'type'
+# Alternate content: the fallback duplicates the choice (e.g. text boxes in VML)
+_MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+
+class ExtractionTimeout(Exception):
+    """A document was not extracted within the configured timeout"""
+
+
+def file_type_of(file_path: str) -> str:
+    """Lowercased file extension"""
+    return file_path.split('.')[-1].lower()
+
+
+def pdf_page_count(file_path: str) -> int:
+    """Number of pages in a PDF"""
+    with fitz.open(file_path) as doc:
+        return doc.page_count
+
+
+def extract_pdf_head(file_path: str, stop: int) -> Tuple[int, str]:
+    """Page count of a PDF and the text of its pages before stop"""
+    with fitz.open(file_path) as doc:
+        return doc.page_count, ''.join(doc[index].get_text() for index in range(min(stop, doc.page_count)))
+
+
+def extract_pdf_pages(file_path: str, start: int, stop: int) -> str:
+    """Text of pages start..stop-1 of a PDF"""
+    with fitz.open(file_path) as doc:
+        return ''.join(doc[index].get_text() for index in range(start, min(stop, doc.page_count)))
+
+
+def extract_docx(file_path: str) -> str:
+    """Text of a DOCX file, one line per paragraph or table row"""
+    return ''.join(line + '\n' for line in iter_docx_lines(file_path))
+
+
+def iter_docx_lines(file_path: str) -> Iterator[str]:
+    """Stream the paragraphs and table rows of a DOCX, in document order.
+
+    word/document.xml is parsed incrementally straight out of the zip, and
+    finished elements are dropped, so memory stays bounded by the largest
+    paragraph or table row. Table rows come out as their cell texts joined
+    with ' | '.
+    """
+    with zipfile.ZipFile(file_path) as archive, archive.open('word/document.xml') as xml_file:
+        body = None
+        paragraphs = []  # text parts of the open paragraphs (text boxes nest paragraphs)
+        rows = []  # cell texts of the open table rows (tables nest in cells)
+        cells = []  # paragraph texts of the open table cells
+        run_depth = 0
+        fallback_depth = 0
+
+        for event, element in ET.iterparse(xml_file, events=('start', 'end')):
+            tag = element.tag
+            if tag == _MC_FALLBACK:
+                fallback_depth += 1 if event == 'start' else -1
+                continue
+            if fallback_depth:
+                continue
+
+            if event == 'start':
+                if tag == _P:
+                    paragraphs.append([])
+                elif tag == _R:
+                    run_depth += 1
+                elif tag == _TR:
+                    rows.append([])
+                elif tag == _TC:
+                    cells.append([])
+                elif tag == _BODY:
+                    body = element
+                continue
+
+            if tag == _R:
+                run_depth -= 1
+            elif run_depth and paragraphs:
+                # Same run text as python-docx: tabs and line breaks become characters
+                if tag == _T:
+                    paragraphs[-1].append(element.text or '')
+                elif tag in (_TAB, _PTAB):
+                    paragraphs[-1].append('\t')
+                elif tag == _CR or (tag == _BR and element.get(_BR_TYPE, 'textWrapping') == 'textWrapping'):
+                    paragraphs[-1].append('\n')
+                elif tag == _NO_BREAK_HYPHEN:
+                    paragraphs[-1].append('-')
+
+            if tag == _P:
+                text = ''.join(paragraphs.pop())
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+            elif tag == _TC:
+                rows[-1].append(' '.join(text for text in cells.pop() if text.strip()))
+            elif tag == _TR:
+                text = ' | '.join(cell for cell in rows.pop() if cell)
+                if cells:
+                    cells[-1].append(text)
+                elif text:
+                    yield text
+
+            if body is not None and tag in (_P, _TBL) and not paragraphs and not cells:
+                # A top-level block is done: drop it from the tree
+                body.clear()
+
+
+class _Job:
+    """One document: its extraction tasks and, when running in the pool, their futures"""
+
+    __slots__ = ('file_path', 'tasks', 'futures', 'error', 'pool_replaced', 'split_pending')
+
+    def __init__(self, file_path: str, tasks: List[Tuple[Callable, tuple]] = None,
+                 futures: list = None, error: Exception = None):
+        self.file_path = file_path
+        self.tasks = tasks or []
+        self.futures = futures
+        self.error = error
+        self.pool_replaced = False
+        # A PDF whose first future returns (page count, first pages); the other ranges follow once it is back
+        self.split_pending = False
+
+
+class TextExtractor:
+    """Extracts document text in a process pool, with a per-document page cap and timeout.
+
+    PDFs longer than pages_per_task are split into page ranges extracted by
+    different workers. A PDF is only opened in the workers: the first range
+    comes back with the page count, and the other ranges are submitted then,
+    so a file that hangs or crashes MuPDF is covered by the timeout and the
+    pool replacement. With max_workers=1, or where no pool can be started
+    (e.g. inside a daemonic process), extraction runs in-process and the
+    timeout is not enforced.
+    """
+
+    def __init__(self, max_workers: int = 0, pages_per_task: int = 10, max_pages: int = 50,
+                 timeout: float = 60.0):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pages_per_task = max(1, pages_per_task)
+        self.max_pages = max_pages
+        self.timeout = timeout
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_disabled = self.max_workers <= 1
+        self._lock = threading.RLock()
+
+    def extract(self, file_path: str) -> str:
+        """Extract the text of one document"""
+        result = next(self.extract_many([file_path]))
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def extract_many(self, file_paths: List[str]) -> Iterator[Union[str, Exception]]:
+        """Extract many documents, yielding one result per path in order.
+
+        A document that fails yields its exception. At most two documents per
+        worker are in flight, so results stream while later files are extracted.
+        """
+        file_paths = list(file_paths)
+        in_flight = deque()
+        next_index = 0
+
+        while next_index < len(file_paths) or in_flight:
+            while next_index < len(file_paths) and len(in_flight) < 2 * self.max_workers:
+                in_flight.append(self._start(file_paths[next_index]))
+                next_index += 1
+
+            # PDFs whose page count is back get their other page ranges submitted while we wait
+            for pending in in_flight:
+                if pending.split_pending and pending.futures[0].done():
+                    try:
+                        self._split(pending)
+                    except Exception:
+                        pass  # reported when the document is finished
+
+            job = in_flight.popleft()
+            result = self._finish(job)
+            if job.pool_replaced:
+                # A worker died or was stopped; the documents still in flight go to a fresh pool
+                in_flight = deque(self._start(pending.file_path) for pending in in_flight)
+            yield result
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        self._discard_pool()
+
+    def _tasks(self, file_path: str) -> List[Tuple[Callable, tuple]]:
+        """In-process extraction task of a document: the capped pages of a PDF, the whole DOCX"""
+        if file_type_of(file_path) == 'pdf':
+            return [(extract_pdf_pages, (file_path, 0, self._page_limit(file_path, pdf_page_count(file_path))))]
+        return [(extract_docx, (file_path,))]
+
+    def _page_limit(self, file_path: str, page_count: int) -> int:
+        """Number of pages to extract from a PDF"""
+        if page_count > self.max_pages:
+            logger.warning(f"{os.path.basename(file_path)} has {page_count} pages; "
+                           f"extracting the first {self.max_pages}")
+            return self.max_pages
+        return page_count
+
+    def _start(self, file_path: str) -> _Job:
+        """Submit the first task of a document to the pool, or plan it for in-process extraction"""
+        file_type = file_type_of(file_path)
+        if file_type not in ('pdf', 'docx'):
+            return _Job(file_path, error=ValueError(f"Unsupported file format: {file_type}"))
+
+        pool = self._get_pool()
+        if pool is None:
+            try:
+                return _Job(file_path, self._tasks(file_path))
+            except Exception as e:
+                return _Job(file_path, error=self._error(file_path, e))
+
+        try:
+            if file_type == 'docx':
+                return _Job(file_path, futures=[pool.submit(extract_docx, file_path)])
+            job = _Job(file_path, futures=[
+                pool.submit(extract_pdf_head, file_path, min(self.pages_per_task, self.max_pages))
+            ])
+            job.split_pending = True
+            return job
+        except Exception as e:
+            self._disable_pool(e)
+            return self._start(file_path)
+
+    def _split(self, job: _Job) -> None:
+        """Submit the page ranges of a PDF after the first, now that a worker has returned its page count"""
+        page_count = self._page_limit(job.file_path, job.futures[0].result()[0])
+        ranges = [
+            (start, min(start + self.pages_per_task, page_count))
+            for start in range(self.pages_per_task, page_count, self.pages_per_task)
+        ]
+        if ranges:
+            pool = self._get_pool()
+            for start, stop in ranges:
+                if pool is not None:
+                    job.futures.append(pool.submit(extract_pdf_pages, job.file_path, start, stop))
+                else:
+                    future = Future()
+                    future.set_result(extract_pdf_pages(job.file_path, start, stop))
+                    job.futures.append(future)
+        job.split_pending = False
+
+    def _finish(self, job: _Job) -> Union[str, Exception]:
+        """Join the page texts of a document, waiting at most the timeout for its workers"""
+        if job.error is not None:
+            return job.error
+
+        if job.futures is None:
+            try:
+                return ''.join(func(*args) for func, args in job.tasks)
+            except Exception as e:
+                return self._error(job.file_path, e)
+
+        deadline = time.monotonic() + self.timeout
+        parts = []
+        try:
+            if job.split_pending:
+                job.futures[0].result(timeout=max(0.0, deadline - time.monotonic()))
+                self._split(job)
+            for index, future in enumerate(job.futures):
+                result = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                # The first task of a PDF also returns the page count
+                parts.append(result[1] if index == 0 and file_type_of(job.file_path) == 'pdf' else result)
+        except FutureTimeoutError:
+            # A worker may be stuck on this document: replace the pool so later documents don't queue behind it
+            job.pool_replaced = True
+            self._discard_pool(terminate=True)
+            return ExtractionTimeout(
+                f"Text extraction of {os.path.basename(job.file_path)} timed out after {self.timeout}s"
+            )
+        except BrokenProcessPool as e:
+            job.pool_replaced = True
+            self._discard_pool()
+            return self._error(job.file_path, e)
+        except Exception as e:
+            return self._error(job.file_path, e)
+        return ''.join(parts)
+
+    def _error(self, file_path: str, error: Exception) -> Exception:
+        """Extraction error with the same message as the parser has always reported"""
+        file_type = 'PDF' if file_type_of(file_path) == 'pdf' else 'DOCX'
+        return Exception(f"Error extracting text from {file_type}: {str(error)}")
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """The worker pool, started on first use; None when extracting in-process"""
+        if self._pool_disabled:
+            return None
+        with self._lock:
+            if self._pool is None and not self._pool_disabled:
+                try:
+                    # spawn: forking a process that already runs threads (Celery, torch) is unsafe
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+                except Exception as e:
+                    self._disable_pool(e)
+            return self._pool
+
+    def _disable_pool(self, error: Exception) -> None:
+        """Fall back to in-process extraction for the lifetime of this extractor"""
+        logger.warning(f"Text extraction process pool unavailable ({error}); extracting in-process")
+        self._pool_disabled = True
+        self._discard_pool()
+
+    def _discard_pool(self, terminate: bool = False) -> None:
+        """Drop the current pool, stopping its busy workers when terminate; the next document starts a new one"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            processes = list((getattr(pool, '_processes', None) or {}).values()) if terminate else []
+            pool.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                process.terminate()
@@ -0,0 +1,179 @@
+"""
+TF-IDF Index Module
+Corpus-level TF-IDF weights shared by all resume/job comparisons
+"""
+
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
+
+class CorpusTfidf:
+    """Hashed term counts weighted by document frequencies over all stored resumes and jobs.
+
+    Terms are hashed, so there is no vocabulary to refit: adding documents only
+    updates the document-frequency counts, which are persisted to one .npz file.
+    Each document is counted once, keyed by a hash of its id (e.g. "resume:<id>"),
+    so edited and deleted documents are only corrected by a rebuild, run nightly.
+    """
+
+    def __init__(self, path: str, n_features: int = 2 ** 18):
+        self.path = path
+        self.n_features = n_features
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words='english',
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm=None
+        )
+
+        self.document_frequency = np.zeros(n_features, dtype=np.int32)
+        self.document_count = 0
+        self._document_keys = set()
+        self._idf = None
+        self._state_stamp = None
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._reload_if_changed()
+
+    def term_counts(self, text: str) -> Dict:
+        """Sparse hashed term counts of a text, as JSON-serializable indices and counts"""
+        counts = self.vectorizer.transform([text or ''])
+        counts.sort_indices()
+        return {
+            'indices': counts.indices.tolist(),
+            'counts': counts.data.tolist()
+        }
+
+    def similarity(self, counts_a: Dict, counts_b: Dict) -> float:
+        """Cosine similarity of two term-count vectors under the current corpus IDF"""
+        indices_a, weights_a = self._weighted(counts_a)
+        indices_b, weights_b = self._weighted(counts_b)
+        if not len(indices_a) or not len(indices_b):
+            return 0.0
+
+        _, positions_a, positions_b = np.intersect1d(indices_a, indices_b, assume_unique=True, return_indices=True)
+        return float(np.dot(weights_a[positions_a], weights_b[positions_b]))
+
+    def add_documents(self, documents: Dict[str, str]) -> int:
+        """Count new documents (id -> text) into the document frequencies; returns how many were new"""
+        with self._exclusive():
+            self._reload_if_changed()
+
+            added = 0
+            for document_id, text in documents.items():
+                added += self._count(document_id, text)
+
+            if added:
+                self._save()
+            return added
+
+    def rebuild(self, documents: Dict[str, str]) -> int:
+        """Recount the document frequencies over exactly these documents (id -> text), in one write"""
+        with self._exclusive():
+            self.document_frequency = np.zeros(self.n_features, dtype=np.int32)
+            self.document_count = 0
+            self._document_keys = set()
+            for document_id, text in documents.items():
+                self._count(document_id, text)
+            self._save()
+            return self.document_count
+
+    def stats(self) -> Dict:
+        """Size of the indexed corpus"""
+        return {
+            'documents': self.document_count,
+            'terms': int(np.count_nonzero(self.document_frequency)),
+            'path': self.path
+        }
+
+    @contextmanager
+    def _exclusive(self):
+        """Serialize writers across threads and worker processes"""
+        with self._lock, open(f"{self.path}.lock", 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _weighted(self, term_counts: Dict):
+        """L2-normalized TF-IDF weights for a term-count vector"""
+        self._reload_if_changed()
+        indices = np.asarray(term_counts.get('indices', []), dtype=np.int64)
+        if not len(indices):
+            return indices, np.zeros(0)
+
+        if self._idf is None:
+            # Smoothed IDF, as computed by sklearn's TfidfTransformer
+            self._idf = np.log((1 + self.document_count) / (1 + self.document_frequency)) + 1
+        weights = np.asarray(term_counts['counts'], dtype=np.float64) * self._idf[indices]
+        norm = np.linalg.norm(weights)
+        return indices, weights / norm if norm else weights
+
+    def _count(self, document_id: str, text: str) -> bool:
+        """Count one document into the document frequencies unless it is already counted"""
+        key = self._document_key(document_id)
+        if key in self._document_keys:
+            return False
+        counts = self.vectorizer.transform([text or ''])
+        self.document_frequency[np.unique(counts.indices)] += 1
+        self.document_count += 1
+        self._document_keys.add(key)
+        return True
+
+    @staticmethod
+    def _document_key(document_id: str) -> int:
+        """64-bit hash identifying a document"""
+        return int.from_bytes(hashlib.sha256(document_id.encode('utf-8')).digest()[:8], 'little')
+
+    def _reload_if_changed(self) -> None:
+        """Load the persisted state if another process has written a newer one"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._state_stamp:
+            return
+
+        with np.load(self.path) as state:
+            if int(state['n_features']) != self.n_features:
+                raise ValueError(f"TF-IDF index {self.path} was built with {int(state['n_features'])} features")
+            self.document_frequency = state['document_frequency'].astype(np.int32)
+            self.document_count = int(state['document_count'])
+            self._document_keys = set(state['document_keys'].tolist())
+        self._idf = None
+        self._state_stamp = stamp
+
+    def _save(self) -> None:
+        """Atomically write the state so readers never see a partial file"""
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as state_file:
+            np.savez(
+                state_file,
+                n_features=self.n_features,
+                document_frequency=self.document_frequency,
+                document_count=self.document_count,
+                document_keys=np.array(sorted(self._document_keys), dtype=np.uint64)
+            )
+        os.replace(temp_path, self.path)
+        stat = os.stat(self.path)
+        self._state_stamp = (stat.st_mtime_ns, stat.st_size)
+        self._idf = None
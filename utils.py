@@ -8,6 +8,7 @@ import uuid
 from typing import List, Dict, Any
 from werkzeug.utils import secure_filename
 import logging
+from skill_taxonomy import SKILL_TAXONOMY, TECHNICAL
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -39,28 +40,8 @@ def clean_text(text: str) -> str:
     return text.strip()
 
 def extract_skills_from_text(text: str) -> List[str]:
-    """Extract skills from text using common patterns"""
-    common_skills = [
-        'python', 'java', 'javascript', 'react', 'angular', 'vue', 'node.js',
-        'sql', 'mongodb', 'postgresql', 'mysql', 'aws', 'azure', 'docker',
-        'kubernetes', 'git', 'jenkins', 'agile', 'scrum', 'machine learning',
-        'data science', 'artificial intelligence', 'deep learning', 'tensorflow',
-        'pytorch', 'pandas', 'numpy', 'scikit-learn', 'flask', 'django',
-        'spring', 'hibernate', 'microservices', 'rest api', 'graphql',
-        'html', 'css', 'bootstrap', 'jquery', 'php', 'ruby', 'go', 'rust',
-        'c++', 'c#', 'swift', 'kotlin', 'android', 'ios', 'xamarin',
-        'tableau', 'power bi', 'excel', 'vba', 'r', 'matlab', 'sas',
-        'linux', 'windows', 'macos', 'unix', 'bash', 'powershell'
-    ]
-    
-    found_skills = []
-    text_lower = text.lower()
-    
-    for skill in common_skills:
-        if skill in text_lower:
-            found_skills.append(skill)
-    
-    return found_skills
+    """Extract technical skills from text using the skill taxonomy"""
+    return SKILL_TAXONOMY.find(text, TECHNICAL)
 
 def calculate_text_similarity(text1: str, text2: str) -> float:
     """Calculate similarity between two texts using simple word overlap"""
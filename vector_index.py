@@ -0,0 +1,208 @@
+"""
+Vector Index Module
+Persistent approximate nearest-neighbour index (Chroma, HNSW) over one embedding per resume or job
+"""
+
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process use only
+    fcntl = None
+
+# Chroma file whose changes mean another process has written to a local index
+CHROMA_DATABASE_FILE = 'chroma.sqlite3'
+
+
+def mean_embedding(embeddings) -> Optional[np.ndarray]:
+    """Unit-length mean of unit-length chunk embeddings: one vector for a whole resume or job"""
+    matrix = np.asarray(embeddings if embeddings is not None else [], dtype=np.float32)
+    if matrix.ndim != 2 or not len(matrix):
+        return None
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    mean = (matrix / norms).mean(axis=0)
+    norm = np.linalg.norm(mean)
+    return mean / norm if norm else mean
+
+
+def plan_vector(match_plan: Optional[Dict], embedding_key: str) -> Optional[np.ndarray]:
+    """Query vector of a job from its match plan, or None when the plan has no embeddings of that model"""
+    plan = match_plan or {}
+    if f"{plan.get('model_name')}@{plan.get('model_version')}" != embedding_key:
+        return None
+    return mean_embedding(plan.get('chunk_embeddings'))
+
+
+class VectorIndex:
+    """One Chroma collection of unit vectors searched by cosine similarity.
+
+    Vectors of different embedding models never share a collection: the collection
+    name carries a hash of the embedding key (model and version). With a local
+    directory, writers across processes take a file lock, and a process reopens the
+    directory when another one has written to it, since Chroma only loads the HNSW
+    graph once per process. With a host, a Chroma server is used instead.
+    """
+
+    def __init__(self, path: str, name: str, embedding_key: str, host: str = None, port: int = 8000,
+                 search_ef: int = 100):
+        self.path = path
+        self.name = name
+        self.embedding_key = embedding_key
+        self.host = host
+        self.port = port
+        self.search_ef = search_ef
+        self.collection_name = f"{name}-{hashlib.sha256(embedding_key.encode('utf-8')).hexdigest()[:16]}"
+        self._collection = None
+        self._client = None
+        self._system = None
+        self._state_stamp = None
+        self._vectors = None
+        self._lock = threading.Lock()
+        if not host:
+            os.makedirs(path, exist_ok=True)
+
+    def add(self, vectors: Dict[str, np.ndarray], stamps: Dict[str, float] = None) -> int:
+        """Insert or replace the vectors of records (id -> vector), each with its update stamp"""
+        if not vectors:
+            return 0
+        ids = list(vectors)
+        with self._exclusive():
+            self._get_collection().upsert(
+                ids=ids,
+                embeddings=[np.asarray(vectors[record_id], dtype=np.float32).tolist() for record_id in ids],
+                metadatas=[{'updated_at': float((stamps or {}).get(record_id, 0.0))} for record_id in ids]
+            )
+            self._written()
+        return len(ids)
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Delete the vectors of records"""
+        ids = list(ids)
+        if not ids:
+            return 0
+        with self._exclusive():
+            self._get_collection().delete(ids=ids)
+            self._written()
+        return len(ids)
+
+    def stamps(self) -> Dict[str, float]:
+        """Update stamp of every indexed record"""
+        records = self._get_collection().get(include=['metadatas'])
+        return {
+            record_id: float((metadata or {}).get('updated_at', 0.0))
+            for record_id, metadata in zip(records['ids'], records['metadatas'])
+        }
+
+    def vector(self, record_id: str) -> Optional[np.ndarray]:
+        """Vector of one record, or None when it is not indexed"""
+        records = self._get_collection().get(ids=[record_id], include=['embeddings'])
+        return np.asarray(records['embeddings'][0], dtype=np.float32) if records['ids'] else None
+
+    def vectors(self) -> Tuple[List[str], np.ndarray]:
+        """Ids and vectors (as rows) of every indexed record; cached until a local index changes"""
+        collection = self._get_collection()
+        if self._vectors is None or self._vectors[0] != self._state_stamp or self.host:
+            records = collection.get(include=['embeddings'])
+            matrix = np.asarray(records['embeddings'] or [], dtype=np.float32)
+            self._vectors = (self._state_stamp, records['ids'], matrix.reshape(len(records['ids']), -1))
+        return self._vectors[1], self._vectors[2]
+
+    def search(self, vector: np.ndarray, k: int, exclude: Iterable[str] = ()) -> List[Tuple[str, float]]:
+        """The k records nearest to a vector with their cosine similarities, most similar first"""
+        collection = self._get_collection()
+        exclude = set(exclude)
+        n_results = min(k + len(exclude), collection.count())
+        if k <= 0 or not n_results:
+            return []
+        result = collection.query(
+            query_embeddings=[np.asarray(vector, dtype=np.float32).tolist()],
+            n_results=n_results,
+            include=['distances']
+        )
+        matches = [
+            (record_id, 1.0 - float(distance))
+            for record_id, distance in zip(result['ids'][0], result['distances'][0])
+            if record_id not in exclude
+        ]
+        return matches[:k]
+
+    def stats(self) -> Dict:
+        """Size and location of the index"""
+        return {
+            'collection': self.collection_name,
+            'embedding_key': self.embedding_key,
+            'vectors': self._get_collection().count(),
+            'location': f"{self.host}:{self.port}" if self.host else self.path
+        }
+
+    def _get_collection(self):
+        """The collection, reopened when another process has written to the local directory"""
+        if not self.host and self._collection is not None:
+            from chromadb.api.client import SharedSystemClient
+            registered = SharedSystemClient._identifer_to_system.get(self._client._identifier)
+            # Another instance over the same directory may already have reopened it
+            if self._database_stamp() != self._state_stamp or registered is not self._system:
+                self._close()
+        if self._collection is None:
+            import chromadb
+
+            settings = chromadb.Settings(anonymized_telemetry=False)
+            if self.host:
+                client = chromadb.HttpClient(host=self.host, port=self.port, settings=settings)
+            else:
+                client = chromadb.PersistentClient(path=self.path, settings=settings)
+            self._client, self._system = client, client._system
+            self._collection = client.get_or_create_collection(
+                self.collection_name,
+                metadata={'hnsw:space': 'cosine', 'hnsw:search_ef': self.search_ef, 'embedding_key': self.embedding_key}
+            )
+            self._state_stamp = self._database_stamp()
+        return self._collection
+
+    def _close(self) -> None:
+        """Stop the Chroma system of a local directory (SQLite connection, loaded HNSW segments) and forget it"""
+        from chromadb.api.client import SharedSystemClient
+        systems = SharedSystemClient._identifer_to_system
+        if systems.get(self._client._identifier) is self._system:
+            del systems[self._client._identifier]
+            self._system.stop()
+        self._collection = self._client = self._system = None
+
+    def _written(self) -> None:
+        """Remember our own write, so it does not trigger a reopen"""
+        self._state_stamp = self._database_stamp()
+
+    def _database_stamp(self):
+        """Modification stamp of the local Chroma database"""
+        if self.host:
+            return None
+        try:
+            stat = os.stat(os.path.join(self.path, CHROMA_DATABASE_FILE))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @contextmanager
+    def _exclusive(self):
+        """Serialize writers across threads and, for a local directory, worker processes"""
+        if self.host:
+            with self._lock:
+                yield
+            return
+        with self._lock, open(os.path.join(self.path, f"{self.collection_name}.lock"), 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # Catch up with the other writers before adding to the graph
+                self._get_collection()
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)